@@ -72,6 +72,18 @@ setup(
             "xgboost>=1.7.0",
             "lightgbm>=4.0.0",
         ],
+        "database": [
+            "psycopg2-binary>=2.9.0",
+            "pgcopy>=1.5.0",
+        ],
+        "performance": [
+            "polars>=0.20.0",
+            "numba>=0.58.0",
+            "numexpr>=2.8.0",
+            "pyarrow>=12.0.0",
+            "fastjsonschema>=2.16.0",
+            "jsonschema-rs>=0.20.0",
+        ],
         "cloud": [
             "boto3>=1.28.0",
             "google-cloud-storage>=2.10.0",
@@ -4,23 +4,73 @@ Connecteur PostgreSQL avec pooling, transactions et monitoring
 """
 import psycopg2
 from psycopg2 import pool, sql
+from psycopg2.extras import execute_values
 import pandas as pd
+import io
 import logging
+import operator
+import queue
+import re
+import threading
+import time
 from contextlib import contextmanager
-from typing import Dict, List, Optional, Any, Generator
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Generator, Tuple
 import streamlit as st
 from datetime import datetime
 import json
 
+# pgcopy (optionnel): COPY au format binaire, sans parsing texte côté serveur
+try:
+    from pgcopy import CopyManager
+except ImportError:
+    CopyManager = None
+
 logger = logging.getLogger(__name__)
 
+# Colonnes gaming_jobs alimentées par les connecteurs (ordre des lignes COPY/INSERT)
+_JOB_COLS = (
+    'job_id', 'title', 'company_name', 'department', 'experience_level', 'location',
+    'salary_min', 'salary_max', 'currency', 'skills', 'description', 'posted_date', 'source'
+)
+_job_row = operator.itemgetter(*_JOB_COLS)
+
+# Dimensions texte des analytics salaires, converties en `category` après lecture
+_SALARY_DIMENSION_COLS = ('company_name', 'department', 'role', 'experience_level', 'location')
+
+# Réglages de session pour les écritures en masse (SET LOCAL: limités à la transaction,
+# réinitialisés au commit/rollback avant le retour de la connexion au pool)
+_BULK_WRITE_SETTINGS = "SET LOCAL synchronous_commit = off; SET LOCAL work_mem = '64MB'"
+
+# Requêtes personnalisées: seules les lectures SELECT sont autorisées
+_SELECT_RE = re.compile(r'^\s*SELECT\b', re.IGNORECASE)
+
+# File d'attente des événements analytics (écriture asynchrone par lots)
+ANALYTICS_QUEUE_MAXSIZE = 10000
+ANALYTICS_FLUSH_BATCH_SIZE = 500
+ANALYTICS_FLUSH_INTERVAL_S = 1.0
+
+@lru_cache(maxsize=128)
+def _is_select_query(query: str) -> bool:
+    """Vérifie (avec cache) qu'une requête est un SELECT"""
+    return _SELECT_RE.match(query) is not None
+
+
 class DatabaseConnector:
     """Connecteur base de données enterprise avec pooling et monitoring"""
     
     def __init__(self):
         self.connection_pool = None
+        self._event_queue: queue.Queue = queue.Queue(maxsize=ANALYTICS_QUEUE_MAXSIZE)
+        self._flusher_stop = threading.Event()
         self.init_connection_pool()
         
+        # Thread consommateur: les pages Streamlit ne font qu'un put_nowait
+        self._event_flusher = threading.Thread(
+            target=self._flush_events_loop, name="analytics-event-flusher", daemon=True
+        )
+        self._event_flusher.start()
+        
     def init_connection_pool(self):
         """Initialise le pool de connexions PostgreSQL"""
         try:
@@ -136,6 +186,27 @@ class DatabaseConnector:
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
             ''',
+            'mv_neurodiversity_roi': '''
+                CREATE MATERIALIZED VIEW IF NOT EXISTS mv_neurodiversity_roi AS
+                SELECT 
+                    id,
+                    company_name,
+                    department,
+                    team_size,
+                    neurodiverse_count,
+                    ROUND(neurodiverse_count::decimal / team_size * 100, 2) as neurodiversity_percentage,
+                    performance_multiplier,
+                    innovation_score,
+                    retention_rate,
+                    accommodation_budget_usd,
+                    DATE_PART('month', AGE(CURRENT_DATE, program_start_date)) as program_duration_months
+                FROM neurodiversity_metrics
+                WHERE team_size > 0;
+                CREATE UNIQUE INDEX IF NOT EXISTS mv_neurodiversity_roi_id_idx
+                    ON mv_neurodiversity_roi (id);
+                CREATE INDEX IF NOT EXISTS mv_neurodiversity_roi_perf_idx
+                    ON mv_neurodiversity_roi (performance_multiplier DESC);
+            ''',
             'analytics_events': '''
                 CREATE TABLE IF NOT EXISTS analytics_events (
                     id SERIAL PRIMARY KEY,
@@ -193,28 +264,28 @@ class DatabaseConnector:
         if not jobs_data:
             return 0
         
-        insert_sql = """
-            INSERT INTO gaming_jobs 
-            (job_id, title, company_name, department, experience_level, location,
-             salary_min, salary_max, currency, skills, description, posted_date, source)
-            VALUES (%(job_id)s, %(title)s, %(company_name)s, %(department)s, 
-                   %(experience_level)s, %(location)s, %(salary_min)s, %(salary_max)s,
-                   %(currency)s, %(skills)s, %(description)s, %(posted_date)s, %(source)s)
+        if __debug__:
+            # Les producteurs doivent fournir des listes: adaptation ARRAY directe par psycopg2
+            assert all(isinstance(job.get('skills', []), (list, tuple)) for job in jobs_data), \
+                "gaming job 'skills' must be a list or tuple"
+        
+        insert_sql = f"""
+            INSERT INTO gaming_jobs ({', '.join(_JOB_COLS)})
+            VALUES %s
             ON CONFLICT (job_id) DO NOTHING
+            RETURNING job_id
         """
         
         inserted_count = 0
         try:
+            # Paramètres positionnels: une extraction tuple en C par ligne
+            rows = [_job_row(job) for job in jobs_data]
+            
             with self.get_connection() as conn:
                 cursor = conn.cursor()
-                
-                for job in jobs_data:
-                    # Conversion skills array pour PostgreSQL
-                    if 'skills' in job and isinstance(job['skills'], list):
-                        job['skills'] = job['skills']  # PostgreSQL accepte les listes Python
-                    
-                    cursor.execute(insert_sql, job)
-                    inserted_count += cursor.rowcount
+                cursor.execute(_BULK_WRITE_SETTINGS)
+                inserted = execute_values(cursor, insert_sql, rows, fetch=True)
+                inserted_count = len(inserted)
                 
                 conn.commit()
                 logger.info(f"Inserted {inserted_count} new gaming jobs")
@@ -224,6 +295,79 @@ class DatabaseConnector:
         
         return inserted_count
     
+    def insert_gaming_jobs_copy(self, jobs_data: List[Dict]) -> int:
+        """Insert massif d'offres d'emploi via COPY dans une table de staging
+        
+        Les entiers et dates doivent déjà être des `int`/`datetime.date` natifs:
+        le COPY binaire (pgcopy) les transmet sans conversion. Sans pgcopy, on
+        retombe sur un COPY texte (CSV).
+        """
+        if not jobs_data:
+            return 0
+        
+        columns = ', '.join(_JOB_COLS)
+        rows = [tuple(job.get(col) for col in _JOB_COLS) for job in jobs_data]
+        
+        inserted_count = 0
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(_BULK_WRITE_SETTINGS)
+                cursor.execute(
+                    "CREATE TEMP TABLE IF NOT EXISTS gaming_jobs_staging "
+                    "(LIKE gaming_jobs INCLUDING DEFAULTS) ON COMMIT DROP"
+                )
+                
+                if CopyManager is not None:
+                    CopyManager(conn, 'gaming_jobs_staging', _JOB_COLS).copy(rows)
+                else:
+                    cursor.copy_expert(
+                        f"COPY gaming_jobs_staging ({columns}) FROM STDIN WITH (FORMAT csv)",
+                        self._rows_to_csv_buffer(rows)
+                    )
+                
+                cursor.execute(f"""
+                    INSERT INTO gaming_jobs ({columns})
+                    SELECT {columns} FROM gaming_jobs_staging
+                    ON CONFLICT (job_id) DO NOTHING
+                """)
+                inserted_count = cursor.rowcount
+                
+                conn.commit()
+                logger.info(f"Inserted {inserted_count} new gaming jobs (COPY)")
+                
+        except Exception as e:
+            logger.error(f"COPY job insert error: {e}")
+        
+        return inserted_count
+    
+    @staticmethod
+    def _rows_to_csv_buffer(rows: List[Tuple]) -> io.StringIO:
+        """Sérialise les lignes au format CSV accepté par COPY (fallback texte)
+        
+        COPY csv lit un champ vide non quoté comme NULL: seules les valeurs None
+        sont écrites ainsi, toutes les autres sont quotées pour que '' reste une
+        chaîne vide.
+        """
+        def pg_array(values) -> str:
+            escaped = (str(v).replace('\\', '\\\\').replace('"', '\\"') for v in values)
+            return '{' + ','.join(f'"{v}"' for v in escaped) + '}'
+        
+        def csv_field(value) -> str:
+            if value is None:
+                return ''
+            if isinstance(value, (list, tuple)):
+                value = pg_array(value)
+            return '"' + str(value).replace('"', '""') + '"'
+        
+        buffer = io.StringIO()
+        for row in rows:
+            buffer.write(','.join(csv_field(value) for value in row))
+            buffer.write('\n')
+        
+        buffer.seek(0)
+        return buffer
+    
     def get_gaming_salary_analytics(self, filters: Dict = None) -> pd.DataFrame:
         """Récupère analytics des salaires gaming avec filtres"""
         filters = filters or {}
@@ -274,27 +418,29 @@ class DatabaseConnector:
         
         try:
             with self.get_connection() as conn:
-                return pd.read_sql(base_sql, conn, params=params)
+                df = pd.read_sql(base_sql, conn, params=params)
+            
+            # Codes entiers: groupby/filtres Streamlit sans re-hachage des chaînes
+            return df.astype({col: 'category' for col in _SALARY_DIMENSION_COLS})
         except Exception as e:
             logger.error(f"Salary analytics query error: {e}")
             return pd.DataFrame()
     
     def get_neurodiversity_roi_data(self) -> pd.DataFrame:
-        """Récupère les données ROI neurodiversité"""
+        """Récupère les données ROI neurodiversité (vue matérialisée)"""
         sql = """
             SELECT 
                 company_name,
                 department,
                 team_size,
                 neurodiverse_count,
-                ROUND(neurodiverse_count::decimal / team_size * 100, 2) as neurodiversity_percentage,
+                neurodiversity_percentage,
                 performance_multiplier,
                 innovation_score,
                 retention_rate,
                 accommodation_budget_usd,
-                DATE_PART('month', AGE(CURRENT_DATE, program_start_date)) as program_duration_months
-            FROM neurodiversity_metrics
-            WHERE team_size > 0
+                program_duration_months
+            FROM mv_neurodiversity_roi
             ORDER BY performance_multiplier DESC
         """
         
@@ -305,30 +451,103 @@ class DatabaseConnector:
             logger.error(f"Neurodiversity ROI query error: {e}")
             return pd.DataFrame()
     
+    def refresh_neurodiversity_roi_view(self) -> bool:
+        """Rafraîchit la vue ROI neurodiversité (job quotidien, sans bloquer les lectures)"""
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_neurodiversity_roi")
+                conn.commit()
+                logger.info("Materialized view mv_neurodiversity_roi refreshed")
+                return True
+        except Exception as e:
+            logger.error(f"Neurodiversity ROI view refresh error: {e}")
+            return False
+    
     def log_analytics_event(self, session_id: str, user_id: str, 
                            event_type: str, event_data: Dict, page_url: str) -> bool:
-        """Enregistre un événement analytics"""
+        """Enregistre un événement analytics (mis en file, écrit en arrière-plan)"""
+        if not self.connection_pool:
+            logger.error("Analytics event logging error: database connection pool not initialized")
+            return False
+        
+        # Sérialisé ici: un événement non JSON est rejeté à l'appel, jamais dans le thread consommateur
+        try:
+            event_json = json.dumps(event_data)
+        except (TypeError, ValueError) as e:
+            logger.error(f"Analytics event '{event_type}' skipped, event data is not JSON serializable: {e}")
+            return False
+        
+        event = (session_id, user_id, event_type, event_json, page_url)
+        try:
+            self._event_queue.put_nowait(event)
+            return True
+        except queue.Full:
+            # File saturée: on retombe sur une écriture synchrone plutôt que de perdre l'événement
+            logger.warning("Analytics event queue full, writing event synchronously")
+            return self._write_analytics_events([event])
+    
+    def _write_analytics_events(self, events: List[Tuple]) -> bool:
+        """Insère un lot d'événements analytics en un seul INSERT multi-lignes
+        
+        Les événements sont des tuples dont event_data est déjà sérialisé en JSON.
+        """
         insert_sql = """
             INSERT INTO analytics_events (session_id, user_id, event_type, event_data, page_url)
-            VALUES (%(session_id)s, %(user_id)s, %(event_type)s, %(event_data)s, %(page_url)s)
+            VALUES %s
         """
         
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute(insert_sql, {
-                    'session_id': session_id,
-                    'user_id': user_id,
-                    'event_type': event_type,
-                    'event_data': json.dumps(event_data),
-                    'page_url': page_url
-                })
+                cursor.execute(_BULK_WRITE_SETTINGS)
+                execute_values(cursor, insert_sql, events, page_size=ANALYTICS_FLUSH_BATCH_SIZE)
                 conn.commit()
                 return True
         except Exception as e:
-            logger.error(f"Analytics event logging error: {e}")
+            logger.error(f"Analytics event logging error ({len(events)} events): {e}")
             return False
     
+    def _drain_event_queue(self, timeout: float) -> List[Tuple]:
+        """Récupère jusqu'à ANALYTICS_FLUSH_BATCH_SIZE événements ou attend au plus `timeout`"""
+        batch = []
+        deadline = time.monotonic() + timeout
+        
+        while len(batch) < ANALYTICS_FLUSH_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._event_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        
+        return batch
+    
+    def _flush_events_loop(self):
+        """Boucle du thread consommateur des événements analytics"""
+        while not self._flusher_stop.is_set():
+            # Un lot en échec ne doit jamais arrêter le thread (la file ne serait plus vidée)
+            try:
+                batch = self._drain_event_queue(ANALYTICS_FLUSH_INTERVAL_S)
+                if batch:
+                    self._write_analytics_events(batch)
+            except Exception as e:
+                logger.error(f"Analytics event flusher error: {e}")
+    
+    def flush_analytics_events(self) -> int:
+        """Vide immédiatement la file d'événements (appel synchrone)"""
+        batch = []
+        while True:
+            try:
+                batch.append(self._event_queue.get_nowait())
+            except queue.Empty:
+                break
+        
+        if batch and self.connection_pool:
+            self._write_analytics_events(batch)
+        return len(batch)
+    
     def get_database_health(self) -> Dict[str, Any]:
         """Retourne l'état de santé de la base de données"""
         health_queries = {
@@ -370,7 +589,7 @@ class DatabaseConnector:
     def execute_custom_query(self, query: str, params: Dict = None) -> pd.DataFrame:
         """Exécute une requête SQL personnalisée (avec précautions)"""
         # Sécurité: permettre seulement les SELECT
-        if not query.strip().upper().startswith('SELECT'):
+        if not _is_select_query(query):
             raise ValueError("Only SELECT queries are allowed")
         
         try:
@@ -382,6 +601,11 @@ class DatabaseConnector:
     
     def close_pool(self):
         """Ferme le pool de connexions"""
+        # Arrêt du consommateur puis écriture des événements restants
+        self._flusher_stop.set()
+        self._event_flusher.join(timeout=ANALYTICS_FLUSH_INTERVAL_S * 5)
+        self.flush_analytics_events()
+        
         if self.connection_pool:
             self.connection_pool.closeall()
             logger.info("Database connection pool closed")
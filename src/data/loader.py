@@ -1,50 +1,113 @@
 """
 Gaming Workforce Observatory - Data Loader
 """
+import os
+from functools import lru_cache
+
+import numpy as np
 import pandas as pd
-import streamlit as st
 from typing import Optional, Dict, Any
 
+# Polars (optionnel): moteur columnar multi-thread pour les grosses agrégations
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+SAMPLE_DATA_PARQUET = 'data/sample_data.parquet'
+SAMPLE_DATA_CSV = 'data/sample_data.csv'
+
+# Données de repli (types explicites, construites une fois à l'import)
+_FALLBACK_SAMPLE_DATA = pd.DataFrame({
+    'employee_id': np.array([1, 2, 3], dtype=np.int64),
+    'name': np.array(['Alice', 'Bob', 'Carol'], dtype=object),
+    'department': np.array(['Programming', 'Art', 'QA'], dtype=object),
+    'level': np.array(['Senior', 'Mid', 'Senior'], dtype=object),
+    'salary': np.array([95000, 65000, 82000], dtype=np.int64),
+    'satisfaction_score': np.array([8.2, 9.1, 6.5], dtype=np.float64),
+    'performance_score': np.array([4.5, 4.2, 3.8], dtype=np.float64),
+    'years_experience': np.array([6, 4, 7], dtype=np.int64),
+    'sprint_velocity': np.array([42, 0, 0], dtype=np.int64),
+    'bug_fix_rate': np.array([0, 0, 92], dtype=np.int64),
+    'innovation_index': np.array([85, 78, 65], dtype=np.int64),
+    'burnout_risk': np.array([0.2, 0.1, 0.6], dtype=np.float64)
+})
+
+
+@lru_cache(maxsize=1)
+def _synthetic_performance_data() -> pd.DataFrame:
+    """Données de performance synthétiques, générées une seule fois"""
+    return pd.DataFrame({
+        'employee_id': range(1, 101),
+        'performance_score': np.random.uniform(3.0, 5.0, 100),
+        'department': np.random.choice(['Programming', 'Art', 'QA'], 100)
+    })
+
+
+_VALID_DEPARTMENTS = frozenset(('Programming', 'Art', 'Game Design', 'QA', 'Marketing', 'Management'))
+
+# En dessous de ce volume, la conversion pandas -> Polars coûte plus qu'elle ne rapporte
+POLARS_MIN_ROWS = 100_000
+
+_GAMING_METRICS_RENAMES = {
+    'satisfaction_score': 'avg_satisfaction',
+    'performance_score': 'avg_performance',
+    'salary': 'avg_salary',
+    'employee_id': 'employee_count',
+    'sprint_velocity': 'avg_sprint_velocity',
+    'bug_fix_rate': 'avg_bug_fix_rate'
+}
+
+
+@lru_cache(maxsize=8)
+def _read_data_file(path: str, mtime_ns: int) -> pd.DataFrame:
+    """Lecture mise en cache par (chemin, mtime): un fichier modifié invalide l'entrée"""
+    if path.endswith('.parquet'):
+        return pd.read_parquet(path)
+    return pd.read_csv(path)
+
+
+def _load_data_file(path: str) -> pd.DataFrame:
+    """Charge un fichier de données via le cache (copie: l'appelant peut la modifier)"""
+    return _read_data_file(path, os.stat(path).st_mtime_ns).copy()
+
+
 class DataLoader:
     """Chargeur de données gaming"""
     
     def __init__(self):
         pass
     
-    @st.cache_resource(ttl=300)
-    def load_sample_data(_self) -> pd.DataFrame:
+    def load_sample_data(self) -> pd.DataFrame:
         """Charge les données d'exemple gaming"""
         try:
-            return pd.read_csv('data/sample_data.csv')
+            # Parquet (columnar, Snappy): pas de tokenisation ni d'inférence de types
+            return _load_data_file(SAMPLE_DATA_PARQUET)
+        except (FileNotFoundError, ImportError):
+            pass
+        
+        try:
+            return _load_data_file(SAMPLE_DATA_CSV)
         except FileNotFoundError:
             # Données par défaut si fichier manquant
-            return pd.DataFrame({
-                'employee_id': [1, 2, 3],
-                'name': ['Alice', 'Bob', 'Carol'],
-                'department': ['Programming', 'Art', 'QA'],
-                'level': ['Senior', 'Mid', 'Senior'],
-                'salary': [95000, 65000, 82000],
-                'satisfaction_score': [8.2, 9.1, 6.5],
-                'performance_score': [4.5, 4.2, 3.8],
-                'years_experience': [6, 4, 7],
-                'sprint_velocity': [42, 0, 0],
-                'bug_fix_rate': [0, 0, 92],
-                'innovation_index': [85, 78, 65],
-                'burnout_risk': [0.2, 0.1, 0.6]
-            })
+            return _FALLBACK_SAMPLE_DATA.copy()
     
     def _clean_gaming_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Nettoie les données gaming"""
         # Nettoie les scores de satisfaction (1-10)
-        df.loc[df['satisfaction_score'] > 10, 'satisfaction_score'] = 10
-        df.loc[df['satisfaction_score'] < 1, 'satisfaction_score'] = 1
+        df['satisfaction_score'] = df['satisfaction_score'].clip(1, 10)
         
-        # Nettoie les salaires (positifs)
-        df.loc[df['salary'] < 0, 'salary'] = df['salary'].median()
+        # Nettoie les salaires (positifs): médiane calculée seulement si nécessaire
+        negative_salary = df['salary'] < 0
+        if negative_salary.any():
+            df['salary'] = df['salary'].mask(negative_salary, df['salary'].median())
         
-        # Filtre les départements valides
-        valid_departments = ['Programming', 'Art', 'Game Design', 'QA', 'Marketing', 'Management']
-        df = df[df['department'].isin(valid_departments)]
+        # Filtre les départements valides (isin sur les codes de catégorie)
+        departments = df['department'].astype('category')
+        valid_mask = departments.isin(_VALID_DEPARTMENTS)
+        df = df[valid_mask].assign(
+            department=departments[valid_mask].cat.remove_unused_categories()
+        )
         
         return df
     
@@ -66,7 +129,7 @@ class DataLoader:
     
     def analyze_by_gaming_level(self, df: pd.DataFrame) -> pd.DataFrame:
         """Analyse par niveau gaming"""
-        return df.groupby('level').agg({
+        return df.groupby('level', observed=True).agg({
             'salary': 'mean',
             'satisfaction_score': 'mean',
             'performance_score': 'mean'
@@ -78,6 +141,9 @@ class DataLoader:
     
     def aggregate_gaming_metrics(self, df: pd.DataFrame, group_by: str = 'department') -> pd.DataFrame:
         """Agrégation des métriques gaming"""
+        if pl is not None and len(df) >= POLARS_MIN_ROWS:
+            return self._aggregate_gaming_metrics_polars(df, group_by)
+        
         base_agg = {
             'satisfaction_score': 'mean',
             'performance_score': 'mean', 
@@ -85,25 +151,45 @@ class DataLoader:
             'employee_id': 'count'
         }
         
-        # Ajouter métriques spécifiques si disponibles
-        if 'sprint_velocity' in df.columns:
-            base_agg['sprint_velocity'] = lambda x: x[x > 0].mean() if (x > 0).any() else 0
+        # Métriques spécifiques: moyenne des seules valeurs positives (0 = non applicable).
+        # Les zéros sont masqués en NaN pour rester sur le 'mean' natif de pandas.
+        positive_only_cols = [col for col in ('sprint_velocity', 'bug_fix_rate') if col in df.columns]
+        if positive_only_cols:
+            df = df.assign(**{col: df[col].where(df[col] > 0) for col in positive_only_cols})
+            base_agg.update(dict.fromkeys(positive_only_cols, 'mean'))
         
-        if 'bug_fix_rate' in df.columns:
-            base_agg['bug_fix_rate'] = lambda x: x[x > 0].mean() if (x > 0).any() else 0
-        
-        result = df.groupby(group_by).agg(base_agg)
-        result = result.rename(columns={
-            'satisfaction_score': 'avg_satisfaction',
-            'performance_score': 'avg_performance',
-            'salary': 'avg_salary',
-            'employee_id': 'employee_count',
-            'sprint_velocity': 'avg_sprint_velocity',
-            'bug_fix_rate': 'avg_bug_fix_rate'
-        })
+        result = df.groupby(group_by, observed=True).agg(base_agg)
+        # Groupes sans aucune valeur positive -> 0, comme auparavant
+        result[positive_only_cols] = result[positive_only_cols].fillna(0)
+        result = result.rename(columns=_GAMING_METRICS_RENAMES)
         
         return result
     
+    def _aggregate_gaming_metrics_polars(self, df: pd.DataFrame, group_by: str) -> pd.DataFrame:
+        """Même agrégation que aggregate_gaming_metrics, exécutée en LazyFrame Polars"""
+        aggregations = [
+            pl.col('satisfaction_score').mean(),
+            pl.col('performance_score').mean(),
+            pl.col('salary').mean(),
+            pl.col('employee_id').count().cast(pl.Int64)
+        ]
+        for col in ('sprint_velocity', 'bug_fix_rate'):
+            if col in df.columns:
+                aggregations.append(pl.col(col).filter(pl.col(col) > 0).mean().fill_null(0))
+        
+        result = (
+            pl.from_pandas(df[[group_by] + [agg.meta.output_name() for agg in aggregations]])
+            .lazy()
+            .group_by(group_by)
+            .agg(aggregations)
+            .sort(group_by)
+            .collect()
+            .to_pandas()
+            .set_index(group_by)
+        )
+        
+        return result.rename(columns=_GAMING_METRICS_RENAMES)
+    
     def validate_gaming_schema(self, df: pd.DataFrame) -> None:
         """Valide le schéma gaming"""
         required_columns = ['employee_id', 'name', 'department', 'level', 
@@ -121,18 +207,20 @@ class DataLoader:
             'avg_performance': float(df['performance_score'].mean())
         }
         
-        # Métriques conditionnelles
-        prog_data = df[df['department'] == 'Programming']
-        if len(prog_data) > 0 and 'sprint_velocity' in df.columns:
-            velocity_data = prog_data[prog_data['sprint_velocity'] > 0]
-            if len(velocity_data) > 0:
-                metrics['programming_velocity'] = float(velocity_data['sprint_velocity'].mean())
-        
-        qa_data = df[df['department'] == 'QA']
-        if len(qa_data) > 0 and 'bug_fix_rate' in df.columns:
-            bug_data = qa_data[qa_data['bug_fix_rate'] > 0]
-            if len(bug_data) > 0:
-                metrics['qa_bug_fix_rate'] = float(bug_data['bug_fix_rate'].mean())
+        # Métriques conditionnelles: un seul groupby département, zéros masqués
+        department_metrics = {
+            'sprint_velocity': ('Programming', 'programming_velocity'),
+            'bug_fix_rate': ('QA', 'qa_bug_fix_rate')
+        }
+        positive_cols = [col for col in department_metrics if col in df.columns]
+        if positive_cols:
+            positive_values = df[positive_cols].where(df[positive_cols] > 0)
+            dept_means = positive_values.groupby(df['department'], observed=True).mean()
+            
+            for col in positive_cols:
+                department, metric_name = department_metrics[col]
+                if department in dept_means.index and pd.notna(dept_means.at[department, col]):
+                    metrics[metric_name] = float(dept_means.at[department, col])
         
         if 'innovation_index' in df.columns:
             metrics['innovation_index'] = float(df['innovation_index'].mean())
@@ -165,37 +253,8 @@ def load_performance_data():
         return data[['employee_id', 'performance_score', 'department']]
     else:
         # Données par défaut si colonnes manquantes
-        import pandas as pd
-        import numpy as np
-        return pd.DataFrame({
-            'employee_id': range(1, 101),
-            'performance_score': np.random.uniform(3.0, 5.0, 100),
-            'department': np.random.choice(['Programming', 'Art', 'QA'], 100)
-        })
-# Ajoutez à la fin du fichier
-def initialize_data_cache():
-    """Initialise le cache des données"""
-    return True
+        return _synthetic_performance_data().copy()
+
 def initialize_data_cache():
     """Initialise le cache des données"""
     return True
-
-def load_employee_data():
-    """Charge les données employés gaming"""
-    loader = DataLoader()
-    return loader.load_sample_data()
-
-def load_monthly_metrics():
-    """Charge les métriques mensuelles gaming"""
-    import pandas as pd
-    return pd.DataFrame({
-        'month': pd.date_range('2023-01', periods=12, freq='ME'),
-        'satisfaction': [7.2, 7.5, 7.8, 8.1, 7.9, 8.0, 7.7, 7.4, 7.6, 7.8, 8.2, 8.0]
-    })
-
-def load_performance_data():
-    """Charge les données de performance gaming"""
-    loader = DataLoader()
-    data = loader.load_sample_data()
-    return data[['employee_id', 'performance_score', 'department']]
-
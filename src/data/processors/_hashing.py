@@ -0,0 +1,28 @@
+"""
+Gaming Workforce Observatory - Processor Hashing
+Empreintes de contenu des DataFrames partagées par les caches des processeurs
+"""
+import hashlib
+from typing import Tuple
+
+import pandas as pd
+
+
+def df_fingerprint(df: pd.DataFrame) -> Tuple[int, Tuple[str, ...], Tuple[str, ...], str]:
+    """Empreinte de cache: taille, colonnes, dtypes et digest des hash de lignes (ordre inclus)
+    
+    Exacte (toutes les lignes sont hashées): réservée aux caches en mémoire des processeurs.
+    Les dtypes font partie de la clé, les hash de lignes ne distinguant pas par exemple
+    une colonne object de sa version category.
+    """
+    try:
+        row_hashes = pd.util.hash_pandas_object(df)
+    except TypeError:
+        # Colonnes non hashables (listes, dicts): repli sur leur représentation texte
+        row_hashes = pd.util.hash_pandas_object(df.astype(str))
+    return (
+        len(df),
+        tuple(map(str, df.columns)),
+        tuple(map(str, df.dtypes)),
+        hashlib.blake2b(row_hashes.to_numpy().tobytes()).hexdigest()
+    )
@@ -8,8 +8,90 @@ from typing import Dict, List, Any, Optional
 import streamlit as st
 import logging
 
+# Numba (optionnel): noyau ROI compilé en une seule passe
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# numexpr (optionnel): expressions élémentaires fusionnées, sans temporaires
+try:
+    import numexpr
+    NUMEXPR_AVAILABLE = True
+except ImportError:
+    NUMEXPR_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Valeur de productivité baseline (salaire moyen gaming)
+BASELINE_PRODUCTIVITY_VALUE = 95000.0
+
+# En dessous de ce volume, le noyau compilé (warm-up JIT) ne bat pas NumPy
+ROI_KERNEL_MIN_ROWS = 10_000
+
+# Niveaux fixes de condition_type (l'ordre définit condition_encoded)
+CONDITION_CATEGORIES = ['Unknown', 'ADHD', 'Autism Spectrum', 'Dyslexia', 'Dyspraxia', 'Other']
+
+# Colonnes numériques stockées en float32 après nettoyage
+NEURODIVERSITY_FLOAT_COLUMNS = ('performance_impact', 'satisfaction_with_support', 'support_cost_annual')
+
+
+def _condition_counts(conditions: pd.Series) -> Dict[str, int]:
+    """Effectifs par condition, sans les catégories absentes"""
+    return _nonzero_counts(conditions.value_counts())
+
+
+def _nonzero_counts(counts: pd.Series) -> Dict[str, int]:
+    """Effectifs non nuls, du plus fréquent au moins fréquent"""
+    return counts[counts > 0].sort_values(ascending=False, kind='stable').to_dict()
+
+
+def _roi_numpy(performance_impact: np.ndarray, support_cost: np.ndarray,
+               baseline: float) -> np.ndarray:
+    """ROI individuel vectorisé NumPy (fallback sans Numba ni numexpr)"""
+    value_created = baseline * (performance_impact - 1)
+    has_cost = support_cost > 0
+    return np.select(
+        [has_cost, value_created > 0],
+        [(value_created - support_cost) / np.where(has_cost, support_cost, 1) * 100, 100.0],
+        default=0.0
+    )
+
+
+def _roi_numexpr(performance_impact: np.ndarray, support_cost: np.ndarray,
+                 baseline: float) -> np.ndarray:
+    """ROI individuel en une seule expression numexpr (fallback sans Numba)"""
+    return numexpr.evaluate(
+        "where(support_cost > 0,"
+        " (baseline * (performance_impact - 1) - support_cost) / support_cost * 100,"
+        " where(baseline * (performance_impact - 1) > 0, 100.0, 0.0))",
+        local_dict={
+            'performance_impact': performance_impact,
+            'support_cost': support_cost,
+            'baseline': baseline
+        }
+    )
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _roi_kernel(performance_impact, support_cost, baseline):
+        """ROI individuel: boucle fusionnée, sans tableaux intermédiaires"""
+        n = performance_impact.shape[0]
+        out = np.empty(n)
+        for i in prange(n):
+            value_created = baseline * (performance_impact[i] - 1.0)
+            if support_cost[i] > 0:
+                out[i] = (value_created - support_cost[i]) / support_cost[i] * 100
+            else:
+                out[i] = 100.0 if value_created > 0 else 0.0
+        return out
+elif NUMEXPR_AVAILABLE:
+    _roi_kernel = _roi_numexpr
+else:
+    _roi_kernel = _roi_numpy
+
 class NeurodiversityProcessor:
     """Processeur enterprise pour données neurodiversité gaming"""
     
@@ -36,6 +118,12 @@ class NeurodiversityProcessor:
                 'accommodation_cost': 1800
             }
         }
+        
+        # Table de correspondance condition -> multiplicateur (lookup hashtable côté pandas)
+        self._mult_map = pd.Series({
+            condition: mapping['productivity_multiplier']
+            for condition, mapping in self.condition_mappings.items()
+        })
     
     @st.cache_data(ttl=3600)
     def process_neurodiversity_data(_self, raw_df: pd.DataFrame) -> pd.DataFrame:
@@ -44,7 +132,9 @@ class NeurodiversityProcessor:
         if raw_df.empty:
             return pd.DataFrame()
         
-        df = raw_df.copy()
+        # Copie superficielle: chaque colonne nettoyée ou ajoutée remplace son bloc
+        # sans écrire dans raw_df, les colonnes non modifiées restent partagées
+        df = raw_df.copy(deep=False)
         
         # Nettoyage des données
         df = _self._clean_neurodiversity_data(df)
@@ -61,51 +151,66 @@ class NeurodiversityProcessor:
     def _clean_neurodiversity_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Nettoie les données neurodiversité"""
         
-        # Valeurs par défaut
-        df.fillna({
+        # Valeurs par défaut (par colonne, jamais en place sur les blocs partagés)
+        defaults = {
             'condition_type': 'Unknown',
-            'accommodations_provided': [],
             'performance_impact': 1.0,
             'satisfaction_with_support': 7.0,
             'support_cost_annual': 0
-        }, inplace=True)
+        }
+        for col, default in defaults.items():
+            if col in df.columns:
+                df[col] = df[col].fillna(default)
         
-        # Normalisation des types de conditions
+        # Normalisation des types de conditions (valeurs non reconnues -> 'Other')
         condition_standardization = {
+            'unknown': 'Unknown',
             'adhd': 'ADHD',
             'autism': 'Autism Spectrum',
+            'autism spectrum': 'Autism Spectrum',
             'asperger': 'Autism Spectrum',
+            'dyslexia': 'Dyslexia',
             'dyslexic': 'Dyslexia',
+            'dyspraxia': 'Dyspraxia',
             'dyspraxic': 'Dyspraxia'
         }
         
-        df['condition_type'] = df['condition_type'].str.lower().replace(condition_standardization)
-        df['condition_type'] = df['condition_type'].str.title()
+        df['condition_type'] = pd.Categorical(
+            df['condition_type'].str.strip().str.lower().map(condition_standardization).fillna('Other'),
+            categories=CONDITION_CATEGORIES
+        )
         
         # Validation des scores
         df['performance_impact'] = df['performance_impact'].clip(0.5, 2.0)
         df['satisfaction_with_support'] = df['satisfaction_with_support'].clip(1, 10)
         
+        # float32: moitié moins d'octets lus par les agrégations suivantes
+        for col in NEURODIVERSITY_FLOAT_COLUMNS:
+            if col in df.columns:
+                df[col] = df[col].astype(np.float32)
+        
         return df
     
     def _enrich_with_metrics(self, df: pd.DataFrame) -> pd.DataFrame:
         """Enrichit avec des métriques calculées"""
         
-        # Encodage des conditions
-        condition_mapping = {condition: i+1 for i, condition in enumerate(self.condition_mappings.keys())}
-        condition_mapping['Unknown'] = 0
-        condition_mapping['Other'] = len(condition_mapping)
+        # Encodage des conditions: codes de la catégorie (ordre de CONDITION_CATEGORIES)
+        df['condition_encoded'] = df['condition_type'].cat.codes.astype(np.int8)
         
-        df['condition_encoded'] = df['condition_type'].map(condition_mapping).fillna(0)
-        
-        # Score d'accommodation
-        df['accommodation_score'] = df['accommodations_provided'].apply(
-            lambda x: len(x) if isinstance(x, list) else 0
-        )
+        # Score d'accommodation: nombre d'éléments des seules listes (.str.len() compterait
+        # aussi les caractères des chaînes); autres valeurs et manquants -> 0
+        accommodations = df['accommodations_provided']
+        if pd.api.types.is_object_dtype(accommodations):
+            df['accommodation_score'] = (
+                accommodations.str.len().where(accommodations.map(type).eq(list), 0)
+                .fillna(0).astype(np.int32)
+            )
+        else:
+            df['accommodation_score'] = np.int32(0)
         
         # Multiplicateur de performance théorique
-        df['theoretical_multiplier'] = df['condition_type'].map(
-            lambda x: self.condition_mappings.get(x, {}).get('productivity_multiplier', 1.0)
+        df['theoretical_multiplier'] = (
+            df['condition_type'].map(self._mult_map).astype(np.float64).fillna(1.0)
         )
         
         # Écart performance réelle vs théorique
@@ -121,68 +226,81 @@ class NeurodiversityProcessor:
     def _calculate_individual_roi(self, df: pd.DataFrame) -> pd.DataFrame:
         """Calcule le ROI individuel pour chaque employé neurodivergent"""
         
-        # Valeur de productivité baseline (salaire moyen gaming)
-        baseline_productivity_value = 95000
+        performance_impact = df['performance_impact'].to_numpy(dtype=np.float64)
+        support_cost = df['support_cost_annual'].fillna(0).to_numpy(dtype=np.float64)
         
         # Calcul valeur créée
-        df['productivity_value_created'] = (
-            baseline_productivity_value * (df['performance_impact'] - 1)
-        )
+        df['productivity_value_created'] = BASELINE_PRODUCTIVITY_VALUE * (performance_impact - 1)
         
         # Calcul coût total support
-        df['total_support_cost'] = df['support_cost_annual'].fillna(0)
+        df['total_support_cost'] = support_cost
         
         # ROI individuel
-        df['individual_roi'] = np.where(
-            df['total_support_cost'] > 0,
-            (df['productivity_value_created'] - df['total_support_cost']) / df['total_support_cost'] * 100,
-            np.where(df['productivity_value_created'] > 0, 100, 0)
+        roi_function = _roi_kernel if len(df) >= ROI_KERNEL_MIN_ROWS else _roi_numpy
+        df['individual_roi'] = roi_function(
+            performance_impact, support_cost, BASELINE_PRODUCTIVITY_VALUE
         )
         
         return df
     
-    def analyze_department_neurodiversity(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def analyze_department_neurodiversity(self, df: pd.DataFrame,
+                                          cache: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Analyse neurodiversité par département"""
         
         if 'department' not in df.columns:
             return {}
         
-        dept_analysis = {}
+        cache = cache if cache is not None else self._compute_cache(df)
+        
+        # Une seule passe groupby pour toutes les statistiques départementales
+        dept_stats = (
+            df[['department', 'performance_impact', 'satisfaction_with_support', 'individual_roi']]
+            .assign(is_neurodiverse=cache['neurodiverse_mask'])
+            .groupby('department', sort=False)
+            .agg(
+                total_employees=('performance_impact', 'size'),
+                neurodiverse_count=('is_neurodiverse', 'sum'),
+                avg_performance_impact=('performance_impact', 'mean'),
+                avg_satisfaction=('satisfaction_with_support', 'mean'),
+                total_roi=('individual_roi', 'sum'),
+                avg_roi_per_employee=('individual_roi', 'mean')
+            )
+        )
+        # Répartition des conditions de tous les départements en un seul cross-tab
+        conditions_by_dept = pd.crosstab(df['department'], df['condition_type'])
         
-        for dept in df['department'].unique():
-            dept_data = df[df['department'] == dept]
-            
-            if len(dept_data) == 0:
-                continue
-            
-            # Statistiques de base
-            total_employees = len(dept_data)
-            neurodiverse_count = len(dept_data[dept_data['condition_type'] != 'Unknown'])
+        dept_analysis = {}
+        for dept, stats in dept_stats.iterrows():
+            total_employees = int(stats['total_employees'])
+            neurodiverse_count = int(stats['neurodiverse_count'])
             
             dept_analysis[dept] = {
                 'total_employees': total_employees,
                 'neurodiverse_count': neurodiverse_count,
-                'neurodiversity_percentage': (neurodiverse_count / total_employees * 100) if total_employees > 0 else 0,
-                'avg_performance_impact': dept_data['performance_impact'].mean(),
-                'avg_satisfaction': dept_data['satisfaction_with_support'].mean(),
-                'total_roi': dept_data['individual_roi'].sum(),
-                'avg_roi_per_employee': dept_data['individual_roi'].mean(),
-                'conditions_breakdown': dept_data['condition_type'].value_counts().to_dict()
+                'neurodiversity_percentage': neurodiverse_count / total_employees * 100,
+                'avg_performance_impact': stats['avg_performance_impact'],
+                'avg_satisfaction': stats['avg_satisfaction'],
+                'total_roi': stats['total_roi'],
+                'avg_roi_per_employee': stats['avg_roi_per_employee'],
+                'conditions_breakdown': _nonzero_counts(conditions_by_dept.loc[dept])
             }
         
         return dept_analysis
     
-    def calculate_organization_roi(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def calculate_organization_roi(self, df: pd.DataFrame,
+                                   cache: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Calcule le ROI organisationnel global"""
         
+        cache = cache if cache is not None else self._compute_cache(df)
+        
         org_roi = {
-            'total_neurodiverse_employees': len(df[df['condition_type'] != 'Unknown']),
+            'total_neurodiverse_employees': int(cache['neurodiverse_mask'].sum()),
             'total_productivity_value': df['productivity_value_created'].sum(),
             'total_support_costs': df['total_support_cost'].sum(),
             'net_benefit': df['productivity_value_created'].sum() - df['total_support_cost'].sum(),
             'overall_roi_percentage': 0,
             'average_individual_roi': df['individual_roi'].mean(),
-            'conditions_distribution': df['condition_type'].value_counts().to_dict(),
+            'conditions_distribution': cache['condition_counts'],
             'high_performing_percentage': 0
         }
         
@@ -192,49 +310,53 @@ class NeurodiversityProcessor:
                 org_roi['net_benefit'] / org_roi['total_support_costs'] * 100
             )
         
-        # Pourcentage haute performance
-        high_performers = df[df['performance_impact'] > 1.2]
+        # Pourcentage haute performance (réduction booléenne, sans copie du DataFrame)
         org_roi['high_performing_percentage'] = (
-            len(high_performers) / len(df) * 100 if len(df) > 0 else 0
+            df['performance_impact'].gt(1.2).mean() * 100 if len(df) > 0 else 0
         )
         
         return org_roi
     
-    def generate_recommendations(self, df: pd.DataFrame) -> List[Dict[str, str]]:
+    def generate_recommendations(self, df: pd.DataFrame,
+                                 cache: Optional[Dict[str, Any]] = None) -> List[Dict[str, str]]:
         """Génère des recommandations basées sur l'analyse"""
         
+        cache = cache if cache is not None else self._compute_cache(df)
+        
         recommendations = []
         
         # Analyse des employés sous-performants
-        underperforming = df[df['performance_impact'] < 0.9]
-        if len(underperforming) > 0:
+        underperforming_count = int((df['performance_impact'] < 0.9).sum())
+        if underperforming_count > 0:
             recommendations.append({
                 'category': 'Support Enhancement',
                 'priority': 'High',
                 'title': 'Améliorer support employés sous-performants',
-                'description': f'{len(underperforming)} employés neurodivergents sous-performent. Réviser accommodations.',
+                'description': f'{underperforming_count} employés neurodivergents sous-performent. Réviser accommodations.',
                 'action': 'Audit des accommodations et formation managers'
             })
         
         # Analyse satisfaction faible
-        low_satisfaction = df[df['satisfaction_with_support'] < 6]
-        if len(low_satisfaction) > 0:
+        low_satisfaction_count = int((df['satisfaction_with_support'] < 6).sum())
+        if low_satisfaction_count > 0:
             recommendations.append({
                 'category': 'Employee Experience',
                 'priority': 'Medium',
                 'title': 'Améliorer satisfaction support',
-                'description': f'{len(low_satisfaction)} employés peu satisfaits du support reçu.',
+                'description': f'{low_satisfaction_count} employés peu satisfaits du support reçu.',
                 'action': 'Sondage détaillé et amélioration processus'
             })
         
         # Conditions sans accommodation
-        no_accommodation = df[(df['condition_type'] != 'Unknown') & (df['accommodation_score'] == 0)]
-        if len(no_accommodation) > 0:
+        no_accommodation_count = int(
+            (cache['neurodiverse_mask'] & (df['accommodation_score'] == 0)).sum()
+        )
+        if no_accommodation_count > 0:
             recommendations.append({
                 'category': 'Accommodation Gap',
                 'priority': 'High',
                 'title': 'Combler lacunes accommodations',
-                'description': f'{len(no_accommodation)} employés neurodivergents sans accommodations.',
+                'description': f'{no_accommodation_count} employés neurodivergents sans accommodations.',
                 'action': 'Évaluation besoins et mise en place accommodations'
             })
         
@@ -243,17 +365,20 @@ class NeurodiversityProcessor:
     def export_neurodiversity_report(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Exporte un rapport complet neurodiversité"""
         
+        # Agrégats partagés par les sections du rapport, calculés une seule fois
+        cache = self._compute_cache(df)
+        
         report = {
             'summary': {
                 'total_records': len(df),
                 'generation_date': pd.Timestamp.now().isoformat(),
                 'data_quality_score': self._calculate_data_quality_score(df)
             },
-            'department_analysis': self.analyze_department_neurodiversity(df),
-            'organization_roi': self.calculate_organization_roi(df),
-            'recommendations': self.generate_recommendations(df),
+            'department_analysis': self.analyze_department_neurodiversity(df, cache=cache),
+            'organization_roi': self.calculate_organization_roi(df, cache=cache),
+            'recommendations': self.generate_recommendations(df, cache=cache),
             'detailed_metrics': {
-                'condition_breakdown': df['condition_type'].value_counts().to_dict(),
+                'condition_breakdown': cache['condition_counts'],
                 'performance_distribution': df['performance_impact'].describe().to_dict(),
                 'roi_distribution': df['individual_roi'].describe().to_dict(),
                 'satisfaction_scores': df['satisfaction_with_support'].describe().to_dict()
@@ -262,6 +387,13 @@ class NeurodiversityProcessor:
         
         return report
     
+    def _compute_cache(self, df: pd.DataFrame) -> Dict[str, Any]:
+        """Précalcule les agrégats de conditions réutilisés par les analyses"""
+        return {
+            'condition_counts': _condition_counts(df['condition_type']),
+            'neurodiverse_mask': df['condition_type'] != 'Unknown'
+        }
+    
     def _calculate_data_quality_score(self, df: pd.DataFrame) -> float:
         """Calcule un score de qualité des données"""
         
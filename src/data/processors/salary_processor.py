@@ -4,21 +4,190 @@ Traitement et analyse avancée des données de salaires gaming
 """
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, TextIO, Tuple
 import logging
+import re
 from datetime import datetime, timedelta
-from sklearn.preprocessing import StandardScaler
 from sklearn.ensemble import IsolationForest
 import streamlit as st
 
+from ._hashing import df_fingerprint
+
+# Numba (optionnel): colonnes dérivées calculées en une seule boucle compilée
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# pyarrow (optionnel): colonnes texte stockées en buffers UTF-8 contigus (string[pyarrow])
+try:
+    import pyarrow  # noqa: F401
+    ARROW_STRINGS_AVAILABLE = True
+except ImportError:
+    ARROW_STRINGS_AVAILABLE = False
+
+# Polars (optionnel): pipeline paresseux collecté en une seule passe
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
 logger = logging.getLogger(__name__)
 
+# En dessous de ce volume, le noyau compilé (warm-up JIT) ne bat pas pandas
+DERIVE_KERNEL_MIN_ROWS = 10_000
+
+# Colonnes requises pour le calcul fusionné des métriques dérivées
+DERIVE_KERNEL_COLUMNS = ('salary_usd', 'normalized_location', 'experience_level')
+
+# Étapes de process_salary_data; la détection d'anomalies est à la demande
+SALARY_PROCESSING_STEPS = ('clean', 'normalize', 'compensation', 'cola', 'anomaly', 'experience')
+DEFAULT_SALARY_STEPS = frozenset({'clean', 'normalize', 'compensation', 'cola', 'experience'})
+
+# Nombre d'empreintes de frames gardées dans le cache d'anomalies
+ANOMALY_CACHE_SIZE = 8
+
+# Colonnes texte converties en string[pyarrow] en entrée du pipeline
+SALARY_TEXT_COLUMNS = ('location', 'role', 'title', 'company_name', 'experience_level')
+
+# Taille des blocs de lignes écrits lors d'un export CSV ou NDJSON dans un buffer
+EXPORT_CHUNK_ROWS = 50_000
+
+# Espaces multiples dans les noms de lieux ("New  York" -> "New York")
+LOCATION_WHITESPACE_RE = re.compile(r'\s+')
+
+# Mapping des titres vers départements gaming
+TITLE_TO_DEPARTMENT = {
+    # Programming
+    'software engineer': 'Programming',
+    'game programmer': 'Programming', 
+    'gameplay programmer': 'Programming',
+    'engine programmer': 'Programming',
+    'technical lead': 'Programming',
+    'senior developer': 'Programming',
+    
+    # Art & Animation
+    '3d artist': 'Art & Animation',
+    'character artist': 'Art & Animation',
+    'environment artist': 'Art & Animation',
+    'animator': 'Art & Animation',
+    'technical artist': 'Art & Animation',
+    'concept artist': 'Art & Animation',
+    
+    # Game Design
+    'game designer': 'Game Design',
+    'level designer': 'Game Design',
+    'gameplay designer': 'Game Design',
+    'narrative designer': 'Game Design',
+    'systems designer': 'Game Design',
+    
+    # QA
+    'qa tester': 'Quality Assurance',
+    'quality assurance': 'Quality Assurance',
+    'test engineer': 'Quality Assurance',
+    'qa analyst': 'Quality Assurance',
+    
+    # Production
+    'producer': 'Production',
+    'project manager': 'Production',
+    'product manager': 'Production',
+    'program manager': 'Production'
+}
+
+# Mots-clés génériques par département (après les titres connus)
+DEPARTMENT_KEYWORDS = {
+    'Programming': ['develop', 'program', 'code', 'engineer'],
+    'Art & Animation': ['artist', 'art', 'visual', 'animator'],
+    'Game Design': ['design', 'game design'],
+    'Quality Assurance': ['qa', 'test', 'quality'],
+    'Production': ['producer', 'manager', 'lead']
+}
+
+
+def _build_department_patterns() -> List[Tuple[str, re.Pattern]]:
+    """Motifs (département, regex) dans l'ordre de priorité de la classification
+
+    Un titre connu contenu dans le rôle l'emporte sur les mots-clés génériques;
+    les titres sont regroupés par département dans l'ordre du mapping.
+    """
+    phrases_by_department: Dict[str, List[str]] = {}
+    for phrase, department in TITLE_TO_DEPARTMENT.items():
+        phrases_by_department.setdefault(department, []).append(phrase)
+    
+    ordered_groups = list(phrases_by_department.items()) + list(DEPARTMENT_KEYWORDS.items())
+    return [
+        (department, re.compile('|'.join(re.escape(word) for word in words)))
+        for department, words in ordered_groups
+    ]
+
+
+DEPARTMENT_PATTERNS = _build_department_patterns()
+
+# Tous les motifs en une seule regex: chaque alternative est un lookahead ancré en début
+# de chaîne, donc la première alternative qui réussit est le motif le plus prioritaire
+# (une alternance classique renverrait le motif trouvé le plus à gauche dans le rôle)
+DEPARTMENT_REGEX = re.compile(
+    '^(?:' + '|'.join(
+        f'(?P<g{i}>(?=.*?(?:{pattern.pattern})))' for i, (_, pattern) in enumerate(DEPARTMENT_PATTERNS)
+    ) + ')',
+    re.DOTALL
+)
+DEPARTMENT_REGEX_LABELS = np.array([department for department, _ in DEPARTMENT_PATTERNS], dtype=object)
+
+
+def _category_table(values: pd.Series, mapping: Dict[str, float], default: float,
+                    dtype: type = np.float64) -> Tuple[np.ndarray, np.ndarray]:
+    """Table dense (une valeur par catégorie) et codes de catégorie des lignes
+
+    Le défaut est placé en dernière position pour que le code -1 (NaN) y renvoie.
+    """
+    categorical = values.astype('category')
+    table = np.array(
+        [mapping.get(category, default) for category in categorical.cat.categories] + [default],
+        dtype=dtype
+    )
+    return table, categorical.cat.codes.to_numpy()
+
+
+def _derive_numpy(salary, bonus, equity, inv_cola, inv_years, out_total, out_cola_sal, out_cola_tot,
+                  out_per_year):
+    """Métriques dérivées vectorisées NumPy (fallback sans Numba)"""
+    out_total[:] = salary + bonus + equity * 0.25
+    out_cola_sal[:] = salary * inv_cola
+    out_cola_tot[:] = out_total * inv_cola
+    out_per_year[:] = salary * inv_years
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _derive_kernel(salary, bonus, equity, inv_cola, inv_years, out_total, out_cola_sal, out_cola_tot,
+                       out_per_year):
+        """Métriques dérivées: une seule boucle, écrite dans des tableaux préalloués"""
+        for i in range(salary.shape[0]):
+            total = salary[i] + bonus[i] + equity[i] * 0.25
+            out_total[i] = total
+            out_cola_sal[i] = salary[i] * inv_cola[i]
+            out_cola_tot[i] = total * inv_cola[i]
+            out_per_year[i] = salary[i] * inv_years[i]
+else:
+    _derive_kernel = _derive_numpy
+
+
 class SalaryProcessor:
     """Processeur de données salaires gaming avec normalisation et détection d'anomalies"""
     
-    def __init__(self):
-        self.scaler = StandardScaler()
-        self.anomaly_detector = IsolationForest(contamination=0.05, random_state=42)
+    def __init__(self, use_iforest: bool = False):
+        # Isolation Forest en option: sur 1-2 features, la règle IQR suffit
+        self.use_iforest = use_iforest
+        self.anomaly_detector = (
+            IsolationForest(
+                contamination=0.05, random_state=42,
+                n_estimators=64, max_samples=256, n_jobs=-1
+            ) if use_iforest else None
+        )
+        # Masques d'anomalies calculés à la demande, par empreinte de frame
+        self._anomaly_cache: Dict[Tuple, pd.Series] = {}
         
         # Mapping des régions pour normalisation géographique
         self.region_mapping = {
@@ -53,49 +222,214 @@ class SalaryProcessor:
             'Tokyo': 0.80,
             'Seoul': 0.65
         }
+        
+        # Mapping années d'expérience
+        self.experience_to_years = {
+            'Intern': 0,
+            'Junior': 1.5,
+            'Mid': 4,
+            'Senior': 8,
+            'Lead': 12,
+            'Principal': 15,
+            'Director': 18
+        }
+    
+    def process_salary_data(self, raw_data: pd.DataFrame,
+                            steps: Optional[Set[str]] = None) -> pd.DataFrame:
+        """Traite et nettoie les données de salaires brutes
+        
+        steps restreint les étapes exécutées (voir SALARY_PROCESSING_STEPS). Par défaut,
+        la détection d'anomalies n'est pas lancée: generate_salary_insights la calcule
+        à la demande; passer 'anomaly' dans steps pour obtenir les colonnes salary_anomaly.
+        """
+        return self._process_salary_data_cached(raw_data, steps, self.use_iforest)
     
     @st.cache_data(ttl=7200)  # Cache 2 heures
-    def process_salary_data(_self, raw_data: pd.DataFrame) -> pd.DataFrame:
-        """Traite et nettoie les données de salaires brutes"""
+    def _process_salary_data_cached(_self, raw_data: pd.DataFrame, steps: Optional[Set[str]],
+                                    use_iforest: bool) -> pd.DataFrame:
+        """Pipeline de process_salary_data mis en cache
+        
+        _self n'est pas hashé par st.cache_data: use_iforest (le mode du détecteur
+        d'anomalies de _self) fait partie de la clé pour ne pas partager les résultats
+        entre processeurs IQR et Isolation Forest.
+        """
         if raw_data.empty:
             return pd.DataFrame()
         
-        df = raw_data.copy()
-        
-        # Étapes de nettoyage
-        df = _self._clean_salary_values(df)
-        df = _self._normalize_locations(df)
-        df = _self._normalize_job_titles(df)
-        df = _self._calculate_total_compensation(df)
-        df = _self._adjust_for_cost_of_living(df)
-        df = _self._detect_salary_anomalies(df)
-        df = _self._enrich_with_experience_metrics(df)
+        steps = DEFAULT_SALARY_STEPS if steps is None else frozenset(steps)
+        unknown_steps = steps.difference(SALARY_PROCESSING_STEPS)
+        if unknown_steps:
+            raise ValueError(f"Unknown salary processing steps: {sorted(unknown_steps)}")
+        
+        # Copie superficielle: les étapes remplacent des colonnes sans toucher raw_data
+        df = raw_data.copy(deep=False)
+        
+        # Étapes de nettoyage: filtrage et dédoublonnage d'abord, les étapes suivantes
+        # ne travaillent que sur les lignes retenues
+        if 'clean' in steps:
+            df = _self._clean_salary_values(df)
+        
+        if ARROW_STRINGS_AVAILABLE:
+            # Les appels .str.* suivants s'exécutent dans les kernels Arrow
+            df = df.assign(**{
+                col: df[col].astype('string[pyarrow]') for col in SALARY_TEXT_COLUMNS if col in df.columns
+            })
+        
+        if 'normalize' in steps:
+            df = _self._normalize_locations(df)
+            df = _self._normalize_job_titles(df)
+        
+        fused_steps = {'compensation', 'cola', 'experience'}
+        if (fused_steps <= steps and len(df) >= DERIVE_KERNEL_MIN_ROWS
+                and all(col in df.columns for col in DERIVE_KERNEL_COLUMNS)):
+            df = _self._derive_salary_metrics(df, detect_anomalies='anomaly' in steps)
+        else:
+            if 'compensation' in steps:
+                df = _self._calculate_total_compensation(df)
+            if 'cola' in steps:
+                df = _self._adjust_for_cost_of_living(df)
+            if 'anomaly' in steps:
+                df = _self._detect_salary_anomalies(df)
+            if 'experience' in steps:
+                df = _self._enrich_with_experience_metrics(df)
         
         logger.info(f"Processed {len(df)} salary records")
         return df
     
-    def _clean_salary_values(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Nettoie et valide les valeurs de salaires"""
-        # Conversion en numérique
-        salary_columns = ['salary_usd', 'bonus_usd', 'equity_value_usd']
+    def process_salary_data_lazy(self, raw_data: pd.DataFrame,
+                                 detect_anomalies: bool = False) -> pd.DataFrame:
+        """Variante polars de process_salary_data: un seul plan paresseux, collecté une fois
+        
+        Le filtrage, le dédoublonnage et toutes les colonnes dérivées sont fusionnés par
+        l'optimiseur polars; la détection d'anomalies (optionnelle) reste en pandas.
+        """
+        if pl is None:
+            logger.warning("polars not installed, using pandas salary pipeline")
+            steps = DEFAULT_SALARY_STEPS | {'anomaly'} if detect_anomalies else None
+            return self.process_salary_data(raw_data, steps=steps)
+        
+        if raw_data.empty:
+            return pd.DataFrame()
         
-        for col in salary_columns:
+        columns = set(raw_data.columns)
+        lf = pl.from_pandas(raw_data).lazy()
+        
+        # Nettoyage des salaires
+        salary_columns = [col for col in ['salary_usd', 'bonus_usd', 'equity_value_usd'] if col in columns]
+        if salary_columns:
+            lf = lf.with_columns(pl.col(salary_columns).cast(pl.Float64, strict=False))
+        
+        if 'salary_usd' in columns:
+            lf = lf.filter(pl.col('salary_usd').is_between(30000, 500000))
+        
+        duplicate_cols = ['company_name', 'role', 'experience_level', 'location']
+        available_cols = [col for col in duplicate_cols if col in columns]
+        if available_cols:
+            lf = lf.unique(subset=available_cols, keep='last', maintain_order=True)
+        
+        if salary_columns:
+            lf = lf.with_columns(pl.col(salary_columns).cast(pl.Float32))
+        
+        # Colonnes dérivées
+        derived = []
+        
+        if 'location' in columns:
+            lf = lf.with_columns(
+                pl.col('location').str.strip_chars()
+                .str.replace_all(LOCATION_WHITESPACE_RE.pattern, ' ').str.to_titlecase()
+            )
+            derived.append(
+                pl.col('location').replace(self.region_mapping).fill_null('Remote')
+                .alias('normalized_location')
+            )
+        
+        role_col = 'role' if 'role' in columns else 'title' if 'title' in columns else None
+        if role_col:
+            normalized_role = pl.col(role_col).str.to_lowercase()
+            pattern_department = pl.when(normalized_role.str.contains(DEPARTMENT_PATTERNS[0][1].pattern))
+            pattern_department = pattern_department.then(pl.lit(DEPARTMENT_PATTERNS[0][0]))
+            for department, pattern in DEPARTMENT_PATTERNS[1:]:
+                pattern_department = pattern_department.when(
+                    normalized_role.str.contains(pattern.pattern)
+                ).then(pl.lit(department))
+            derived.extend([
+                normalized_role.alias('normalized_role'),
+                pl.coalesce(
+                    normalized_role.replace_strict(TITLE_TO_DEPARTMENT, default=None, return_dtype=pl.String),
+                    pattern_department.otherwise(pl.lit('Other'))
+                ).alias('department')
+            ])
+        
+        compensation_components = []
+        if 'salary_usd' in columns:
+            compensation_components.append(pl.col('salary_usd').fill_null(0))
+        if 'bonus_usd' in columns:
+            compensation_components.append(pl.col('bonus_usd').fill_null(0))
+        if 'equity_value_usd' in columns:
+            compensation_components.append(pl.col('equity_value_usd').fill_null(0) / 4)
+        if compensation_components:
+            derived.append(pl.sum_horizontal(compensation_components).alias('total_compensation_usd'))
+        
+        lf = lf.with_columns(derived)
+        
+        if 'location' in columns and 'salary_usd' in columns:
+            cola = pl.col('normalized_location').replace_strict(
+                self.cost_of_living_adjustments, default=0.75, return_dtype=pl.Float32
+            )
+            cola_columns = [cola.alias('cola_multiplier'), (pl.col('salary_usd') / cola).alias('salary_cola_adjusted')]
+            if compensation_components:
+                cola_columns.append((pl.col('total_compensation_usd') / cola).alias('total_comp_cola_adjusted'))
+            lf = lf.with_columns(cola_columns)
+        
+        if 'experience_level' in columns:
+            years = pl.col('experience_level').replace_strict(
+                {level: float(value) for level, value in self.experience_to_years.items()},
+                default=4.0, return_dtype=pl.Float32
+            )
+            experience_columns = [years.alias('estimated_years_experience')]
+            if 'salary_usd' in columns:
+                experience_columns.append((pl.col('salary_usd') / (years + 1)).alias('salary_per_experience_year'))
+            lf = lf.with_columns(experience_columns)
+        
+        df = lf.collect(engine='streaming').to_pandas()
+        
+        for col in ['normalized_location', 'department', 'experience_level']:
             if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors='coerce')
+                df[col] = df[col].astype('category')
+        
+        if detect_anomalies:
+            df = self._detect_salary_anomalies(df)
+        
+        logger.info(f"Processed {len(df)} salary records (polars)")
+        return df
+    
+    def _clean_salary_values(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Nettoie et valide les valeurs de salaires
+        
+        Filtre et dédoublonne avant toute autre conversion: les étapes suivantes ne voient
+        que des lignes retenues, avec un salary_usd non nul compris entre 30K et 500K USD.
+        """
+        salary_columns = ['salary_usd', 'bonus_usd', 'equity_value_usd']
         
         # Filtrage des valeurs aberrantes
         if 'salary_usd' in df.columns:
-            # Salaires gaming raisonnables: 30K - 500K USD
-            df = df[
-                (df['salary_usd'] >= 30000) & 
-                (df['salary_usd'] <= 500000)
-            ]
+            df = df.assign(salary_usd=pd.to_numeric(df['salary_usd'], errors='coerce'))
+            # Salaires gaming raisonnables: 30K - 500K USD (prédicat évalué par numexpr si dispo)
+            # NaN exclus par la comparaison
+            df = df.query('30000 <= salary_usd <= 500000')
         
         # Suppression des doublons
         duplicate_cols = ['company_name', 'role', 'experience_level', 'location']
         available_cols = [col for col in duplicate_cols if col in df.columns]
         if available_cols:
-            df = df.drop_duplicates(subset=available_cols, keep='last')
+            df = df.drop_duplicates(subset=available_cols, keep='last', ignore_index=True)
+        
+        # Conversion des autres montants sur les seules lignes retenues;
+        # float32 suffit pour des montants de 30K-500K USD (~7 chiffres significatifs)
+        df = df.assign(**{
+            col: pd.to_numeric(df[col], errors='coerce', downcast='float')
+            for col in salary_columns if col in df.columns
+        })
         
         return df
     
@@ -104,15 +438,16 @@ class SalaryProcessor:
         if 'location' not in df.columns:
             return df
         
-        # Nettoyage basique
-        df['location'] = df['location'].str.strip().str.title()
+        # Nettoyage basique: espaces normalisés puis casse titre
+        location = df['location'].str.strip().str.replace(LOCATION_WHITESPACE_RE, ' ', regex=True).str.title()
         
         # Application du mapping
-        df['normalized_location'] = df['location'].map(
-            lambda x: self.region_mapping.get(x, x) if pd.notna(x) else 'Remote'
+        return df.assign(
+            location=location,
+            normalized_location=(
+                location.map(self.region_mapping).fillna(location).fillna('Remote').astype('category')
+            )
         )
-        
-        return df
     
     def _normalize_job_titles(self, df: pd.DataFrame) -> pd.DataFrame:
         """Normalise les titres de postes gaming"""
@@ -121,99 +456,82 @@ class SalaryProcessor:
         
         role_col = 'role' if 'role' in df.columns else 'title'
         
-        # Mapping des titres vers départements gaming
-        title_to_department = {
-            # Programming
-            'software engineer': 'Programming',
-            'game programmer': 'Programming', 
-            'gameplay programmer': 'Programming',
-            'engine programmer': 'Programming',
-            'technical lead': 'Programming',
-            'senior developer': 'Programming',
-            
-            # Art & Animation
-            '3d artist': 'Art & Animation',
-            'character artist': 'Art & Animation',
-            'environment artist': 'Art & Animation',
-            'animator': 'Art & Animation',
-            'technical artist': 'Art & Animation',
-            'concept artist': 'Art & Animation',
-            
-            # Game Design
-            'game designer': 'Game Design',
-            'level designer': 'Game Design',
-            'gameplay designer': 'Game Design',
-            'narrative designer': 'Game Design',
-            'systems designer': 'Game Design',
-            
-            # QA
-            'qa tester': 'Quality Assurance',
-            'quality assurance': 'Quality Assurance',
-            'test engineer': 'Quality Assurance',
-            'qa analyst': 'Quality Assurance',
-            
-            # Production
-            'producer': 'Production',
-            'project manager': 'Production',
-            'product manager': 'Production',
-            'program manager': 'Production'
-        }
+        # Classification vectorisée: correspondance exacte, puis motifs par ordre de priorité
+        normalized_role = df[role_col].str.lower()
+        exact_department = normalized_role.map(TITLE_TO_DEPARTMENT)
         
-        # Classification automatique
-        df['normalized_role'] = df[role_col].str.lower()
-        df['department'] = df['normalized_role'].map(
-            lambda x: self._classify_role_to_department(x, title_to_department)
+        # Un seul passage regex: le groupe capturé indique le motif prioritaire
+        pattern_matches = normalized_role.str.extract(DEPARTMENT_REGEX).notna().to_numpy()
+        pattern_department = np.where(
+            pattern_matches.any(axis=1), DEPARTMENT_REGEX_LABELS[pattern_matches.argmax(axis=1)], 'Other'
         )
         
-        return df
+        return df.assign(
+            normalized_role=normalized_role,
+            department=exact_department.fillna(pd.Series(pattern_department, index=df.index)).astype('category')
+        )
     
-    def _classify_role_to_department(self, role: str, mapping: Dict[str, str]) -> str:
-        """Classifie un rôle dans un département gaming"""
-        if pd.isna(role):
-            return 'Other'
-        
-        role_lower = role.lower()
-        
-        # Recherche exacte d'abord
-        if role_lower in mapping:
-            return mapping[role_lower]
-        
-        # Recherche par mots-clés
-        for key_phrase, department in mapping.items():
-            if key_phrase in role_lower:
-                return department
-        
-        # Classification par mots-clés génériques
-        if any(word in role_lower for word in ['develop', 'program', 'code', 'engineer']):
-            return 'Programming'
-        elif any(word in role_lower for word in ['artist', 'art', 'visual', 'animator']):
-            return 'Art & Animation'
-        elif any(word in role_lower for word in ['design', 'game design']):
-            return 'Game Design'
-        elif any(word in role_lower for word in ['qa', 'test', 'quality']):
-            return 'Quality Assurance'
-        elif any(word in role_lower for word in ['producer', 'manager', 'lead']):
-            return 'Production'
-        else:
-            return 'Other'
+    def _derive_salary_metrics(self, df: pd.DataFrame, detect_anomalies: bool = True) -> pd.DataFrame:
+        """Compensation totale, ajustement COLA et métriques d'expérience en une passe
+        
+        Équivalent fusionné des étapes _calculate_total_compensation,
+        _adjust_for_cost_of_living, _detect_salary_anomalies et
+        _enrich_with_experience_metrics (même ordre de colonnes).
+        """
+        n = len(df)
+        # salary_usd est non nul après le filtrage de _clean_salary_values
+        salary = df['salary_usd'].to_numpy(dtype=np.float32, na_value=0.0)
+        zeros = np.zeros(n, dtype=np.float32)
+        bonus = df['bonus_usd'].to_numpy(dtype=np.float32, na_value=0.0) if 'bonus_usd' in df.columns else zeros
+        equity = (
+            df['equity_value_usd'].to_numpy(dtype=np.float32, na_value=0.0)
+            if 'equity_value_usd' in df.columns else zeros
+        )
+        
+        # Réciproques calculées sur les tables (une division par catégorie, pas par ligne)
+        cola_table, location_codes = _category_table(
+            df['normalized_location'], self.cost_of_living_adjustments, default=0.75, dtype=np.float32
+        )
+        cola = cola_table.take(location_codes)
+        experience_level = df['experience_level'].astype('category')
+        years_table, experience_codes = _category_table(
+            experience_level, self.experience_to_years, default=4, dtype=np.float32
+        )
+        years = years_table.take(experience_codes)
+        inv_cola = np.reciprocal(cola_table).take(location_codes)
+        inv_years = np.reciprocal(years_table + np.float32(1.0)).take(experience_codes)
+        
+        out_total, out_cola_sal, out_cola_tot, out_per_year = (np.empty(n, dtype=np.float32) for _ in range(4))
+        _derive_kernel(salary, bonus, equity, inv_cola, inv_years, out_total, out_cola_sal, out_cola_tot, out_per_year)
+        
+        df = df.assign(
+            total_compensation_usd=out_total,
+            cola_multiplier=cola,
+            salary_cola_adjusted=out_cola_sal,
+            total_comp_cola_adjusted=out_cola_tot
+        )
+        if detect_anomalies:
+            df = self._detect_salary_anomalies(df)
+        
+        return df.assign(
+            experience_level=experience_level,
+            estimated_years_experience=years,
+            salary_per_experience_year=out_per_year
+        )
     
     def _calculate_total_compensation(self, df: pd.DataFrame) -> pd.DataFrame:
         """Calcule la compensation totale"""
-        compensation_components = []
-        
-        if 'salary_usd' in df.columns:
-            compensation_components.append(df['salary_usd'].fillna(0))
-        
-        if 'bonus_usd' in df.columns:
-            compensation_components.append(df['bonus_usd'].fillna(0))
-        
-        if 'equity_value_usd' in df.columns:
-            # Equity valorisée sur 4 ans (standard Silicon Valley)
-            equity_annual = df['equity_value_usd'].fillna(0) / 4
-            compensation_components.append(equity_annual)
-        
-        if compensation_components:
-            df['total_compensation_usd'] = sum(compensation_components)
+        component_columns = [
+            col for col in ('salary_usd', 'bonus_usd', 'equity_value_usd') if col in df.columns
+        ]
+        
+        if component_columns:
+            # Une seule matrice (n, k) puis une réduction par ligne
+            components = np.nan_to_num(df[component_columns].to_numpy(dtype=np.float32), copy=False)
+            if 'equity_value_usd' in component_columns:
+                # Equity valorisée sur 4 ans (standard Silicon Valley)
+                components[:, component_columns.index('equity_value_usd')] *= 0.25
+            df = df.assign(total_compensation_usd=components.sum(axis=1))
         
         return df
     
@@ -222,22 +540,35 @@ class SalaryProcessor:
         if 'normalized_location' not in df.columns or 'salary_usd' not in df.columns:
             return df
         
-        df['cola_multiplier'] = df['normalized_location'].map(
-            lambda x: self.cost_of_living_adjustments.get(x, 0.75)  # Default pour locations inconnues
+        # Table float32 dense indexée par code de location, et sa réciproque
+        cola_table, location_codes = _category_table(
+            df['normalized_location'], self.cost_of_living_adjustments,
+            default=0.75, dtype=np.float32  # Default pour locations inconnues
         )
+        inv_cola = np.reciprocal(cola_table).take(location_codes)
         
-        df['salary_cola_adjusted'] = df['salary_usd'] / df['cola_multiplier']
-        
+        cola_columns = {
+            'cola_multiplier': cola_table.take(location_codes),
+            'salary_cola_adjusted': df['salary_usd'].to_numpy() * inv_cola
+        }
         if 'total_compensation_usd' in df.columns:
-            df['total_comp_cola_adjusted'] = df['total_compensation_usd'] / df['cola_multiplier']
+            cola_columns['total_comp_cola_adjusted'] = df['total_compensation_usd'].to_numpy() * inv_cola
         
-        return df
+        return df.assign(**cola_columns)
     
     def _detect_salary_anomalies(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Détecte les anomalies dans les salaires"""
+        """Détecte les anomalies dans les salaires
+        
+        Par défaut (barrières IQR), anomaly_score est la distance signée du salaire à la
+        médiane en unités d'IQR: positif au-dessus, négatif en dessous, |score| élevé =
+        plus atypique. Avec use_iforest=True, c'est le score_samples d'Isolation Forest
+        (plus bas = plus anormal). Les deux échelles ne sont pas comparables.
+        """
         if 'salary_usd' not in df.columns or len(df) < 10:
-            df['salary_anomaly'] = False
-            return df
+            return df.assign(salary_anomaly=False)
+        
+        if not self.use_iforest:
+            return self._detect_salary_anomalies_iqr(df)
         
         # Features pour détection d'anomalies
         features = []
@@ -252,8 +583,7 @@ class SalaryProcessor:
             feature_columns.append('total_compensation_usd')
         
         if len(features) == 0:
-            df['salary_anomaly'] = False
-            return df
+            return df.assign(salary_anomaly=False)
         
         # Préparation des données
         feature_matrix = np.hstack(features)
@@ -261,41 +591,65 @@ class SalaryProcessor:
         
         # Détection d'anomalies
         try:
-            anomaly_scores = self.anomaly_detector.fit_predict(feature_matrix)
-            df['salary_anomaly'] = anomaly_scores == -1
-            df['anomaly_score'] = self.anomaly_detector.decision_function(feature_matrix)
+            # Sous-échantillonnage borné, un seul fit puis un seul parcours des arbres
+            self.anomaly_detector.set_params(max_samples=min(256, len(feature_matrix)))
+            scores = self.anomaly_detector.fit(feature_matrix).score_samples(feature_matrix)
+            return df.assign(salary_anomaly=scores < np.quantile(scores, 0.05), anomaly_score=scores)
         except Exception as e:
             logger.warning(f"Anomaly detection failed: {e}")
-            df['salary_anomaly'] = False
-            df['anomaly_score'] = 0
+            return df.assign(salary_anomaly=False, anomaly_score=0)
+    
+    def _detect_salary_anomalies_iqr(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Détection d'anomalies par barrières IQR (3 × IQR) sur salary_usd
         
-        return df
+        salary_anomaly: salaire hors de [Q1 - 3·IQR, Q3 + 3·IQR].
+        anomaly_score: (salaire - médiane) / IQR (IQR nul remplacé par 1, NaN par 0).
+        """
+        salaries = df['salary_usd'].to_numpy(dtype=np.float64)
+        
+        if np.isnan(salaries).all():
+            return df.assign(salary_anomaly=False, anomaly_score=0.0)
+        
+        q1, median, q3 = np.nanpercentile(salaries, [25, 50, 75])
+        iqr = q3 - q1
+        lower, upper = q1 - 3 * iqr, q3 + 3 * iqr
+        
+        return df.assign(
+            salary_anomaly=(salaries < lower) | (salaries > upper),
+            # Distance signée à la médiane, normalisée par l'IQR
+            anomaly_score=np.nan_to_num((salaries - median) / (iqr if iqr > 0 else 1.0))
+        )
+    
+    def _salary_anomalies(self, df: pd.DataFrame) -> pd.Series:
+        """Masque salary_anomaly calculé à la demande, mis en cache par empreinte de frame"""
+        key = df_fingerprint(df)
+        if key not in self._anomaly_cache:
+            if len(self._anomaly_cache) >= ANOMALY_CACHE_SIZE:
+                self._anomaly_cache.pop(next(iter(self._anomaly_cache)))
+            columns = [col for col in ('salary_usd', 'total_compensation_usd') if col in df.columns]
+            self._anomaly_cache[key] = self._detect_salary_anomalies(df[columns].copy())['salary_anomaly']
+        return self._anomaly_cache[key]
     
     def _enrich_with_experience_metrics(self, df: pd.DataFrame) -> pd.DataFrame:
         """Enrichit avec des métriques d'expérience"""
         if 'experience_level' not in df.columns:
             return df
         
-        # Mapping années d'expérience
-        experience_to_years = {
-            'Intern': 0,
-            'Junior': 1.5,
-            'Mid': 4,
-            'Senior': 8,
-            'Lead': 12,
-            'Principal': 15,
-            'Director': 18
-        }
-        
-        df['estimated_years_experience'] = df['experience_level'].map(
-            lambda x: experience_to_years.get(x, 4) if pd.notna(x) else 4
+        experience_level = df['experience_level'].astype('category')
+        years_table, experience_codes = _category_table(
+            experience_level, self.experience_to_years, default=4, dtype=np.float32
         )
+        experience_columns = {
+            'experience_level': experience_level,
+            'estimated_years_experience': years_table.take(experience_codes)
+        }
         
-        # Score de progression salariale
+        # Score de progression salariale (multiplication par la réciproque tabulée)
         if 'salary_usd' in df.columns:
-            df['salary_per_experience_year'] = df['salary_usd'] / (df['estimated_years_experience'] + 1)
+            inv_years = np.reciprocal(years_table + np.float32(1.0)).take(experience_codes)
+            experience_columns['salary_per_experience_year'] = df['salary_usd'].to_numpy() * inv_years
         
-        return df
+        return df.assign(**experience_columns)
     
     def calculate_salary_percentiles(self, df: pd.DataFrame, 
                                    group_by: List[str] = None) -> pd.DataFrame:
@@ -311,12 +665,14 @@ class SalaryProcessor:
         
         percentiles = [10, 25, 50, 75, 90]
         
-        result = df.groupby(available_groups)['salary_usd'].agg([
-            ('count', 'count'),
-            ('mean', 'mean'),
-            ('std', 'std'),
-            *[(f'p{p}', lambda x, p=p: np.percentile(x.dropna(), p)) for p in percentiles]
-        ]).reset_index()
+        grouped = df.groupby(available_groups, observed=True)['salary_usd']
+        base_stats = grouped.agg(['count', 'mean', 'std'])
+        
+        # Un seul tri par groupe pour tous les percentiles
+        quantiles = grouped.quantile([p / 100 for p in percentiles]).unstack()
+        quantiles.columns = [f'p{p}' for p in percentiles]
+        
+        result = base_stats.join(quantiles).reset_index()
         
         # Ajout de métriques dérivées
         result['cv'] = result['std'] / result['mean']  # Coefficient de variation
@@ -338,34 +694,36 @@ class SalaryProcessor:
         }
         
         if 'salary_usd' in df.columns:
-            salary_data = df['salary_usd'].dropna()
+            # Un seul describe() au lieu de sept réductions séparées
+            salary_summary = df['salary_usd'].describe(percentiles=[0.25, 0.5, 0.75])
             insights['salary_stats'] = {
-                'median': salary_data.median(),
-                'mean': salary_data.mean(),
-                'std': salary_data.std(),
-                'min': salary_data.min(),
-                'max': salary_data.max(),
-                'q1': salary_data.quantile(0.25),
-                'q3': salary_data.quantile(0.75)
+                'median': salary_summary['50%'],
+                'mean': salary_summary['mean'],
+                'std': salary_summary['std'],
+                'min': salary_summary['min'],
+                'max': salary_summary['max'],
+                'q1': salary_summary['25%'],
+                'q3': salary_summary['75%']
             }
         
         # Insights par département
         if 'department' in df.columns and 'salary_usd' in df.columns:
-            dept_stats = df.groupby('department')['salary_usd'].agg([
+            dept_stats = df.groupby('department', observed=True)['salary_usd'].agg([
                 'count', 'mean', 'median', 'std'
             ]).round(0)
             insights['department_breakdown'] = dept_stats.to_dict('index')
         
         # Insights par niveau d'expérience
         if 'experience_level' in df.columns and 'salary_usd' in df.columns:
-            exp_stats = df.groupby('experience_level')['salary_usd'].agg([
+            exp_stats = df.groupby('experience_level', observed=True)['salary_usd'].agg([
                 'count', 'mean', 'median'
             ]).round(0)
             insights['experience_breakdown'] = exp_stats.to_dict('index')
         
-        # Détection des anomalies
-        if 'salary_anomaly' in df.columns:
-            anomaly_count = df['salary_anomaly'].sum()
+        # Détection des anomalies (calculée à la demande si le pipeline l'a sautée)
+        if 'salary_anomaly' in df.columns or 'salary_usd' in df.columns:
+            anomalies = df['salary_anomaly'] if 'salary_anomaly' in df.columns else self._salary_anomalies(df)
+            anomaly_count = anomalies.sum()
             insights['anomalies'] = {
                 'count': int(anomaly_count),
                 'percentage': float(anomaly_count / len(df) * 100)
@@ -378,8 +736,16 @@ class SalaryProcessor:
         
         return insights
     
-    def export_processed_data(self, df: pd.DataFrame, format: str = 'csv') -> str:
-        """Exporte les données traitées"""
+    def export_processed_data(self, df: pd.DataFrame, format: str = 'csv',
+                              buffer: Optional[TextIO] = None) -> Optional[str]:
+        """Exporte les données traitées
+        
+        Formats: 'csv', 'json' (tableau d'enregistrements indenté) et 'ndjson' (un
+        enregistrement par ligne). Sans buffer, le contenu est renvoyé en chaîne. Avec un
+        buffer texte fourni par l'appelant (fichier, flux de réponse), les données y sont
+        écrites et None est renvoyé; 'csv' et 'ndjson' sont alors écrits par blocs de
+        EXPORT_CHUNK_ROWS lignes, sans construire l'export complet en mémoire.
+        """
         if df.empty:
             return ""
         
@@ -387,11 +753,24 @@ class SalaryProcessor:
         
         if format == 'csv':
             filename = f"gaming_salaries_processed_{timestamp}.csv"
-            csv_data = df.to_csv(index=False)
-            return csv_data
+            if buffer is None:
+                return df.to_csv(index=False)
+            df.to_csv(buffer, index=False, chunksize=EXPORT_CHUNK_ROWS)
+            return None
         elif format == 'json':
             filename = f"gaming_salaries_processed_{timestamp}.json"
             json_data = df.to_json(orient='records', indent=2)
-            return json_data
+            if buffer is None:
+                return json_data
+            buffer.write(json_data)
+            return None
+        elif format == 'ndjson':
+            filename = f"gaming_salaries_processed_{timestamp}.ndjson"
+            if buffer is None:
+                return df.to_json(orient='records', lines=True)
+            for start in range(0, len(df), EXPORT_CHUNK_ROWS):
+                chunk = df.iloc[start:start + EXPORT_CHUNK_ROWS].to_json(orient='records', lines=True)
+                buffer.write(chunk if chunk.endswith('\n') else chunk + '\n')
+            return None
         else:
             raise ValueError(f"Unsupported format: {format}")
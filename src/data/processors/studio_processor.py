@@ -5,20 +5,112 @@ Analyse avancée des données des studios gaming globaux
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Any, Optional, Tuple
+import copy
 import logging
 from datetime import datetime, timedelta
-import streamlit as st
 from sklearn.preprocessing import StandardScaler
-from sklearn.cluster import KMeans
+from sklearn.cluster import MiniBatchKMeans
 import plotly.express as px
 import plotly.graph_objects as go
 
+from ._hashing import df_fingerprint
+
+# Numba (optionnel): indice de concentration calculé en une seule boucle compilée
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Polars (optionnel): agrégations groupées collectées en une seule passe
+try:
+    import polars as pl
+    import polars.selectors as cs
+except ImportError:
+    pl = None
+
+# pyarrow (optionnel): conversion colonnaire des résultats en dicts Python
+try:
+    import pyarrow as pa
+    ARROW_AVAILABLE = True
+except ImportError:
+    ARROW_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Colonnes texte utilisées comme clés de groupby, converties en catégories
+STUDIO_CATEGORICAL_COLUMNS = ('country', 'region')
+
+# Analyses complètes mémorisées par empreinte de contenu (FIFO)
+STUDIO_ANALYSIS_CACHE_SIZE = 8
+
+# Agrégats par pays / région calculés une fois (colonnes aplaties 'employees_count', ...)
+STUDIO_GROUP_AGGREGATIONS = {
+    'employees': ['count', 'sum', 'mean', 'median'],
+    'avg_salary': ['mean'],
+    'retention_rate': ['mean'],
+    'founded_year': ['mean']
+}
+STUDIO_REGION_COLUMNS = ['employees_count', 'employees_sum', 'employees_mean', 'avg_salary_mean', 'retention_rate_mean']
+
+# Quantiles calculés une seule fois par analyse et partagés par les sections
+STUDIO_QUANTILE_COLUMNS = ('employees', 'avg_salary', 'retention_rate', 'revenue_usd')
+STUDIO_QUANTILES = (0.10, 0.25, 0.50, 0.75, 0.90)
+
+# Tranches de taille (employés): intervalles (a, b] soit 1-10, 11-50, 51-200, 201-1000, 1000+
+STUDIO_SIZE_BINS = [0, 10, 50, 200, 1000, np.inf]
+STUDIO_SIZE_LABELS = [
+    'Micro (1-10)', 'Small (11-50)', 'Medium (51-200)', 'Large (201-1000)', 'Enterprise (1000+)'
+]
+
+def _hhi_numpy(codes: np.ndarray, weights: np.ndarray, n_groups: int) -> float:
+    """Indice Herfindahl vectorisé NumPy (fallback sans Numba)"""
+    valid = codes >= 0
+    group_sums = np.bincount(codes[valid], weights=weights[valid], minlength=n_groups)
+    shares = group_sums / weights.sum()
+    return float(np.dot(shares, shares))
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _hhi_kernel(codes, weights, n_groups):
+        """Indice Herfindahl: sommes par groupe et total en une passe, puis somme des carrés"""
+        group_sums = np.zeros(n_groups)
+        total = 0.0
+        for i in range(codes.shape[0]):
+            total += weights[i]
+            if codes[i] >= 0:
+                group_sums[codes[i]] += weights[i]
+        hhi = 0.0
+        for j in range(n_groups):
+            share = group_sums[j] / total
+            hhi += share * share
+        return hhi
+else:
+    _hhi_kernel = _hhi_numpy
+
+
+def _df_to_records(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Lignes d'un DataFrame en dicts, converties colonne par colonne via Arrow
+    
+    Les valeurs manquantes deviennent None.
+    """
+    if ARROW_AVAILABLE:
+        return pa.Table.from_pandas(df, preserve_index=False).to_pylist()
+    return df.astype(object).where(df.notna(), None).to_dict('records')
+
+def _df_to_index_dict(df: pd.DataFrame) -> Dict[Any, Dict[str, Any]]:
+    """Équivalent de df.to_dict('index') construit sur _df_to_records"""
+    return dict(zip(df.index.tolist(), _df_to_records(df)))
+
 class GamingStudioProcessor:
     """Processeur avancé pour analyse des studios gaming mondiaux"""
     
     def __init__(self):
+        # Résultats de analyze_global_studios, par empreinte du DataFrame d'entrée
+        self._analysis_cache: Dict[Tuple, Dict[str, Any]] = {}
+        self._analysis_cache_stats = {'hits': 0, 'misses': 0}
+        
         self.studio_categories = {
             'AAA_Studio': {'min_employees': 500, 'min_revenue': 100000000},
             'AA_Studio': {'min_employees': 100, 'min_revenue': 10000000},
@@ -39,30 +131,247 @@ class GamingStudioProcessor:
             'Mobile', 'VR/AR', 'Indie', 'Casual'
         ]
     
-    @st.cache_data(ttl=7200)
-    def analyze_global_studios(_self, studios_df: pd.DataFrame) -> Dict[str, Any]:
-        """Analyse complète des studios gaming globaux"""
+    def analyze_global_studios(self, studios_df: pd.DataFrame) -> Dict[str, Any]:
+        """Analyse complète des studios gaming globaux
+        
+        Mémorisée par empreinte de contenu: une frame identique (valeurs, colonnes,
+        ordre des lignes) réutilise le résultat précédent sans relancer l'analyse.
+        """
         
         if studios_df.empty:
             return {'status': 'no_data', 'analysis': {}}
         
+        key = df_fingerprint(studios_df)
+        if key in self._analysis_cache:
+            self._analysis_cache_stats['hits'] += 1
+        else:
+            self._analysis_cache_stats['misses'] += 1
+            if len(self._analysis_cache) >= STUDIO_ANALYSIS_CACHE_SIZE:
+                self._analysis_cache.pop(next(iter(self._analysis_cache)))
+            self._analysis_cache[key] = self._run_global_analysis(studios_df)
+        
+        # Copie: l'appelant peut modifier le résultat sans altérer le cache
+        return copy.deepcopy(self._analysis_cache[key])
+    
+    def analysis_cache_info(self) -> Dict[str, int]:
+        """Compteurs du cache d'analyses (hits, misses, taille courante et maximale)"""
+        return {
+            **self._analysis_cache_stats,
+            'size': len(self._analysis_cache),
+            'maxsize': STUDIO_ANALYSIS_CACHE_SIZE
+        }
+    
+    def _run_global_analysis(self, studios_df: pd.DataFrame) -> Dict[str, Any]:
+        """Exécute toutes les sections d'analyse sur une frame non vide"""
+        
+        # Clés de groupby à faible cardinalité en catégories (codes entiers, une seule fois)
+        studios_df = studios_df.assign(**{
+            col: studios_df[col].astype('category')
+            for col in STUDIO_CATEGORICAL_COLUMNS if col in studios_df.columns
+        })
+        
+        # Métriques dérivées calculées une fois hors du DataFrame, partagées par les analyses
+        derived = self._derive_studio_metrics(studios_df)
+        
         analysis_results = {
             'timestamp': datetime.now().isoformat(),
             'total_studios_analyzed': len(studios_df),
-            'geographic_analysis': _self._analyze_geographic_distribution(studios_df),
-            'size_categorization': _self._categorize_studios_by_size(studios_df),
-            'financial_analysis': _self._analyze_financial_metrics(studios_df),
-            'talent_analysis': _self._analyze_talent_patterns(studios_df),
-            'competitive_landscape': _self._analyze_competitive_positioning(studios_df),
-            'market_opportunities': _self._identify_market_opportunities(studios_df),
-            'risk_assessment': _self._assess_studio_risks(studios_df),
-            'benchmarking': _self._generate_benchmarking_data(studios_df)
+            'geographic_analysis': self._analyze_geographic_distribution(studios_df, derived),
+            'size_categorization': self._categorize_studios_by_size(studios_df, derived),
+            'financial_analysis': self._analyze_financial_metrics(studios_df, derived),
+            'talent_analysis': self._analyze_talent_patterns(studios_df, derived),
+            'competitive_landscape': self._analyze_competitive_positioning(studios_df, derived),
+            'market_opportunities': self._identify_market_opportunities(studios_df, derived),
+            'risk_assessment': self._assess_studio_risks(studios_df, derived),
+            'benchmarking': self._generate_benchmarking_data(studios_df, derived)
         }
         
         logger.info(f"Global studio analysis completed for {len(studios_df)} studios")
         return analysis_results
     
-    def _analyze_geographic_distribution(self, studios_df: pd.DataFrame) -> Dict[str, Any]:
+    def analyze_global_studios_lazy(self, studios_df: pd.DataFrame) -> Dict[str, Any]:
+        """Variante polars de analyze_global_studios: agrégations groupées collectées une fois
+        
+        Les statistiques par pays, région, catégorie et tranche de taille forment un seul
+        plan paresseux (pl.collect_all); clustering, leaders, opportunités, risques et
+        percentiles restent en pandas/NumPy.
+        """
+        if pl is None:
+            logger.warning("polars not installed, using pandas studio analysis")
+            return self.analyze_global_studios(studios_df)
+        
+        if studios_df.empty:
+            return {'status': 'no_data', 'analysis': {}}
+        
+        columns = set(studios_df.columns)
+        derived = self._derive_studio_metrics(studios_df)
+        
+        lf = pl.from_pandas(studios_df).lazy()
+        if 'studio_category' in derived:
+            lf = lf.with_columns(pl.Series('studio_category', derived['studio_category'].astype(str)))
+        
+        def group_stats(key: str, aggregations: List[Tuple[str, str]]) -> 'pl.LazyFrame':
+            # Mêmes noms de colonnes que l'agrégation pandas aplatie ('employees_mean', ...)
+            return lf.filter(pl.col(key).is_not_null()).group_by(key).agg([
+                getattr(pl.col(col), stat)().alias(f'{col}_{stat}')
+                for col, stat in aggregations if col in columns
+            ]).sort(key)
+        
+        queries = {}
+        if 'country' in columns and 'employees' in columns:
+            queries['by_country'] = group_stats('country', [
+                ('employees', 'count'), ('employees', 'sum'), ('employees', 'mean'), ('employees', 'median'),
+                ('avg_salary', 'mean'), ('retention_rate', 'mean'), ('founded_year', 'mean')
+            ])
+            queries['geo_totals'] = lf.select(
+                pl.col('employees').sum().alias('total_employees'),
+                pl.col('country').n_unique().alias('n_countries')
+            )
+            if 'region' in columns:
+                queries['by_region'] = group_stats('region', [
+                    ('employees', 'count'), ('employees', 'sum'), ('employees', 'mean'),
+                    ('avg_salary', 'mean'), ('retention_rate', 'mean')
+                ])
+        
+        if 'studio_category' in derived:
+            queries['categories'] = group_stats('studio_category', [
+                ('employees', 'count'), ('employees', 'mean'), ('employees', 'median'), ('employees', 'sum'),
+                ('avg_salary', 'mean'), ('retention_rate', 'mean'), ('revenue_usd', 'mean')
+            ])
+            # Intervalles (a, b] identiques à pd.cut sur STUDIO_SIZE_BINS
+            size_bin = pl.when(pl.col('employees') > 0).then(
+                pl.col('employees').cut(STUDIO_SIZE_BINS[1:-1], labels=STUDIO_SIZE_LABELS)
+            )
+            queries['size_distribution'] = lf.with_columns(size_bin.alias('size_bin')).filter(
+                pl.col('size_bin').is_not_null()
+            ).group_by('size_bin').agg([pl.len().alias('count')] + [
+                pl.col(col).mean().alias(col) for col in ('avg_salary', 'retention_rate') if col in columns
+            ])
+        
+        collected = dict(zip(queries, pl.collect_all(list(queries.values()))))
+        
+        def to_index_dict(frame: 'pl.DataFrame', key: str) -> Dict[str, Dict[str, Any]]:
+            frame = frame.with_columns(cs.float().round(2))
+            return {row.pop(key): row for row in frame.to_dicts()}
+        
+        # Distribution géographique
+        geographic_analysis = {
+            'by_country': {},
+            'by_region': {},
+            'concentration_metrics': {},
+            'expansion_patterns': {}
+        }
+        if 'by_country' in collected:
+            geographic_analysis['by_country'] = to_index_dict(collected['by_country'], 'country')
+            if 'by_region' in collected:
+                geographic_analysis['by_region'] = to_index_dict(collected['by_region'], 'region')
+            
+            employees_by_country = collected['by_country'].to_pandas().set_index('country')['employees_sum']
+            totals = collected['geo_totals'].row(0, named=True)
+            geographic_analysis['concentration_metrics'] = {
+                'top_5_countries_share': (employees_by_country.nlargest(5).sum() / totals['total_employees'] * 100).round(2),
+                'herfindahl_index': self._calculate_herfindahl_index(
+                    studios_df, 'country', group_totals=employees_by_country
+                ),
+                'geographic_diversity_score': totals['n_countries']
+            }
+        
+        # Catégories et tranches de taille
+        size_categorization = {
+            'categories': {},
+            'size_distribution': {},
+            'growth_patterns': {},
+            'efficiency_metrics': {}
+        }
+        if 'categories' in collected:
+            size_categorization['categories'] = to_index_dict(collected['categories'], 'studio_category')
+            size_rows = {row.pop('size_bin'): row for row in collected['size_distribution'].to_dicts()}
+            size_categorization['size_distribution'] = {
+                label: {
+                    'count': size_rows.get(label, {}).get('count', 0),
+                    'percentage': round(size_rows.get(label, {}).get('count', 0) / len(studios_df) * 100, 2),
+                    'avg_salary': size_rows.get(label, {}).get('avg_salary', np.nan) if 'avg_salary' in columns else None,
+                    'avg_retention': size_rows.get(label, {}).get('retention_rate', np.nan) if 'retention_rate' in columns else None
+                }
+                for label in STUDIO_SIZE_LABELS
+            }
+        
+        studios_df = studios_df.assign(**{
+            col: studios_df[col].astype('category')
+            for col in STUDIO_CATEGORICAL_COLUMNS if col in studios_df.columns
+        })
+        
+        analysis_results = {
+            'timestamp': datetime.now().isoformat(),
+            'total_studios_analyzed': len(studios_df),
+            'geographic_analysis': geographic_analysis,
+            'size_categorization': size_categorization,
+            'financial_analysis': self._analyze_financial_metrics(studios_df, derived),
+            'talent_analysis': self._analyze_talent_patterns(studios_df, derived),
+            'competitive_landscape': self._analyze_competitive_positioning(studios_df, derived),
+            'market_opportunities': self._identify_market_opportunities(studios_df, derived),
+            'risk_assessment': self._assess_studio_risks(studios_df, derived),
+            'benchmarking': self._generate_benchmarking_data(studios_df, derived)
+        }
+        
+        logger.info(f"Global studio analysis completed for {len(studios_df)} studios (polars)")
+        return analysis_results
+    
+    def _derive_studio_metrics(self, studios_df: pd.DataFrame) -> Dict[str, Any]:
+        """Calcule les métriques par studio sans ajouter de colonnes au DataFrame
+        
+        Clés présentes selon les colonnes disponibles: country_stats et region_stats
+        (agrégats non arrondis), quantiles (DataFrame indexé par STUDIO_QUANTILES),
+        studio_category (Categorical), revenue_per_employee, total_salary_cost,
+        salary_cost_ratio.
+        """
+        columns = {
+            col: studios_df[col].to_numpy(dtype=float, na_value=np.nan)
+            for col in ('revenue_usd', 'employees', 'avg_salary') if col in studios_df.columns
+        }
+        
+        derived = {}
+        
+        # Un seul groupby par clé géographique, partagé par géographie, talents et opportunités
+        aggregations = {col: aggs for col, aggs in STUDIO_GROUP_AGGREGATIONS.items() if col in studios_df.columns}
+        for key in ('country', 'region'):
+            if key in studios_df.columns and aggregations:
+                group_stats = studios_df.groupby(key, observed=True).agg(aggregations)
+                group_stats.columns = ['_'.join(col) for col in group_stats.columns]
+                derived[f'{key}_stats'] = group_stats
+        
+        # Tous les quantiles utilisés par les sections, en un seul appel
+        quantile_columns = [col for col in STUDIO_QUANTILE_COLUMNS if col in studios_df.columns]
+        if quantile_columns:
+            derived['quantiles'] = studios_df[quantile_columns].quantile(list(STUDIO_QUANTILES))
+        
+        # Classification par catégorie (vectorisée, critères testés dans l'ordre de priorité)
+        if 'employees' in columns:
+            employees = columns['employees']
+            revenue = columns.get('revenue_usd', np.zeros(len(studios_df)))
+            category_conditions = [
+                (employees >= criteria['min_employees']) & (revenue >= criteria['min_revenue'])
+                for criteria in self.studio_categories.values()
+            ]
+            derived['studio_category'] = pd.Categorical(
+                np.select(category_conditions, list(self.studio_categories), default='Startup_Studio'),
+                categories=list(self.studio_categories)
+            )
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if 'revenue_usd' in columns and 'employees' in columns:
+                derived['revenue_per_employee'] = columns['revenue_usd'] / columns['employees']
+            
+            if 'avg_salary' in columns and 'employees' in columns:
+                derived['total_salary_cost'] = columns['avg_salary'] * columns['employees']
+                
+                if 'revenue_usd' in columns:
+                    derived['salary_cost_ratio'] = derived['total_salary_cost'] / columns['revenue_usd']
+        
+        return derived
+    
+    def _analyze_geographic_distribution(self, studios_df: pd.DataFrame,
+                                         derived: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Analyse la distribution géographique des studios"""
         
         geo_analysis = {
@@ -72,44 +381,39 @@ class GamingStudioProcessor:
             'expansion_patterns': {}
         }
         
-        if 'country' not in studios_df.columns:
+        if 'country' not in studios_df.columns or 'employees' not in studios_df.columns:
             return geo_analysis
         
-        # Analyse par pays
-        country_stats = studios_df.groupby('country').agg({
-            'employees': ['count', 'sum', 'mean', 'median'],
-            'avg_salary': 'mean',
-            'retention_rate': 'mean',
-            'founded_year': 'mean'
-        }).round(2)
+        if derived is None:
+            derived = self._derive_studio_metrics(studios_df)
         
-        country_stats.columns = ['_'.join(col).strip() for col in country_stats.columns]
-        geo_analysis['by_country'] = country_stats.to_dict('index')
+        # Analyse par pays (agrégats partagés, réutilisés pour la concentration)
+        country_stats = derived['country_stats']
+        geo_analysis['by_country'] = _df_to_index_dict(country_stats.round(2))
         
         # Analyse par région
-        if 'region' in studios_df.columns:
-            region_stats = studios_df.groupby('region').agg({
-                'employees': ['count', 'sum', 'mean'],
-                'avg_salary': 'mean',
-                'retention_rate': 'mean'
-            }).round(2)
-            
-            region_stats.columns = ['_'.join(col).strip() for col in region_stats.columns]
-            geo_analysis['by_region'] = region_stats.to_dict('index')
+        if 'region_stats' in derived:
+            region_stats = derived['region_stats']
+            region_columns = [col for col in STUDIO_REGION_COLUMNS if col in region_stats.columns]
+            geo_analysis['by_region'] = _df_to_index_dict(region_stats[region_columns].round(2))
         
         # Métriques de concentration
         total_employees = studios_df['employees'].sum()
-        top_5_countries = studios_df.groupby('country')['employees'].sum().nlargest(5)
+        employees_by_country = country_stats['employees_sum']
+        top_5_countries = employees_by_country.nlargest(5)
         
         geo_analysis['concentration_metrics'] = {
             'top_5_countries_share': (top_5_countries.sum() / total_employees * 100).round(2),
-            'herfindahl_index': self._calculate_herfindahl_index(studios_df, 'country'),
+            'herfindahl_index': self._calculate_herfindahl_index(
+                studios_df, 'country', group_totals=employees_by_country
+            ),
             'geographic_diversity_score': len(studios_df['country'].unique())
         }
         
         return geo_analysis
     
-    def _categorize_studios_by_size(self, studios_df: pd.DataFrame) -> Dict[str, Any]:
+    def _categorize_studios_by_size(self, studios_df: pd.DataFrame,
+                                    derived: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Catégorise les studios par taille et type"""
         
         size_analysis = {
@@ -122,12 +426,10 @@ class GamingStudioProcessor:
         if 'employees' not in studios_df.columns:
             return size_analysis
         
-        # Classification par catégorie
-        studios_df['studio_category'] = studios_df.apply(
-            lambda row: self._classify_studio_category(row), axis=1
-        )
+        if derived is None:
+            derived = self._derive_studio_metrics(studios_df)
         
-        category_stats = studios_df.groupby('studio_category').agg({
+        category_stats = studios_df.groupby(derived['studio_category'], observed=True).agg({
             'employees': ['count', 'mean', 'median', 'sum'],
             'avg_salary': 'mean',
             'retention_rate': 'mean',
@@ -135,52 +437,36 @@ class GamingStudioProcessor:
         }).round(2)
         
         category_stats.columns = ['_'.join(col).strip() for col in category_stats.columns]
-        size_analysis['categories'] = category_stats.to_dict('index')
-        
-        # Distribution de taille
-        size_ranges = [
-            (1, 10, 'Micro (1-10)'),
-            (11, 50, 'Small (11-50)'), 
-            (51, 200, 'Medium (51-200)'),
-            (201, 1000, 'Large (201-1000)'),
-            (1001, float('inf'), 'Enterprise (1000+)')
-        ]
-        
-        size_distribution = {}
-        for min_size, max_size, label in size_ranges:
-            if max_size == float('inf'):
-                mask = studios_df['employees'] >= min_size
-            else:
-                mask = (studios_df['employees'] >= min_size) & (studios_df['employees'] <= max_size)
-            
-            studios_in_range = studios_df[mask]
-            
-            size_distribution[label] = {
-                'count': len(studios_in_range),
-                'percentage': (len(studios_in_range) / len(studios_df) * 100).round(2),
-                'avg_salary': studios_in_range['avg_salary'].mean() if 'avg_salary' in studios_in_range.columns else None,
-                'avg_retention': studios_in_range['retention_rate'].mean() if 'retention_rate' in studios_in_range.columns else None
+        size_analysis['categories'] = _df_to_index_dict(category_stats)
+        
+        # Distribution de taille: un seul découpage puis un seul groupby
+        size_bins = pd.cut(studios_df['employees'], bins=STUDIO_SIZE_BINS, labels=STUDIO_SIZE_LABELS)
+        grouped = studios_df.groupby(size_bins, observed=False)
+        size_counts = grouped.size()
+        avg_salaries = grouped['avg_salary'].mean() if 'avg_salary' in studios_df.columns else None
+        avg_retentions = grouped['retention_rate'].mean() if 'retention_rate' in studios_df.columns else None
+        
+        size_distribution = {
+            label: {
+                'count': int(size_counts[label]),
+                'percentage': round(size_counts[label] / len(studios_df) * 100, 2),
+                'avg_salary': avg_salaries[label] if avg_salaries is not None else None,
+                'avg_retention': avg_retentions[label] if avg_retentions is not None else None
             }
+            for label in STUDIO_SIZE_LABELS
+        }
         
         size_analysis['size_distribution'] = size_distribution
         
         return size_analysis
     
-    def _classify_studio_category(self, studio_row: pd.Series) -> str:
-        """Classifie un studio selon sa catégorie"""
-        employees = studio_row.get('employees', 0)
-        revenue = studio_row.get('revenue_usd', 0)
-        
-        for category, criteria in self.studio_categories.items():
-            if (employees >= criteria['min_employees'] and 
-                revenue >= criteria['min_revenue']):
-                return category
-        
-        return 'Startup_Studio'
-    
-    def _analyze_financial_metrics(self, studios_df: pd.DataFrame) -> Dict[str, Any]:
+    def _analyze_financial_metrics(self, studios_df: pd.DataFrame,
+                                   derived: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Analyse les métriques financières des studios"""
         
+        if derived is None:
+            derived = self._derive_studio_metrics(studios_df)
+        
         financial_analysis = {
             'revenue_analysis': {},
             'profitability_metrics': {},
@@ -193,42 +479,43 @@ class GamingStudioProcessor:
             revenue_stats = {
                 'total_revenue': studios_df['revenue_usd'].sum(),
                 'avg_revenue': studios_df['revenue_usd'].mean(),
-                'median_revenue': studios_df['revenue_usd'].median(),
+                'median_revenue': derived['quantiles'].at[0.50, 'revenue_usd'],
                 'revenue_std': studios_df['revenue_usd'].std(),
                 'top_10_percent_share': self._calculate_top_percentile_share(studios_df, 'revenue_usd', 0.1)
             }
             financial_analysis['revenue_analysis'] = revenue_stats
         
         # Ratios d'efficacité
-        if 'revenue_usd' in studios_df.columns and 'employees' in studios_df.columns:
-            studios_df['revenue_per_employee'] = studios_df['revenue_usd'] / studios_df['employees']
+        if 'revenue_per_employee' in derived:
+            revenue_per_employee = derived['revenue_per_employee']
             
             efficiency_metrics = {
-                'avg_revenue_per_employee': studios_df['revenue_per_employee'].mean(),
-                'median_revenue_per_employee': studios_df['revenue_per_employee'].median(),
-                'top_quartile_efficiency': studios_df['revenue_per_employee'].quantile(0.75)
+                'avg_revenue_per_employee': np.nanmean(revenue_per_employee),
+                'median_revenue_per_employee': np.nanmedian(revenue_per_employee),
+                'top_quartile_efficiency': np.nanquantile(revenue_per_employee, 0.75)
             }
             financial_analysis['efficiency_ratios'] = efficiency_metrics
         
         # Structure des coûts
-        if 'avg_salary' in studios_df.columns and 'employees' in studios_df.columns:
-            studios_df['total_salary_cost'] = studios_df['avg_salary'] * studios_df['employees']
+        if 'salary_cost_ratio' in derived:
+            salary_cost_ratio = derived['salary_cost_ratio']
             
-            if 'revenue_usd' in studios_df.columns:
-                studios_df['salary_cost_ratio'] = studios_df['total_salary_cost'] / studios_df['revenue_usd']
-                
-                cost_structure = {
-                    'avg_salary_cost_ratio': studios_df['salary_cost_ratio'].mean(),
-                    'median_salary_cost_ratio': studios_df['salary_cost_ratio'].median(),
-                    'efficient_studios_ratio': (studios_df['salary_cost_ratio'] < 0.6).sum() / len(studios_df)
-                }
-                financial_analysis['cost_structure'] = cost_structure
+            cost_structure = {
+                'avg_salary_cost_ratio': np.nanmean(salary_cost_ratio),
+                'median_salary_cost_ratio': np.nanmedian(salary_cost_ratio),
+                'efficient_studios_ratio': np.count_nonzero(salary_cost_ratio < 0.6) / len(studios_df)
+            }
+            financial_analysis['cost_structure'] = cost_structure
         
         return financial_analysis
     
-    def _analyze_talent_patterns(self, studios_df: pd.DataFrame) -> Dict[str, Any]:
+    def _analyze_talent_patterns(self, studios_df: pd.DataFrame,
+                                 derived: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Analyse les patterns de talents et RH"""
         
+        if derived is None:
+            derived = self._derive_studio_metrics(studios_df)
+        
         talent_analysis = {
             'retention_patterns': {},
             'salary_benchmarks': {},
@@ -238,41 +525,57 @@ class GamingStudioProcessor:
         
         # Patterns de rétention
         if 'retention_rate' in studios_df.columns:
+            retention = studios_df['retention_rate'].to_numpy(dtype=float, na_value=np.nan)
             retention_stats = {
                 'avg_retention_rate': studios_df['retention_rate'].mean(),
-                'median_retention_rate': studios_df['retention_rate'].median(),
-                'high_retention_studios': (studios_df['retention_rate'] > 90).sum(),
-                'low_retention_studios': (studios_df['retention_rate'] < 70).sum(),
-                'retention_by_size': studios_df.groupby('studio_category')['retention_rate'].mean().to_dict() if 'studio_category' in studios_df.columns else {}
+                'median_retention_rate': derived['quantiles'].at[0.50, 'retention_rate'],
+                'high_retention_studios': np.count_nonzero(retention > 90),
+                'low_retention_studios': np.count_nonzero(retention < 70),
+                'retention_by_size': studios_df['retention_rate'].groupby(derived['studio_category'], observed=True).mean().to_dict() if 'studio_category' in derived else {}
             }
             talent_analysis['retention_patterns'] = retention_stats
         
         # Benchmarks salariaux
         if 'avg_salary' in studios_df.columns:
+            salary_quantiles = derived['quantiles']['avg_salary']
             salary_benchmarks = {
                 'global_avg_salary': studios_df['avg_salary'].mean(),
-                'salary_p25': studios_df['avg_salary'].quantile(0.25),
-                'salary_p50': studios_df['avg_salary'].quantile(0.50),
-                'salary_p75': studios_df['avg_salary'].quantile(0.75),
-                'salary_p90': studios_df['avg_salary'].quantile(0.90),
-                'salary_by_region': studios_df.groupby('region')['avg_salary'].mean().to_dict() if 'region' in studios_df.columns else {}
+                'salary_p25': salary_quantiles[0.25],
+                'salary_p50': salary_quantiles[0.50],
+                'salary_p75': salary_quantiles[0.75],
+                'salary_p90': salary_quantiles[0.90],
+                'salary_by_region': derived['region_stats']['avg_salary_mean'].to_dict() if 'region_stats' in derived else {}
             }
             talent_analysis['salary_benchmarks'] = salary_benchmarks
         
         # Métriques de diversité
         if 'neurodiversity_programs' in studios_df.columns:
+            programs = studios_df['neurodiversity_programs'].to_numpy(dtype=float, na_value=np.nan)
             diversity_stats = {
                 'studios_with_programs': studios_df['neurodiversity_programs'].sum(),
-                'program_adoption_rate': (studios_df['neurodiversity_programs'] > 0).sum() / len(studios_df) * 100,
-                'correlation_with_retention': studios_df[['neurodiversity_programs', 'retention_rate']].corr().iloc[0, 1] if 'retention_rate' in studios_df.columns else None
+                'program_adoption_rate': np.count_nonzero(programs > 0) / programs.size * 100,
+                'correlation_with_retention': self._pairwise_correlation(programs, retention) if 'retention_rate' in studios_df.columns else None
             }
             talent_analysis['diversity_metrics'] = diversity_stats
         
         return talent_analysis
     
-    def _analyze_competitive_positioning(self, studios_df: pd.DataFrame) -> Dict[str, Any]:
+    def _pairwise_correlation(self, x: np.ndarray, y: np.ndarray) -> float:
+        """Corrélation de Pearson sur les lignes complètes (comme DataFrame.corr)"""
+        complete = ~(np.isnan(x) | np.isnan(y))
+        if np.count_nonzero(complete) < 2:
+            return np.nan
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return float(np.corrcoef(x[complete], y[complete])[0, 1])
+    
+    def _analyze_competitive_positioning(self, studios_df: pd.DataFrame,
+                                         derived: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Analyse le positionnement concurrentiel"""
         
+        if derived is None:
+            derived = self._derive_studio_metrics(studios_df)
+        
         competitive_analysis = {
             'market_leaders': {},
             'competitive_clusters': {},
@@ -283,14 +586,14 @@ class GamingStudioProcessor:
         # Identification des leaders du marché
         if 'revenue_usd' in studios_df.columns and 'employees' in studios_df.columns:
             # Top studios par revenus
-            top_revenue = studios_df.nlargest(10, 'revenue_usd')[['name', 'revenue_usd', 'employees', 'country']].to_dict('records') if 'name' in studios_df.columns else []
+            top_revenue = self._top_studio_records(studios_df, 'revenue_usd', ['name', 'revenue_usd', 'employees', 'country']) if 'name' in studios_df.columns else []
             
             # Top studios par employés
-            top_employees = studios_df.nlargest(10, 'employees')[['name', 'employees', 'revenue_usd', 'country']].to_dict('records') if 'name' in studios_df.columns else []
+            top_employees = self._top_studio_records(studios_df, 'employees', ['name', 'employees', 'revenue_usd', 'country']) if 'name' in studios_df.columns else []
             
             # Top studios par efficacité
-            if 'revenue_per_employee' in studios_df.columns:
-                top_efficiency = studios_df.nlargest(10, 'revenue_per_employee')[['name', 'revenue_per_employee', 'employees', 'country']].to_dict('records') if 'name' in studios_df.columns else []
+            if 'revenue_per_employee' in derived:
+                top_efficiency = self._top_studio_records(studios_df, 'revenue_per_employee', ['name', 'revenue_per_employee', 'employees', 'country'], values=derived['revenue_per_employee']) if 'name' in studios_df.columns else []
             else:
                 top_efficiency = []
             
@@ -306,6 +609,34 @@ class GamingStudioProcessor:
         
         return competitive_analysis
     
+    def _top_studio_records(self, studios_df: pd.DataFrame, metric: str,
+                            columns: List[str], n: int = 10,
+                            values: Optional[np.ndarray] = None) -> List[Dict[str, Any]]:
+        """Top n studios sur une métrique (équivalent de nlargest sans trier tout le DataFrame)
+        
+        values: valeurs de la métrique quand elle n'est pas une colonne de studios_df
+        """
+        if values is None:
+            values = studios_df[metric].to_numpy(dtype=float)
+        missing = np.isnan(values)
+        candidates = np.flatnonzero(~missing)
+        k = min(n, candidates.size)
+        
+        # Sélection O(N) des k plus grandes valeurs, puis tri des seuls k retenus
+        # (égalités départagées par position, comme nlargest(keep='first'))
+        if k < candidates.size:
+            candidates = candidates[np.argpartition(values[candidates], -k)[-k:]]
+        top_idx = candidates[np.lexsort((candidates, -values[candidates]))]
+        if k < n:
+            # nlargest complète avec les lignes manquantes quand il n'y a pas assez de valeurs
+            top_idx = np.concatenate([top_idx, np.flatnonzero(missing)[:n - k]])
+        
+        top_studios = studios_df.iloc[top_idx]
+        if metric not in top_studios.columns:
+            top_studios = top_studios.assign(**{metric: values[top_idx]})
+        
+        return _df_to_records(top_studios[columns])
+    
     def _perform_competitive_clustering(self, studios_df: pd.DataFrame) -> Dict[str, Any]:
         """Effectue un clustering des studios pour analyse concurrentielle"""
         
@@ -333,31 +664,36 @@ class GamingStudioProcessor:
             return {'status': 'insufficient_features'}
         
         # Préparation des données
-        X = np.hstack(clustering_features)
-        scaler = StandardScaler()
+        X = np.hstack(clustering_features).astype(np.float32)
+        scaler = StandardScaler(copy=False)
         X_scaled = scaler.fit_transform(X)
         
-        # Clustering K-means
+        # Clustering K-means (mini-batch float32: moins de passes que Lloyd complet)
         n_clusters = min(5, len(studios_df) // 3)  # Max 5 clusters, min 3 studios par cluster
-        kmeans = KMeans(n_clusters=n_clusters, random_state=42, n_init=10)
+        kmeans = MiniBatchKMeans(n_clusters=n_clusters, random_state=42, n_init=3, batch_size=1024)
         cluster_labels = kmeans.fit_predict(X_scaled)
         
-        # Analyse des clusters
-        studios_df_temp = studios_df.copy()
-        studios_df_temp['cluster'] = cluster_labels
+        # Analyse des clusters: un groupby sur les labels, sans copier studios_df
+        cluster_counts = np.bincount(cluster_labels, minlength=n_clusters)
+        stat_columns = {
+            'avg_employees': 'employees',
+            'avg_revenue': 'revenue_usd',
+            'avg_salary': 'avg_salary',
+            'avg_retention': 'retention_rate'
+        }
+        present_columns = [col for col in stat_columns.values() if col in studios_df.columns]
+        cluster_means = studios_df[present_columns].groupby(cluster_labels).mean().reindex(range(n_clusters))
+        
+        # astype(object): égalités départagées par ordre d'apparition, pas par ordre des catégories
+        countries = studios_df['country'].astype(object) if 'country' in studios_df.columns else None
         
         cluster_analysis = {}
         for cluster_id in range(n_clusters):
-            cluster_studios = studios_df_temp[studios_df_temp['cluster'] == cluster_id]
+            cluster_stats = {'count': int(cluster_counts[cluster_id])}
+            for stat_name, col in stat_columns.items():
+                cluster_stats[stat_name] = cluster_means.at[cluster_id, col] if col in present_columns else None
             
-            cluster_stats = {
-                'count': len(cluster_studios),
-                'avg_employees': cluster_studios['employees'].mean() if 'employees' in cluster_studios.columns else None,
-                'avg_revenue': cluster_studios['revenue_usd'].mean() if 'revenue_usd' in cluster_studios.columns else None,
-                'avg_salary': cluster_studios['avg_salary'].mean() if 'avg_salary' in cluster_studios.columns else None,
-                'avg_retention': cluster_studios['retention_rate'].mean() if 'retention_rate' in cluster_studios.columns else None,
-                'dominant_countries': cluster_studios['country'].value_counts().head(3).to_dict() if 'country' in cluster_studios.columns else {}
-            }
+            cluster_stats['dominant_countries'] = countries[cluster_labels == cluster_id].value_counts().head(3).to_dict() if countries is not None else {}
             
             cluster_analysis[f'Cluster_{cluster_id}'] = cluster_stats
         
@@ -367,9 +703,13 @@ class GamingStudioProcessor:
             'n_clusters': n_clusters
         }
     
-    def _identify_market_opportunities(self, studios_df: pd.DataFrame) -> Dict[str, Any]:
+    def _identify_market_opportunities(self, studios_df: pd.DataFrame,
+                                       derived: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Identifie les opportunités de marché"""
         
+        if derived is None:
+            derived = self._derive_studio_metrics(studios_df)
+        
         opportunities = {
             'underserved_regions': [],
             'talent_arbitrage': [],
@@ -379,10 +719,9 @@ class GamingStudioProcessor:
         
         # Régions sous-servies (peu de studios mais bon marché)
         if 'country' in studios_df.columns and 'avg_salary' in studios_df.columns:
-            country_stats = studios_df.groupby('country').agg({
-                'employees': 'count',
-                'avg_salary': 'mean'
-            }).reset_index()
+            country_stats = derived['country_stats'][['employees_count', 'avg_salary_mean']].rename(
+                columns={'employees_count': 'employees', 'avg_salary_mean': 'avg_salary'}
+            ).reset_index()
             
             # Pays avec peu de studios mais salaires bas
             underserved = country_stats[
@@ -390,24 +729,30 @@ class GamingStudioProcessor:
                 (country_stats['avg_salary'] < country_stats['avg_salary'].median())
             ]
             
-            opportunities['underserved_regions'] = underserved.to_dict('records')
+            opportunities['underserved_regions'] = _df_to_records(underserved)
         
         # Opportunités d'arbitrage talent
         if 'retention_rate' in studios_df.columns and 'avg_salary' in studios_df.columns:
-            # Studios avec haute rétention mais salaires relativement bas
-            talent_arbitrage = studios_df[
-                (studios_df['retention_rate'] > studios_df['retention_rate'].quantile(0.75)) &
-                (studios_df['avg_salary'] < studios_df['avg_salary'].median())
-            ]
+            # Studios avec haute rétention mais salaires relativement bas (masques NumPy, une projection)
+            retention = studios_df['retention_rate'].to_numpy(dtype=float, na_value=np.nan)
+            salaries = studios_df['avg_salary'].to_numpy(dtype=float, na_value=np.nan)
+            arbitrage_idx = np.flatnonzero(
+                (retention > derived['quantiles'].at[0.75, 'retention_rate']) &
+                (salaries < derived['quantiles'].at[0.50, 'avg_salary'])
+            )
             
-            if not talent_arbitrage.empty:
-                opportunities['talent_arbitrage'] = talent_arbitrage[['name', 'country', 'retention_rate', 'avg_salary']].to_dict('records') if 'name' in talent_arbitrage.columns else []
+            if arbitrage_idx.size:
+                opportunities['talent_arbitrage'] = _df_to_records(studios_df.iloc[arbitrage_idx][['name', 'country', 'retention_rate', 'avg_salary']]) if 'name' in studios_df.columns else []
         
         return opportunities
     
-    def _assess_studio_risks(self, studios_df: pd.DataFrame) -> Dict[str, Any]:
+    def _assess_studio_risks(self, studios_df: pd.DataFrame,
+                             derived: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Évalue les risques des studios"""
         
+        if derived is None:
+            derived = self._derive_studio_metrics(studios_df)
+        
         risk_assessment = {
             'high_risk_studios': [],
             'risk_factors': {},
@@ -419,23 +764,27 @@ class GamingStudioProcessor:
         risk_criteria = []
         
         if 'retention_rate' in studios_df.columns:
-            risk_criteria.append(studios_df['retention_rate'] < 70)
+            retention = studios_df['retention_rate'].to_numpy(dtype=float, na_value=np.nan)
+            risk_criteria.append(retention < 70)
         
         if 'avg_salary' in studios_df.columns:
-            low_salary_threshold = studios_df['avg_salary'].quantile(0.25)
-            risk_criteria.append(studios_df['avg_salary'] < low_salary_threshold)
+            salaries = studios_df['avg_salary'].to_numpy(dtype=float, na_value=np.nan)
+            low_salary_threshold = derived['quantiles'].at[0.25, 'avg_salary']
+            risk_criteria.append(salaries < low_salary_threshold)
         
-        if 'revenue_per_employee' in studios_df.columns:
-            low_efficiency_threshold = studios_df['revenue_per_employee'].quantile(0.25)
-            risk_criteria.append(studios_df['revenue_per_employee'] < low_efficiency_threshold)
+        if 'revenue_per_employee' in derived:
+            revenue_per_employee = derived['revenue_per_employee']
+            low_efficiency_threshold = np.nanquantile(revenue_per_employee, 0.25)
+            risk_criteria.append(revenue_per_employee < low_efficiency_threshold)
         
         if risk_criteria:
-            # Studios avec au moins 2 facteurs de risque
-            high_risk_mask = sum(risk_criteria) >= 2
+            # Studios avec au moins 2 facteurs de risque (une réduction sur la pile de masques)
+            risk_count = np.add.reduce(np.vstack(risk_criteria).astype(np.uint8), axis=0)
+            high_risk_mask = risk_count >= 2
             high_risk_studios = studios_df[high_risk_mask]
             
             if not high_risk_studios.empty:
-                risk_assessment['high_risk_studios'] = high_risk_studios[['name', 'country', 'employees']].to_dict('records') if 'name' in high_risk_studios.columns else []
+                risk_assessment['high_risk_studios'] = _df_to_records(high_risk_studios[['name', 'country', 'employees']]) if 'name' in high_risk_studios.columns else []
         
         # Facteurs de risque industrie
         risk_assessment['industry_risks'] = {
@@ -447,9 +796,13 @@ class GamingStudioProcessor:
         
         return risk_assessment
     
-    def _generate_benchmarking_data(self, studios_df: pd.DataFrame) -> Dict[str, Any]:
+    def _generate_benchmarking_data(self, studios_df: pd.DataFrame,
+                                    derived: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Génère des données de benchmarking"""
         
+        if derived is None:
+            derived = self._derive_studio_metrics(studios_df)
+        
         benchmarks = {
             'percentiles': {},
             'industry_standards': {},
@@ -457,18 +810,13 @@ class GamingStudioProcessor:
             'performance_targets': {}
         }
         
-        # Percentiles pour métriques clés
-        metrics_to_benchmark = ['employees', 'avg_salary', 'retention_rate', 'revenue_usd']
-        
-        for metric in metrics_to_benchmark:
-            if metric in studios_df.columns:
-                benchmarks['percentiles'][metric] = {
-                    'p10': studios_df[metric].quantile(0.10),
-                    'p25': studios_df[metric].quantile(0.25),
-                    'p50': studios_df[metric].quantile(0.50),
-                    'p75': studios_df[metric].quantile(0.75),
-                    'p90': studios_df[metric].quantile(0.90)
-                }
+        # Percentiles pour métriques clés (issus du cache de quantiles)
+        if 'quantiles' in derived:
+            percentile_labels = dict(zip(STUDIO_QUANTILES, ['p10', 'p25', 'p50', 'p75', 'p90']))
+            metric_quantiles = derived['quantiles'].rename(index=percentile_labels)
+            benchmarks['percentiles'] = {
+                metric: metric_quantiles[metric].to_dict() for metric in metric_quantiles.columns
+            }
         
         # Standards industrie
         benchmarks['industry_standards'] = {
@@ -481,38 +829,52 @@ class GamingStudioProcessor:
         
         return benchmarks
     
-    def _calculate_herfindahl_index(self, df: pd.DataFrame, column: str) -> float:
-        """Calcule l'indice Herfindahl pour mesurer la concentration"""
+    def _calculate_herfindahl_index(self, df: pd.DataFrame, column: str,
+                                    group_totals: Optional[pd.Series] = None) -> float:
+        """Calcule l'indice Herfindahl pour mesurer la concentration
+        
+        group_totals: effectifs par groupe déjà agrégés par l'appelant (évite un groupby)
+        """
         if column not in df.columns:
             return 0
         
         # Calcul des parts de marché
         total = df['employees'].sum() if 'employees' in df.columns else len(df)
-        market_shares = df.groupby(column)['employees'].sum() / total if 'employees' in df.columns else df.groupby(column).size() / len(df)
-        
-        # Indice Herfindahl = somme des carrés des parts de marché
-        hhi = (market_shares ** 2).sum()
+        if group_totals is not None:
+            market_shares = group_totals / total
+            
+            # Indice Herfindahl = somme des carrés des parts de marché
+            hhi = (market_shares ** 2).sum()
+            return round(hhi, 4)
+        
+        if total == 0:
+            return np.nan
+        
+        # Sans agrégat fourni: sommes par groupe sur les codes de catégorie (noyau compilé)
+        groups = df[column].astype('category')
+        codes = groups.cat.codes.to_numpy().astype(np.int64)
+        weights = (
+            np.nan_to_num(df['employees'].to_numpy(dtype=float, na_value=np.nan)) if 'employees' in df.columns
+            else np.ones(len(df))
+        )
+        hhi = _hhi_kernel(codes, weights, len(groups.cat.categories))
         return round(hhi, 4)
     
     def _calculate_top_percentile_share(self, df: pd.DataFrame, column: str, percentile: float) -> float:
-        """Calcule la part du top percentile"""
+        """Calcule la part détenue par le top percentile"""
         if column not in df.columns:
             return 0
         
-        threshold = df[column].quantile(1 - percentile)
-        top_percentile_sum = df[df[column] >= threshold][column].sum()
-        total_sum = df[column].sum()
-        
-        return round((top_percentile_sum / total_sum * 100), 2) if total_sum > 0 else 0
-    
-    def _calculate_top_percentile_share(self, df: pd.DataFrame, column: str, percentile: float) -> float:
-        """Calcule la part détenue par le top percentile"""
-        if column not in df.columns or df[column].sum() == 0:
+        values = df[column].dropna().to_numpy(dtype=float)
+        total_sum = values.sum()
+        if total_sum == 0:
             return 0
         
-        threshold = df[column].quantile(1 - percentile)
-        top_percentile_sum = df[df[column] >= threshold][column].sum()
-        total_sum = df[column].sum()
+        # Somme partielle des k plus grandes valeurs: une partition O(N), sans seuil ni masque
+        k = max(1, int(np.ceil(values.size * percentile)))
+        if k >= values.size:
+            return 100.0
+        top_percentile_sum = values[np.argpartition(values, -k)[-k:]].sum()
         
         return round((top_percentile_sum / total_sum * 100), 2)
     
@@ -522,34 +884,40 @@ class GamingStudioProcessor:
         if not analysis_results or analysis_results.get('status') == 'no_data':
             return pd.DataFrame()
         
-        # Extraction des données principales pour export
-        export_data = []
+        # Extraction des données principales pour export (tuples, noms de colonnes fixés une fois)
+        export_columns = [
+            'metric_type', 'category', 'studios_count', 'total_employees',
+            'avg_salary', 'avg_retention', 'avg_employees'
+        ]
+        export_rows = []
         
         # Données géographiques
         geo_data = analysis_results.get('geographic_analysis', {})
         for country, stats in geo_data.get('by_country', {}).items():
-            export_data.append({
-                'metric_type': 'geographic',
-                'category': country,
-                'studios_count': stats.get('employees_count', 0),
-                'total_employees': stats.get('employees_sum', 0),
-                'avg_salary': stats.get('avg_salary_mean', 0),
-                'avg_retention': stats.get('retention_rate_mean', 0)
-            })
+            export_rows.append((
+                'geographic',
+                country,
+                stats.get('employees_count', 0),
+                stats.get('employees_sum', 0),
+                stats.get('avg_salary_mean', 0),
+                stats.get('retention_rate_mean', 0),
+                np.nan
+            ))
         
         # Données par taille
         size_data = analysis_results.get('size_categorization', {})
         for category, stats in size_data.get('categories', {}).items():
-            export_data.append({
-                'metric_type': 'size_category', 
-                'category': category,
-                'studios_count': stats.get('employees_count', 0),
-                'avg_employees': stats.get('employees_mean', 0),
-                'avg_salary': stats.get('avg_salary_mean', 0),
-                'avg_retention': stats.get('retention_rate_mean', 0)
-            })
-        
-        df_export = pd.DataFrame(export_data)
+            export_rows.append((
+                'size_category',
+                category,
+                stats.get('employees_count', 0),
+                np.nan,
+                stats.get('avg_salary_mean', 0),
+                stats.get('retention_rate_mean', 0),
+                stats.get('employees_mean', 0)
+            ))
+        
+        df_export = pd.DataFrame.from_records(export_rows, columns=export_columns)
         df_export['analysis_timestamp'] = analysis_results.get('timestamp')
         
         return df_export
@@ -6,20 +6,194 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Any, Optional
 import logging
+import sys
 from datetime import datetime, timedelta
 import re
+from pathlib import Path
 from dataclasses import dataclass
 
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+# PyArrow (optionnel): profil des colonnes objet calculé sur buffers Arrow
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+    ARROW_AVAILABLE = True
+except ImportError:
+    ARROW_AVAILABLE = False
+
+# Numba (optionnel): noyaux de comptage compilés
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# numexpr (optionnel): contrôles de plage fusionnés en une passe, sans temporaires
+try:
+    import numexpr
+    NUMEXPR_AVAILABLE = True
+except ImportError:
+    NUMEXPR_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Colonnes à faible cardinalité comparées à des ensembles finis (règles gaming):
+# validées sur des codes catégoriels plutôt que sur des chaînes Python
+CATEGORY_LIKE_COLUMNS = ('department', 'experience_level', 'region')
+
+# Colonnes examinées par le contrôle de cohérence (hors colonnes de dates)
+CONSISTENCY_COLUMNS = ('salary_usd', 'bonus_usd', 'experience_level', 'role', 'department')
+
+# Lignes échantillonnées par colonne objet pour estimer l'empreinte mémoire du profil
+PROFILE_MEMORY_SAMPLE_ROWS = 1000
+
+# Niveaux d'expérience du moins au plus senior (cohérence des salaires médians)
+EXPERIENCE_LEVEL_ORDER = ('Intern', 'Junior', 'Mid', 'Senior', 'Lead', 'Principal', 'Director')
+
+# Paires (début, fin) de colonnes de dates dont l'ordre est contrôlé
+DATE_SEQUENCE_PAIRS = (
+    ('created_at', 'updated_at'),
+    ('created_date', 'updated_date'),
+    ('hire_date', 'termination_date'),
+    ('start_date', 'end_date')
+)
+
+# Dates antérieures à ce seuil considérées comme incohérentes (valeurs par défaut, epoch)
+MIN_PLAUSIBLE_DATE = pd.Timestamp('1970-01-01')
+
+# En dessous de ce volume, le noyau compilé (warm-up JIT) ne bat pas NumPy
+RANGE_KERNEL_MIN_ROWS = 10_000
+
+# Patterns de validation compilés une fois par processus, partagés par les validateurs
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+# URL sans ambiguïté entre classes successives (hôte, port, chemin, requête, fragment):
+# chaque caractère n'admet qu'une transition, la regex s'évalue sans retour arrière
+_URL_RE = re.compile(r'^https?://[-\w.]+(?::[:\d]*)?(?:/[\w/.]*(?:\?[\w&=%.]*)?(?:#[\w.]*)?)?$')
+
+
+def _parquet_pandas_dtypes(path: str, null_counts: pd.Series) -> Optional[Dict[str, str]]:
+    """Types pandas des colonnes d'un fichier Parquet, tels que pd.read_parquet les produirait
+    
+    Seul le schéma est lu; les entiers et booléens avec valeurs manquantes deviennent
+    float64/object comme à la conversion pandas. None sans pyarrow.
+    """
+    if not ARROW_AVAILABLE:
+        return None
+    
+    dtypes = pq.read_schema(path).empty_table().to_pandas().dtypes
+    column_types = {}
+    for col, dtype in dtypes.items():
+        has_nulls = null_counts.get(col, 0) > 0
+        if has_nulls and dtype.kind in 'iu':
+            column_types[col] = 'float64'
+        elif has_nulls and dtype.kind == 'b':
+            column_types[col] = 'object'
+        else:
+            column_types[col] = str(dtype)
+    return column_types
+
+
+def _arrow_object_profile(series: pd.Series, top_n: int = 5) -> Optional[Tuple[int, Dict[Any, int]]]:
+    """Nombre de valeurs distinctes et valeurs les plus fréquentes d'une colonne objet via Arrow
+    
+    Même résultat que nunique() et value_counts().head(top_n), valeurs manquantes exclues;
+    None si la colonne n'est pas convertible.
+    """
+    try:
+        array = pa.array(series, from_pandas=True)
+        counts = pc.value_counts(array)
+    except (pa.ArrowException, TypeError, ValueError):
+        return None
+    
+    values = counts.field('values')
+    frequencies = counts.field('counts').to_numpy(zero_copy_only=False)
+    valid = values.is_valid().to_numpy(zero_copy_only=False)
+    values, frequencies = values.filter(pa.array(valid)), frequencies[valid]
+    
+    # Tri identique à value_counts (valeurs dans l'ordre de première apparition)
+    top_values = pd.Series(frequencies, index=values.to_pylist()).sort_values(ascending=False).head(top_n)
+    return len(frequencies), top_values.to_dict()
+
+
+def _numeric_values(series: pd.Series) -> np.ndarray:
+    """Valeurs d'une colonne numérique en tableau NumPy (NaN pour les manquants)"""
+    if series.dtype.kind in 'iuf':
+        return series.to_numpy()
+    return series.to_numpy(dtype='float64', na_value=np.nan)
+
+
+def _count_outside_numpy(values: np.ndarray, low: float, high: float) -> int:
+    """Comptage hors plage vectorisé NumPy (fallback sans Numba ni numexpr)"""
+    return int(np.count_nonzero((values < low) | (values > high)))
+
+
+def _count_outside_numexpr(values: np.ndarray, low: float, high: float) -> int:
+    """Comptage hors plage en une seule expression numexpr (fallback sans Numba)"""
+    outside = numexpr.evaluate(
+        "(values < low) | (values > high)",
+        local_dict={'values': values, 'low': low, 'high': high}
+    )
+    return int(np.count_nonzero(outside))
+
+
+if NUMBA_AVAILABLE:
+    # Pas de fastmath: il suppose l'absence de NaN, qui doivent rester hors du comptage.
+    # Pas de parallel=True: une passe séquentielle suffit, et le pool de threads de Numba
+    # n'accepte pas les lancements concurrents (workqueue) ni l'arrêt propre depuis
+    # des threads appelants (TBB)
+    @njit(cache=True)
+    def _count_outside_compiled(values, low, high):
+        """Comptage hors plage: réduction en une boucle, sans masque intermédiaire"""
+        count = 0
+        for i in range(values.shape[0]):
+            value = values[i]
+            if value < low or value > high:
+                count += 1
+        return count
+    
+    def _count_outside_kernel(values: np.ndarray, low: float, high: float) -> int:
+        """Comptage hors plage par le noyau compilé (valeurs converties en float64)"""
+        return int(_count_outside_compiled(values.astype(np.float64, copy=False), low, high))
+elif NUMEXPR_AVAILABLE:
+    _count_outside_kernel = _count_outside_numexpr
+else:
+    _count_outside_kernel = _count_outside_numpy
+
+
+def _count_outside_range(series: pd.Series, low: float, high: float) -> int:
+    """Nombre de valeurs strictement hors de [low, high] (NaN exclus par les comparaisons)"""
+    values = _numeric_values(series)
+    count_function = _count_outside_kernel if len(values) >= RANGE_KERNEL_MIN_ROWS else _count_outside_numpy
+    return count_function(values, low, high)
+
 @dataclass
 class DataQualityMetric:
-    """Métrique de qualité des données"""
+    """Métrique de qualité des données
+    
+    __slots__ déclarés explicitement (dataclass(slots=True) exige Python 3.10):
+    pas de __dict__ par instance.
+    """
+    __slots__ = ('name', 'score', 'status', 'details', 'recommendations')
+    
     name: str
     score: float  # 0-100
     status: str   # 'excellent', 'good', 'warning', 'critical'
     details: str
-    recommendations: List[str]
+    recommendations: List[str]  # dédoublonnées lors de la consolidation
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Représentation publiée dans le résultat de validation (score arrondi)"""
+        return {
+            'name': self.name,
+            'score': round(self.score, 2),
+            'status': self.status,
+            'details': self.details
+        }
 
 class DataQualityValidator:
     """Validateur de qualité des données gaming avec scoring avancé"""
@@ -33,25 +207,71 @@ class DataQualityValidator:
         }
         
         # Patterns de validation
-        self.email_pattern = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
-        self.url_pattern = re.compile(r'^https?://(?:[-\w.])+(?:[:\d]+)?(?:/(?:[\w/_.])*(?:\?(?:[\w&=%.])*)?(?:#(?:[\w.])*)?)?$')
+        self.email_pattern = _EMAIL_RE
+        self.url_pattern = _URL_RE
         
-        # Valeurs gaming spécifiques valides
-        self.valid_departments = {
+        # Valeurs gaming spécifiques valides (ensembles figés, partagés en lecture par les contrôles)
+        self.valid_departments = frozenset({
             'Programming', 'Art & Animation', 'Game Design', 'Quality Assurance',
             'Production', 'Audio', 'Marketing', 'Management', 'Other'
-        }
+        })
         
-        self.valid_experience_levels = {
-            'Intern', 'Junior', 'Mid', 'Senior', 'Lead', 'Principal', 'Director'
-        }
+        self.valid_experience_levels = frozenset(EXPERIENCE_LEVEL_ORDER)
         
-        self.valid_regions = {
+        self.valid_regions = frozenset({
             'North America', 'Europe', 'Asia-Pacific', 'Latin America', 'Africa', 'Remote'
+        })
+        
+        # Département attendu par rôle (rôle en minuscules)
+        self.role_dept_map = {
+            # Programming
+            'software engineer': 'Programming',
+            'game programmer': 'Programming',
+            'gameplay programmer': 'Programming',
+            'engine programmer': 'Programming',
+            'graphics programmer': 'Programming',
+            'technical lead': 'Programming',
+            
+            # Art & Animation
+            '3d artist': 'Art & Animation',
+            'character artist': 'Art & Animation',
+            'environment artist': 'Art & Animation',
+            'concept artist': 'Art & Animation',
+            'technical artist': 'Art & Animation',
+            'animator': 'Art & Animation',
+            
+            # Game Design
+            'game designer': 'Game Design',
+            'level designer': 'Game Design',
+            'narrative designer': 'Game Design',
+            'systems designer': 'Game Design',
+            
+            # QA
+            'qa tester': 'Quality Assurance',
+            'qa analyst': 'Quality Assurance',
+            'test engineer': 'Quality Assurance',
+            
+            # Production
+            'producer': 'Production',
+            'project manager': 'Production',
+            'product manager': 'Production',
+            
+            # Audio
+            'sound designer': 'Audio',
+            'audio engineer': 'Audio',
+            'composer': 'Audio',
+            
+            # Marketing
+            'community manager': 'Marketing',
+            'marketing manager': 'Marketing'
         }
     
-    def validate_dataset(self, df: pd.DataFrame, dataset_name: str = "gaming_data") -> Dict[str, Any]:
-        """Validation complète d'un dataset gaming"""
+    def validate_dataset(self, df: pd.DataFrame, dataset_name: str = "gaming_data",
+                         fast: bool = False) -> Dict[str, Any]:
+        """Validation complète d'un dataset gaming
+        
+        fast: omet le profil des données (usage interactif); 'data_profile' vaut alors None.
+        """
         if df.empty:
             return {
                 'dataset_name': dataset_name,
@@ -62,58 +282,276 @@ class DataQualityValidator:
                 'summary': 'Dataset is empty'
             }
         
-        metrics = []
+        # Valeurs manquantes par colonne: un seul passage sur le masque, partagé
+        null_counts = df.isnull().sum()
+        
+        # Catalogue des colonnes par type et par rôle, partagé par les contrôles
+        catalog = self._build_column_catalog(df)
+        
+        # Complétude d'abord: sous le seuil critique, les autres contrôles seraient dominés
+        # par les valeurs manquantes et le verdict est rendu sans les exécuter
+        completeness = self._check_completeness(df, null_counts)
+        if completeness.score < self.quality_thresholds['critical']:
+            logger.warning(
+                f"Completeness of {dataset_name} is {completeness.score:.1f}%, skipping remaining quality checks"
+            )
+            result = self._build_validation_result(
+                dataset_name, len(df), [completeness],
+                None if fast else self._generate_data_profile(df, null_counts, catalog)
+            )
+            result['summary'] = 'Validation stopped early: completeness below critical threshold'
+            return result
+        
+        # Contrôles sur une vue où les colonnes catégorielles sont codées;
+        # le profil reste calculé sur les types d'origine
+        checked_df = self._with_categorical_columns(df)
+        
+        # Autres métriques, exécutées à la suite: regex et hash de lignes gardent le GIL,
+        # un pool de threads n'apportait aucun gain mesurable
+        metrics = [
+            completeness,
+            self._check_consistency(checked_df, catalog),
+            self._check_validity(checked_df, catalog),
+            self._check_uniqueness(checked_df, catalog),
+            self._check_timeliness(checked_df, catalog),
+            self._check_gaming_specific_rules(checked_df)
+        ]
+        
+        return self._build_validation_result(
+            dataset_name, len(df), metrics,
+            None if fast else self._generate_data_profile(df, null_counts, catalog)
+        )
+    
+    def validate_dataset_lazy(self, df: pd.DataFrame, dataset_name: str = "gaming_data") -> Dict[str, Any]:
+        """Variante polars de validate_dataset: comptages collectés en un seul plan
+        
+        Valeurs manquantes, formats (emails, URLs, plages de salaires), doublons et règles
+        gaming sont réduits par une unique requête polars; cohérence, fraîcheur et profil
+        restent calculés par pandas.
+        """
+        if pl is None:
+            logger.warning("polars not installed, using pandas data quality validation")
+            return self.validate_dataset(df, dataset_name)
+        
+        if df.empty:
+            return self.validate_dataset(df, dataset_name)
+        
+        catalog = self._build_column_catalog(df)
+        
+        try:
+            counts = self._collect_quality_counts(df, catalog)
+        except (TypeError, ValueError, pl.exceptions.PolarsError) as e:
+            logger.warning(f"polars validation failed ({e}), using pandas data quality validation")
+            return self.validate_dataset(df, dataset_name)
+        
+        n_rows = len(df)
+        null_counts = pd.Series(counts['null_counts'], index=df.columns, dtype='int64')
+        
+        metrics = [
+            self._completeness_metric(null_counts, n_rows),
+            self._check_consistency(df, catalog),
+            self._validity_metric(counts['invalid_by_kind'], counts['total_validations']),
+            self._uniqueness_metric(counts['column_duplicates'], counts['full_duplicates'], n_rows),
+            self._check_timeliness(df, catalog),
+            self._gaming_rules_metric(counts['gaming'])
+        ]
+        
+        return self._build_validation_result(
+            dataset_name, n_rows, metrics, self._generate_data_profile(df, null_counts, catalog)
+        )
+    
+    def validate_parquet(self, path: str, dataset_name: Optional[str] = None) -> Dict[str, Any]:
+        """Validation d'un fichier Parquet sans le charger entièrement en mémoire
+        
+        Les comptages sont réduits par polars sur un scan paresseux du fichier (seules les
+        colonnes utilisées sont lues); cohérence et fraîcheur ne chargent que les colonnes
+        qu'elles examinent. Le profil se limite aux types (noms pandas), valeurs manquantes
+        et distinctes.
+        """
+        dataset_name = dataset_name or Path(path).stem
+        
+        if pl is None:
+            logger.warning("polars not installed, loading Parquet file with pandas")
+            return self.validate_dataset(pd.read_parquet(path), dataset_name)
+        
+        lf = pl.scan_parquet(path)
+        schema = lf.collect_schema()
+        columns = schema.names()
+        catalog = self._build_schema_catalog(schema)
+        
+        counts = self._collect_lazy_quality_counts(lf, schema, catalog, profile=True)
+        n_rows = counts['n_rows']
+        if n_rows == 0:
+            return self.validate_dataset(pd.DataFrame(columns=columns), dataset_name)
+        
+        # Cohérence et fraîcheur: seules leurs colonnes sont chargées (dates en ns comme pandas)
+        checked_columns = [
+            pl.col(col).dt.cast_time_unit('ns') if col in catalog['datetime'] else pl.col(col)
+            for col in columns
+            if col in CONSISTENCY_COLUMNS or col in catalog['datetime'] or col in catalog['timestamp']
+        ]
+        checked_df = lf.select(checked_columns).collect().to_pandas() if checked_columns else pd.DataFrame()
+        checked_catalog = self._build_column_catalog(checked_df)
+        
+        null_counts = pd.Series(counts['null_counts'], index=columns, dtype='int64')
+        
+        metrics = [
+            self._completeness_metric(null_counts, n_rows),
+            self._check_consistency(checked_df, checked_catalog),
+            self._validity_metric(counts['invalid_by_kind'], counts['total_validations']),
+            self._uniqueness_metric(counts['column_duplicates'], counts['full_duplicates'], n_rows),
+            self._check_timeliness(checked_df, checked_catalog),
+            self._gaming_rules_metric(counts['gaming'])
+        ]
+        
+        data_profile = {
+            'shape': (n_rows, len(columns)),
+            'missing_values': null_counts.to_dict(),
+            'unique_values': counts['unique_values']
+        }
+        # Noms de types pandas (comme validate_dataset), pas ceux de polars
+        column_types = _parquet_pandas_dtypes(path, null_counts)
+        if column_types is not None:
+            data_profile['column_types'] = column_types
+        
+        return self._build_validation_result(dataset_name, n_rows, metrics, data_profile)
+    
+    def _collect_quality_counts(self, df: pd.DataFrame, catalog: Optional[Dict[str, List[str]]] = None) -> Dict[str, Any]:
+        """Calcule en une requête polars les comptages utilisés par les métriques"""
+        if catalog is None:
+            catalog = self._build_column_catalog(df)
+        
+        pl_df = pl.from_pandas(df)
+        return self._collect_lazy_quality_counts(pl_df.lazy(), pl_df.schema, catalog)
+    
+    def _collect_lazy_quality_counts(self, lf: 'pl.LazyFrame', schema: 'pl.Schema',
+                                     catalog: Dict[str, List[str]],
+                                     profile: bool = False) -> Dict[str, Any]:
+        """Comptages des métriques réduits en une seule requête sur un plan polars
+        
+        profile: ajoute le nombre de lignes et de valeurs distinctes par colonne.
+        """
+        columns = schema.names()
+        
+        def values(col: str) -> 'pl.Expr':
+            # NaN traités comme manquants, comme dans pandas
+            return pl.col(col).fill_nan(None) if schema[col].is_float() else pl.col(col)
+        
+        exprs = [values(col).null_count().alias(f'null__{i}') for i, col in enumerate(columns)]
+        if profile:
+            exprs.append(pl.len().alias('n_rows'))
+            exprs.extend(values(col).drop_nulls().n_unique().alias(f'distinct__{i}') for i, col in enumerate(columns))
         
-        # Métriques de base
-        metrics.append(self._check_completeness(df))
-        metrics.append(self._check_consistency(df))
-        metrics.append(self._check_validity(df))
-        metrics.append(self._check_uniqueness(df))
-        metrics.append(self._check_timeliness(df))
-        metrics.append(self._check_gaming_specific_rules(df))
+        # Validité: (type, colonne, expression d'invalidité)
+        validity_checks = []
+        if 'email' in columns:
+            validity_checks.append(('invalid_email', 'email', pl.col('email').cast(pl.Utf8)
+                                    .str.contains(self.email_pattern.pattern).not_()))
+        for col in catalog['url']:
+            validity_checks.append(('invalid_url', col, pl.col(col).cast(pl.Utf8)
+                                    .str.contains(self.url_pattern.pattern).not_()))
+        for col in catalog['numeric']:
+            if 'salary' in col.lower():
+                validity_checks.append(('invalid_salary_range', col,
+                                        (values(col) < 0) | (values(col) > 1000000)))
+        for i, (_, col, invalid) in enumerate(validity_checks):
+            exprs.append(values(col).count().alias(f'checked__{i}'))
+            exprs.append(invalid.sum().alias(f'invalid__{i}'))
+        
+        unique_columns = catalog['id']
+        for i, col in enumerate(unique_columns):
+            exprs.append((values(col).count() - values(col).drop_nulls().n_unique()).alias(f'dup__{i}'))
+        exprs.append((pl.len() - pl.struct(pl.all()).n_unique()).alias('full_duplicates'))
+        
+        # Règles gaming (les valeurs manquantes ne comptent pas comme invalides)
+        gaming_checks = []
+        if 'department' in columns:
+            gaming_checks.append(('Invalid departments', pl.col('department').cast(pl.Utf8)
+                                  .is_in(list(self.valid_departments)).not_()))
+        if 'experience_level' in columns:
+            gaming_checks.append(('Invalid experience levels', pl.col('experience_level').cast(pl.Utf8)
+                                  .is_in(list(self.valid_experience_levels)).not_()))
+        if 'salary_usd' in columns and schema['salary_usd'].is_numeric():
+            gaming_checks.append(('Unrealistic gaming salaries',
+                                  (values('salary_usd') < 30000) | (values('salary_usd') > 500000)))
+        if 'role' in columns and 'department' in columns:
+            expected = pl.col('role').cast(pl.Utf8).str.to_lowercase().replace_strict(
+                self.role_dept_map, default=None, return_dtype=pl.Utf8
+            )
+            department = pl.col('department').cast(pl.Utf8)
+            gaming_checks.append(('Role-department mismatches',
+                                  expected.is_not_null() & department.is_not_null() & (expected != department)))
+        for i, (_, invalid) in enumerate(gaming_checks):
+            exprs.append(invalid.sum().alias(f'gaming__{i}'))
+        
+        row = lf.select(exprs).collect().row(0, named=True)
         
+        invalid_by_kind: Dict[str, int] = {}
+        total_validations = 0
+        for i, (kind, _, _) in enumerate(validity_checks):
+            total_validations += row[f'checked__{i}']
+            invalid_by_kind[kind] = invalid_by_kind.get(kind, 0) + row[f'invalid__{i}']
+        
+        counts = {
+            'null_counts': [row[f'null__{i}'] for i in range(len(columns))],
+            'invalid_by_kind': invalid_by_kind,
+            'total_validations': total_validations,
+            'column_duplicates': {col: row[f'dup__{i}'] for i, col in enumerate(unique_columns)},
+            'full_duplicates': row['full_duplicates'],
+            'gaming': {rule: row[f'gaming__{i}'] for i, (rule, _) in enumerate(gaming_checks)}
+        }
+        if profile:
+            counts['n_rows'] = row['n_rows']
+            counts['unique_values'] = {col: row[f'distinct__{i}'] for i, col in enumerate(columns)}
+        return counts
+    
+    def _build_validation_result(self, dataset_name: str, n_rows: int,
+                                 metrics: List[DataQualityMetric],
+                                 data_profile: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Assemble le résultat de validation à partir des métriques calculées"""
         # Score global
         overall_score = np.mean([m.score for m in metrics])
         overall_status = self._score_to_status(overall_score)
         
-        # Recommandations consolidées
-        all_recommendations = []
+        # Recommandations consolidées: dédoublonnées à l'insertion, triées pour un résultat reproductible
+        all_recommendations = set()
         for metric in metrics:
-            all_recommendations.extend(metric.recommendations)
+            all_recommendations.update(metric.recommendations)
         
         result = {
             'dataset_name': dataset_name,
             'overall_score': round(overall_score, 2),
             'status': overall_status,
-            'total_records': len(df),
+            'total_records': n_rows,
             'timestamp': datetime.now().isoformat(),
-            'metrics': [
-                {
-                    'name': m.name,
-                    'score': round(m.score, 2),
-                    'status': m.status,
-                    'details': m.details
-                } for m in metrics
-            ],
-            'recommendations': list(set(all_recommendations)),
-            'data_profile': self._generate_data_profile(df)
+            'metrics': [m.to_dict() for m in metrics],
+            'recommendations': sorted(all_recommendations),
+            'data_profile': data_profile
         }
         
         logger.info(f"Data quality validation completed for {dataset_name}: {overall_score:.1f}% ({overall_status})")
         
         return result
     
-    def _check_completeness(self, df: pd.DataFrame) -> DataQualityMetric:
-        """Vérifie la complétude des données"""
-        total_cells = df.size
-        missing_cells = df.isnull().sum().sum()
+    def _check_completeness(self, df: pd.DataFrame,
+                            null_counts: Optional[pd.Series] = None) -> DataQualityMetric:
+        """Vérifie la complétude des données
+        
+        null_counts: valeurs manquantes par colonne déjà calculées par l'appelant
+        """
+        missing_by_column = df.isnull().sum() if null_counts is None else null_counts
+        return self._completeness_metric(missing_by_column, len(df))
+    
+    def _completeness_metric(self, missing_by_column: pd.Series, n_rows: int) -> DataQualityMetric:
+        """Construit la métrique de complétude à partir des valeurs manquantes par colonne"""
+        total_cells = n_rows * len(missing_by_column)
+        missing_cells = int(missing_by_column.sum())
         completeness_rate = ((total_cells - missing_cells) / total_cells) * 100
         
         status = self._score_to_status(completeness_rate)
         
         # Analyse par colonne
-        missing_by_column = df.isnull().sum()
-        high_missing_columns = missing_by_column[missing_by_column > len(df) * 0.2].index.tolist()
+        high_missing_columns = missing_by_column[missing_by_column > n_rows * 0.2].index.tolist()
         
         details = f"Overall completeness: {completeness_rate:.1f}%. Missing values: {missing_cells:,} out of {total_cells:,} cells."
         
@@ -133,26 +571,52 @@ class DataQualityValidator:
             recommendations=recommendations
         )
     
-    def _check_consistency(self, df: pd.DataFrame) -> DataQualityMetric:
+    def _check_consistency(self, df: pd.DataFrame, catalog: Optional[Dict[str, List[str]]] = None) -> DataQualityMetric:
         """Vérifie la cohérence des données"""
+        if catalog is None:
+            catalog = self._build_column_catalog(df)
+        
         consistency_issues = []
         consistency_score = 100
         
         # Cohérence des salaires
         if 'salary_usd' in df.columns:
-            salary_issues = self._check_salary_consistency(df)
-            consistency_issues.extend(salary_issues)
+            salaries = pd.Series(_numeric_values(df['salary_usd']), index=df.index)
+            
+            # Bonus supérieur au salaire de base
+            if 'bonus_usd' in df.columns:
+                bonus_above_salary = int(np.count_nonzero(_numeric_values(df['bonus_usd']) > salaries.to_numpy()))
+                if bonus_above_salary > 0:
+                    consistency_issues.append(f"Bonus exceeds base salary: {bonus_above_salary} records")
+            
+            # Salaire médian décroissant avec la séniorité
+            if 'experience_level' in df.columns:
+                medians = salaries.groupby(df['experience_level'], observed=True).median()
+                medians = medians.reindex(list(EXPERIENCE_LEVEL_ORDER)).dropna()
+                inversions = medians.index[1:][medians.to_numpy()[1:] < medians.to_numpy()[:-1]]
+                for level in inversions:
+                    previous_level = medians.index[medians.index.get_loc(level) - 1]
+                    consistency_issues.append(f"Median salary of {level} below {previous_level}")
         
         # Cohérence des dates
-        date_columns = df.select_dtypes(include=['datetime64']).columns
-        for col in date_columns:
-            date_issues = self._check_date_consistency(df, col)
-            consistency_issues.extend(date_issues)
+        datetime_columns = set(catalog['datetime'])
+        for col in catalog['datetime']:
+            implausible_dates = int((df[col] < MIN_PLAUSIBLE_DATE).sum())
+            if implausible_dates > 0:
+                consistency_issues.append(f"{col}: {implausible_dates} dates before {MIN_PLAUSIBLE_DATE.year}")
+        
+        for start_col, end_col in DATE_SEQUENCE_PAIRS:
+            if start_col in datetime_columns and end_col in datetime_columns:
+                reversed_dates = int((df[end_col] < df[start_col]).sum())
+                if reversed_dates > 0:
+                    consistency_issues.append(f"{end_col} before {start_col}: {reversed_dates} records")
         
-        # Cohérence gaming spécifique
+        # Cohérence gaming spécifique: départements dont des rôles relèvent d'un autre département
         if 'department' in df.columns and 'role' in df.columns:
-            role_dept_issues = self._check_role_department_consistency(df)
-            consistency_issues.extend(role_dept_issues)
+            mismatches = self._role_department_mismatches(df)
+            mismatched_departments = df['department'][mismatches].value_counts()
+            for department, count in mismatched_departments[mismatched_departments > 0].items():
+                consistency_issues.append(f"{department}: {count} roles belonging to another department")
         
         # Calcul du score
         if consistency_issues:
@@ -175,46 +639,54 @@ class DataQualityValidator:
             recommendations=recommendations
         )
     
-    def _check_validity(self, df: pd.DataFrame) -> DataQualityMetric:
+    def _check_validity(self, df: pd.DataFrame, catalog: Optional[Dict[str, List[str]]] = None) -> DataQualityMetric:
         """Vérifie la validité des formats et valeurs"""
-        validity_issues = []
+        if catalog is None:
+            catalog = self._build_column_catalog(df)
+        
+        invalid_by_kind: Dict[str, int] = {}
         total_validations = 0
         
-        # Validation des emails
+        # Validation des emails (regex ancrée appliquée par le moteur de chaînes pandas)
         if 'email' in df.columns:
-            email_invalid = df['email'].dropna().apply(
-                lambda x: not bool(self.email_pattern.match(str(x)))
-            ).sum()
-            total_validations += len(df['email'].dropna())
-            validity_issues.extend(['invalid_email'] * email_invalid)
-        
-        # Validation des URLs
-        url_columns = [col for col in df.columns if 'url' in col.lower() or 'website' in col.lower()]
-        for col in url_columns:
-            url_invalid = df[col].dropna().apply(
-                lambda x: not bool(self.url_pattern.match(str(x)))
-            ).sum()
-            total_validations += len(df[col].dropna())
-            validity_issues.extend(['invalid_url'] * url_invalid)
+            emails = df['email'].dropna().astype(str)
+            email_invalid = (~emails.str.fullmatch(self.email_pattern)).sum()
+            total_validations += len(emails)
+            invalid_by_kind['invalid_email'] = email_invalid
+        
+        # Validation des URLs: toutes les colonnes concaténées, un seul passage de la regex
+        url_columns = catalog['url']
+        if url_columns:
+            urls = pd.concat([df[col] for col in url_columns], ignore_index=True).dropna().astype(str)
+            url_invalid = (~urls.str.fullmatch(self.url_pattern)).sum()
+            total_validations += len(urls)
+            invalid_by_kind['invalid_url'] = url_invalid
         
         # Validation des valeurs numériques
-        numeric_columns = df.select_dtypes(include=[np.number]).columns
-        for col in numeric_columns:
+        for col in catalog['numeric']:
             if 'salary' in col.lower():
-                invalid_salaries = ((df[col] < 0) | (df[col] > 1000000)).sum()
+                invalid_salaries = _count_outside_range(df[col], 0.0, 1000000.0)
                 total_validations += len(df[col].dropna())
-                validity_issues.extend(['invalid_salary_range'] * invalid_salaries)
+                invalid_by_kind['invalid_salary_range'] = invalid_by_kind.get('invalid_salary_range', 0) + invalid_salaries
+        
+        return self._validity_metric(invalid_by_kind, total_validations)
+    
+    def _validity_metric(self, invalid_by_kind: Dict[str, int], total_validations: int) -> DataQualityMetric:
+        """Construit la métrique de validité à partir des comptes d'invalides par type"""
+        invalid_count = sum(invalid_by_kind.values())
         
         # Score de validité
         validity_score = 100
         if total_validations > 0:
-            validity_score = max(0, 100 - (len(validity_issues) / total_validations * 100))
+            validity_score = max(0, 100 - (invalid_count / total_validations * 100))
         
         status = self._score_to_status(validity_score)
-        details = f"Validity check: {len(validity_issues)} invalid values out of {total_validations} validated."
+        details = f"Validity check: {invalid_count} invalid values out of {total_validations} validated."
+        if invalid_count > 0:
+            details += " By type: " + ", ".join(f"{kind}={count}" for kind, count in invalid_by_kind.items() if count) + "."
         
         recommendations = []
-        if len(validity_issues) > 0:
+        if invalid_count > 0:
             recommendations.append("Implement input validation at data collection points")
             recommendations.append("Review and correct invalid format values")
         
@@ -226,31 +698,41 @@ class DataQualityValidator:
             recommendations=recommendations
         )
     
-    def _check_uniqueness(self, df: pd.DataFrame) -> DataQualityMetric:
+    def _check_uniqueness(self, df: pd.DataFrame, catalog: Optional[Dict[str, List[str]]] = None) -> DataQualityMetric:
         """Vérifie l'unicité des données"""
-        uniqueness_issues = []
+        if catalog is None:
+            catalog = self._build_column_catalog(df)
+        
+        # Colonnes qui devraient être uniques: valeurs non nulles moins valeurs distinctes
+        unique_columns = catalog['id']
+        column_duplicates = {}
+        if unique_columns:
+            candidates = df[unique_columns]
+            column_duplicates = (candidates.count() - candidates.nunique()).to_dict()
         
-        # Colonnes qui devraient être uniques
-        unique_columns = []
-        for col in df.columns:
-            if any(keyword in col.lower() for keyword in ['id', 'email', 'key']):
-                unique_columns.append(col)
+        # Doublons complets: un hash 64 bits par ligne, calculé colonne par colonne
+        row_hashes = pd.util.hash_pandas_object(df, index=False)
+        full_duplicates = len(row_hashes) - row_hashes.nunique()
         
+        return self._uniqueness_metric(column_duplicates, full_duplicates, len(df))
+    
+    def _uniqueness_metric(self, column_duplicates: Dict[str, int], full_duplicates: int,
+                           n_rows: int) -> DataQualityMetric:
+        """Construit la métrique d'unicité à partir des doublons par colonne et complets"""
+        uniqueness_issues = []
         duplicate_records = 0
-        for col in unique_columns:
-            duplicates = df[col].dropna().duplicated().sum()
+        
+        for col, duplicates in column_duplicates.items():
             if duplicates > 0:
                 uniqueness_issues.append(f"{col}: {duplicates} duplicates")
                 duplicate_records += duplicates
         
-        # Doublons complets
-        full_duplicates = df.duplicated().sum()
         if full_duplicates > 0:
             uniqueness_issues.append(f"Full record duplicates: {full_duplicates}")
             duplicate_records += full_duplicates
         
         # Score d'unicité
-        uniqueness_score = max(0, 100 - (duplicate_records / len(df) * 100))
+        uniqueness_score = max(0, 100 - (duplicate_records / n_rows * 100))
         
         status = self._score_to_status(uniqueness_score)
         details = f"Uniqueness check: {len(uniqueness_issues)} uniqueness violations found."
@@ -268,17 +750,16 @@ class DataQualityValidator:
             recommendations=recommendations
         )
     
-    def _check_timeliness(self, df: pd.DataFrame) -> DataQualityMetric:
+    def _check_timeliness(self, df: pd.DataFrame, catalog: Optional[Dict[str, List[str]]] = None) -> DataQualityMetric:
         """Vérifie la fraîcheur des données"""
+        if catalog is None:
+            catalog = self._build_column_catalog(df)
+        
         timeliness_score = 100
         recommendations = []
         
-        # Recherche colonnes de dates
-        date_columns = []
-        for col in df.columns:
-            if any(keyword in col.lower() for keyword in ['date', 'time', 'created', 'updated']):
-                if df[col].dtype in ['datetime64[ns]', 'object']:
-                    date_columns.append(col)
+        # Colonnes de dates
+        date_columns = catalog['timestamp']
         
         if not date_columns:
             details = "No timestamp columns found for timeliness assessment."
@@ -288,23 +769,35 @@ class DataQualityValidator:
             # Analyse de la fraîcheur
             freshness_issues = []
             now = datetime.now()
+            now_ns = pd.Timestamp(now).value
             
             for col in date_columns:
                 try:
-                    dates = pd.to_datetime(df[col], errors='coerce').dropna()
-                    if len(dates) > 0:
+                    # Colonnes déjà typées datetime: pas de re-conversion
+                    dates = df[col] if df[col].dtype.kind == 'M' else pd.to_datetime(df[col], errors='coerce')
+                    if isinstance(dates.dtype, np.dtype):
+                        # Réductions sur la vue int64 (nanosecondes), NaT exclus
+                        timestamps = dates.to_numpy(dtype='datetime64[ns]').view('i8')
+                        timestamps = timestamps[timestamps != pd.NaT.value]
+                        if len(timestamps) == 0:
+                            continue
+                        latest_date = pd.Timestamp(timestamps.max())
+                        future_dates = int(np.count_nonzero(timestamps > now_ns))
+                    else:
+                        dates = dates.dropna()
+                        if len(dates) == 0:
+                            continue
                         latest_date = dates.max()
-                        oldest_date = dates.min()
-                        
-                        days_since_latest = (now - latest_date).days
-                        
-                        if days_since_latest > 30:
-                            freshness_issues.append(f"{col}: Latest data is {days_since_latest} days old")
-                        
-                        # Données futures (problématique)
                         future_dates = (dates > now).sum()
-                        if future_dates > 0:
-                            freshness_issues.append(f"{col}: {future_dates} future dates detected")
+                    
+                    days_since_latest = (now - latest_date).days
+                    
+                    if days_since_latest > 30:
+                        freshness_issues.append(f"{col}: Latest data is {days_since_latest} days old")
+                    
+                    # Données futures (problématique)
+                    if future_dates > 0:
+                        freshness_issues.append(f"{col}: {future_dates} future dates detected")
                 
                 except Exception as e:
                     logger.warning(f"Error processing date column {col}: {e}")
@@ -327,35 +820,38 @@ class DataQualityValidator:
     
     def _check_gaming_specific_rules(self, df: pd.DataFrame) -> DataQualityMetric:
         """Vérifie les règles spécifiques à l'industrie gaming"""
-        gaming_issues = []
-        gaming_score = 100
+        issue_counts: Dict[str, int] = {}
         
+        # Comptages sur masques booléens, sans matérialiser de DataFrame filtré
         # Validation départements gaming
         if 'department' in df.columns:
-            invalid_departments = df[~df['department'].isin(self.valid_departments)]['department'].dropna()
-            if len(invalid_departments) > 0:
-                gaming_issues.append(f"Invalid departments: {len(invalid_departments)} records")
+            departments = df['department']
+            issue_counts['Invalid departments'] = int(
+                (~departments.isin(self.valid_departments) & departments.notna()).sum()
+            )
         
         # Validation niveaux d'expérience
         if 'experience_level' in df.columns:
-            invalid_levels = df[~df['experience_level'].isin(self.valid_experience_levels)]['experience_level'].dropna()
-            if len(invalid_levels) > 0:
-                gaming_issues.append(f"Invalid experience levels: {len(invalid_levels)} records")
+            levels = df['experience_level']
+            issue_counts['Invalid experience levels'] = int(
+                (~levels.isin(self.valid_experience_levels) & levels.notna()).sum()
+            )
         
         # Validation salaires gaming
         if 'salary_usd' in df.columns:
-            # Salaires gaming réalistes: 30K - 500K
-            unrealistic_salaries = df[
-                (df['salary_usd'] < 30000) | (df['salary_usd'] > 500000)
-            ]['salary_usd'].dropna()
-            if len(unrealistic_salaries) > 0:
-                gaming_issues.append(f"Unrealistic gaming salaries: {len(unrealistic_salaries)} records")
+            # Salaires gaming réalistes: 30K - 500K (NaN exclus par les comparaisons)
+            issue_counts['Unrealistic gaming salaries'] = _count_outside_range(df['salary_usd'], 30000.0, 500000.0)
         
         # Validation cohérence role/department
         if 'role' in df.columns and 'department' in df.columns:
-            inconsistent_roles = self._find_inconsistent_gaming_roles(df)
-            if inconsistent_roles > 0:
-                gaming_issues.append(f"Role-department mismatches: {inconsistent_roles} records")
+            issue_counts['Role-department mismatches'] = int(self._role_department_mismatches(df).sum())
+        
+        return self._gaming_rules_metric(issue_counts)
+    
+    def _gaming_rules_metric(self, issue_counts: Dict[str, int]) -> DataQualityMetric:
+        """Construit la métrique gaming à partir du nombre d'enregistrements fautifs par règle"""
+        gaming_issues = [f"{rule}: {count} records" for rule, count in issue_counts.items() if count > 0]
+        gaming_score = 100
         
         # Score gaming
         if gaming_issues:
@@ -377,6 +873,74 @@ class DataQualityValidator:
             recommendations=recommendations
         )
     
+    def _role_department_mismatches(self, df: pd.DataFrame) -> pd.Series:
+        """Masque des lignes dont le rôle connu relève d'un autre département que celui déclaré
+        
+        Le mapping est appliqué aux seuls rôles distincts; rôles inconnus et départements
+        manquants ne sont pas comptés.
+        """
+        role_codes, roles = pd.factorize(df['role'])
+        if len(roles) == 0:
+            return pd.Series(False, index=df.index)
+        expected_by_role = pd.Series(roles).astype(str).str.lower().map(self.role_dept_map).to_numpy()
+        expected = np.where(role_codes >= 0, expected_by_role.take(role_codes, mode='clip'), None)
+        
+        departments = df['department'].astype(object).to_numpy()
+        mismatches = pd.notna(expected) & pd.notna(departments) & (expected != departments)
+        return pd.Series(mismatches, index=df.index)
+    
+    def _with_categorical_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Copie superficielle de df avec les colonnes objet à faible cardinalité en category
+        
+        isin et les doublons opèrent alors sur des codes entiers plutôt que sur des chaînes.
+        """
+        categorical = {
+            col: df[col].astype('category') for col in CATEGORY_LIKE_COLUMNS
+            if col in df.columns and df[col].dtype == object
+        }
+        return df.assign(**categorical) if categorical else df
+    
+    def _build_column_catalog(self, df: pd.DataFrame) -> Dict[str, List[str]]:
+        """Catalogue des colonnes par type et par rôle, construit une fois par validation
+        
+        numeric/datetime/object: colonnes par famille de dtype; url: colonnes d'URLs,
+        id: colonnes qui devraient être uniques (identifiants, emails, clés),
+        timestamp: colonnes de dates candidates à l'analyse de fraîcheur (d'après leur nom).
+        """
+        return {
+            'numeric': df.select_dtypes(include=[np.number]).columns.tolist(),
+            'datetime': df.select_dtypes(include=['datetime64']).columns.tolist(),
+            'object': df.select_dtypes(include=['object']).columns.tolist(),
+            **self._named_column_roles(df.columns, lambda col: df[col].dtype in ['datetime64[ns]', 'object'])
+        }
+    
+    def _build_schema_catalog(self, schema: 'pl.Schema') -> Dict[str, List[str]]:
+        """Équivalent de _build_column_catalog pour un schéma polars (fichier non chargé)"""
+        def is_naive_datetime(dtype) -> bool:
+            return isinstance(dtype, pl.Datetime) and dtype.time_zone is None
+        
+        return {
+            'numeric': [col for col, dtype in schema.items() if dtype.is_numeric()],
+            'datetime': [col for col, dtype in schema.items() if is_naive_datetime(dtype)],
+            'object': [col for col, dtype in schema.items() if dtype == pl.Utf8],
+            **self._named_column_roles(
+                schema.names(), lambda col: is_naive_datetime(schema[col]) or schema[col] == pl.Utf8
+            )
+        }
+    
+    def _named_column_roles(self, columns, is_date_dtype) -> Dict[str, List[str]]:
+        """Colonnes d'URLs, à valeurs uniques et de dates, reconnues d'après leur nom"""
+        lowered = {col: col.lower() for col in columns}
+        return {
+            'url': [col for col, name in lowered.items() if 'url' in name or 'website' in name],
+            'id': [col for col, name in lowered.items() if any(keyword in name for keyword in ['id', 'email', 'key'])],
+            'timestamp': [
+                col for col, name in lowered.items()
+                if any(keyword in name for keyword in ['date', 'time', 'created', 'updated'])
+                and is_date_dtype(col)
+            ]
+        }
+    
     def _score_to_status(self, score: float) -> str:
         """Convertit un score en statut"""
         if score >= self.quality_thresholds['excellent']:
@@ -388,31 +952,68 @@ class DataQualityValidator:
         else:
             return 'critical'
     
-    def _generate_data_profile(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _generate_data_profile(self, df: pd.DataFrame,
+                               null_counts: Optional[pd.Series] = None,
+                               catalog: Optional[Dict[str, List[str]]] = None) -> Dict[str, Any]:
         """Génère un profil des données"""
+        if null_counts is None:
+            null_counts = df.isnull().sum()
+        if catalog is None:
+            catalog = self._build_column_catalog(df)
+        
         profile = {
             'shape': df.shape,
-            'memory_usage_mb': df.memory_usage(deep=True).sum() / 1024 / 1024,
+            'memory_usage_mb': self._estimate_memory_usage(df, catalog['object']) / 1024 / 1024,
             'column_types': df.dtypes.astype(str).to_dict(),
-            'missing_values': df.isnull().sum().to_dict(),
-            'unique_values': df.nunique().to_dict()
+            'missing_values': null_counts.to_dict()
+        }
+        
+        # Colonnes objet: valeurs distinctes et fréquences comptées en une passe Arrow
+        categorical_columns = catalog['object']
+        object_profiles = {}
+        if ARROW_AVAILABLE:
+            for col in categorical_columns:
+                column_profile = _arrow_object_profile(df[col])
+                if column_profile is not None:
+                    object_profiles[col] = column_profile
+        
+        other_columns = [col for col in df.columns if col not in object_profiles]
+        unique_values = df[other_columns].nunique().to_dict()
+        profile['unique_values'] = {
+            col: object_profiles[col][0] if col in object_profiles else unique_values[col]
+            for col in df.columns
         }
         
         # Statistiques numériques
-        numeric_columns = df.select_dtypes(include=[np.number]).columns
+        numeric_columns = catalog['numeric']
         if len(numeric_columns) > 0:
             profile['numeric_stats'] = df[numeric_columns].describe().to_dict()
         
         # Top valeurs pour colonnes catégorielles
-        categorical_columns = df.select_dtypes(include=['object']).columns
         profile['categorical_top_values'] = {}
         
         for col in categorical_columns:
-            top_values = df[col].value_counts().head(5).to_dict()
+            if col in object_profiles:
+                top_values = object_profiles[col][1]
+            else:
+                top_values = df[col].value_counts().head(5).to_dict()
             profile['categorical_top_values'][col] = top_values
         
         return profile
     
+    def _estimate_memory_usage(self, df: pd.DataFrame, object_columns: List[str]) -> float:
+        """Empreinte mémoire estimée en octets, sans parcourir chaque objet Python
+        
+        Mémoire des tableaux (deep=False), plus la taille moyenne des objets d'un échantillon
+        de tête extrapolée à chaque colonne objet (deep=True visite toutes les chaînes).
+        """
+        estimate = float(df.memory_usage(index=True, deep=False).sum())
+        for col in object_columns:
+            sample = df[col].head(PROFILE_MEMORY_SAMPLE_ROWS)
+            if len(sample) > 0:
+                estimate += sample.map(sys.getsizeof).mean() * len(df)
+        return estimate
+    
     def generate_quality_report(self, validation_result: Dict[str, Any]) -> str:
         """Génère un rapport de qualité formaté"""
         report = f"""
@@ -5,14 +5,91 @@ Validation avancée des schémas de données gaming avec JSONSchema
 import jsonschema
 import json
 import pandas as pd
-from typing import Dict, List, Any, Optional, Union
+import numpy as np
+from typing import Callable, Dict, List, Any, Optional, Union
 import logging
+import re
 from datetime import datetime
 from pathlib import Path
 import yaml
 
+# fastjsonschema (optionnel): schémas compilés en fonctions Python générées
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+# jsonschema-rs (optionnel): validation en Rust pour les lots de records
+try:
+    import jsonschema_rs
+except ImportError:
+    jsonschema_rs = None
+
 logger = logging.getLogger(__name__)
 
+# URI absolue (RFC 3986): schéma puis partie hiérarchique sans espaces ni caractères interdits
+_URI_RE = re.compile(r'[A-Za-z][A-Za-z0-9+.\-]*:[^\s<>"{}|\\^`]*')
+
+
+def _is_uri(value: Any) -> bool:
+    """Vérification du format "uri", identique sur tous les moteurs
+    
+    jsonschema ne vérifie "uri" qu'avec rfc3987 installé, alors que fastjsonschema
+    et jsonschema-rs le vérifient toujours, chacun à sa façon: le même contrôle est
+    fourni aux trois pour que le résultat ne dépende pas des paquets installés.
+    """
+    if not isinstance(value, str):
+        return True
+    return _URI_RE.fullmatch(value) is not None
+
+
+# Formats dont la vérification est fournie explicitement à chaque moteur
+_CUSTOM_FORMATS = {'uri': _is_uri}
+
+
+def _native_record(record: Any) -> Any:
+    """Record avec les scalaires NumPy (np.int64, np.bool_...) convertis en types Python natifs
+    
+    Draft7Validator les accepte, mais pas le code généré par fastjsonschema ni jsonschema-rs:
+    la conversion garantit le même résultat quel que soit le moteur installé.
+    """
+    if not isinstance(record, dict):
+        return record
+    
+    native = None
+    for key, value in record.items():
+        if isinstance(value, np.generic):
+            if native is None:
+                native = dict(record)
+            native[key] = value.item()
+    return record if native is None else native
+
+
+def _is_json_native(value: Any) -> bool:
+    """Valeur convertible telle quelle par jsonschema-rs (types JSON natifs, sans NaN)
+    
+    jsonschema-rs lit NaN comme null et refuse les autres types Python (Timestamp...),
+    alors que jsonschema les valide: ces records passent par le validateur Python.
+    """
+    if value is None or isinstance(value, (str, bool, int)):
+        return True
+    if isinstance(value, float):
+        return value == value
+    if isinstance(value, dict):
+        return all(isinstance(k, str) and _is_json_native(v) for k, v in value.items())
+    if isinstance(value, list):
+        return all(_is_json_native(v) for v in value)
+    return False
+
+
+def _fast_error_entry(error: 'fastjsonschema.JsonSchemaValueException') -> Dict[str, Any]:
+    """Erreur fastjsonschema au format des erreurs jsonschema (chemin sans la racine 'data')"""
+    return {
+        'error_message': error.message,
+        'error_path': list(error.path[1:]),
+        'invalid_value': error.value
+    }
+
 class GamingSchemaValidator:
     """Validateur de schémas enterprise pour données gaming"""
     
@@ -21,6 +98,16 @@ class GamingSchemaValidator:
         self.loaded_schemas = {}
         self.validation_results = {}
         
+        # Validateurs compilés par schéma: méta-schéma vérifié et vérificateur de formats
+        # construits une fois, réutilisés pour chaque record
+        self._compiled_validators: Dict[str, Any] = {}
+        
+        # Fonctions de validation générées par fastjsonschema (None: schéma non compilable)
+        self._fast_validators: Dict[str, Optional[Callable]] = {}
+        
+        # Validateurs jsonschema-rs pour les lots de records (None: schéma non supporté)
+        self._rs_validators: Dict[str, Any] = {}
+        
         # Schémas gaming intégrés
         self.gaming_schemas = {
             'employee': self._get_employee_schema(),
@@ -51,11 +138,16 @@ class GamingSchemaValidator:
                 validation_result['errors'].append(f"Schema '{schema_name}' not found")
                 return validation_result
             
+            validator = self._get_compiled_validator(schema_name, schema)
+            fast_validate = self._get_fast_validator(schema_name, schema)
+            
             # Validation selon le type de données
             if isinstance(data, list):
-                validation_result = self._validate_list_data(data, schema, validation_result)
+                rs_validator = self._get_rs_validator(schema_name, schema)
+                validation_result = self._validate_list_data(data, validator, validation_result,
+                                                             fast_validate, rs_validator)
             else:
-                validation_result = self._validate_single_record(data, schema, validation_result)
+                validation_result = self._validate_single_record(data, validator, validation_result, fast_validate)
             
             # Détermination du statut global
             validation_result['is_valid'] = len(validation_result['errors']) == 0
@@ -105,49 +197,127 @@ class GamingSchemaValidator:
         
         return None
     
-    def _validate_list_data(self, data_list: List[Dict], schema: Dict, 
-                           validation_result: Dict[str, Any]) -> Dict[str, Any]:
-        """Valide une liste de records"""
+    def _get_compiled_validator(self, schema_name: str, schema: Dict) -> Any:
+        """Validateur compilé pour un schéma (construit au premier usage puis mis en cache)"""
+        validator = self._compiled_validators.get(schema_name)
+        if validator is None:
+            validator_class = jsonschema.validators.validator_for(schema, default=jsonschema.Draft7Validator)
+            validator_class.check_schema(schema)
+            format_checker = jsonschema.FormatChecker()
+            for format_name, check in _CUSTOM_FORMATS.items():
+                format_checker.checks(format_name)(check)
+            validator = validator_class(schema, format_checker=format_checker)
+            self._compiled_validators[schema_name] = validator
+        return validator
+    
+    def _get_fast_validator(self, schema_name: str, schema: Dict) -> Optional[Callable]:
+        """Fonction fastjsonschema compilée pour un schéma, ou None (module absent, schéma non supporté)"""
+        if fastjsonschema is None:
+            return None
+        
+        if schema_name not in self._fast_validators:
+            try:
+                self._fast_validators[schema_name] = fastjsonschema.compile(
+                    schema, formats=_CUSTOM_FORMATS, use_formats=True
+                )
+            except fastjsonschema.JsonSchemaDefinitionException as e:
+                logger.warning(f"fastjsonschema cannot compile schema '{schema_name}' ({e}), using jsonschema")
+                self._fast_validators[schema_name] = None
+        return self._fast_validators[schema_name]
+    
+    def _get_rs_validator(self, schema_name: str, schema: Dict) -> Any:
+        """Validateur jsonschema-rs pour un schéma, ou None (module absent, schéma non supporté)"""
+        if jsonschema_rs is None:
+            return None
+        
+        if schema_name not in self._rs_validators:
+            try:
+                self._rs_validators[schema_name] = jsonschema_rs.validator_for(
+                    schema, formats=_CUSTOM_FORMATS, validate_formats=True
+                )
+            except ValueError as e:
+                logger.warning(f"jsonschema-rs cannot build schema '{schema_name}' ({e}), using Python validation")
+                self._rs_validators[schema_name] = None
+        return self._rs_validators[schema_name]
+    
+    def _validate_list_data(self, data_list: List[Dict], validator: Any, 
+                           validation_result: Dict[str, Any],
+                           fast_validate: Optional[Callable] = None,
+                           rs_validator: Any = None) -> Dict[str, Any]:
+        """Valide une liste de records
+        
+        rs_validator: validateur jsonschema-rs, prioritaire (is_valid court-circuite à la
+        première violation, les erreurs ne sont recherchées que pour les records invalides);
+        les records avec NaN ou des types non JSON passent par le validateur Python.
+        fast_validate: fonction fastjsonschema compilée, utilisée à la place de jsonschema
+        (première erreur rencontrée rapportée pour chaque record invalide).
+        """
         
         validation_result['records_validated'] = len(data_list)
         
+        if rs_validator is not None:
+            is_valid = rs_validator.is_valid
+            iter_errors = rs_validator.iter_errors
+            errors = validation_result['errors']
+            for i, record in enumerate(data_list):
+                try:
+                    record = _native_record(record)
+                    if not _is_json_native(record):
+                        error = self._record_error(record, validator, fast_validate)
+                    elif is_valid(record):
+                        error = None
+                    else:
+                        rs_error = next(iter_errors(record))
+                        error = {
+                            'error_message': rs_error.message,
+                            'error_path': list(rs_error.instance_path),
+                            'invalid_value': rs_error.instance
+                        }
+                    if error is None:
+                        validation_result['valid_records'] += 1
+                        continue
+                    validation_result['invalid_records'] += 1
+                    errors.append({'record_index': i, **error})
+                except Exception as e:
+                    validation_result['invalid_records'] += 1
+                    errors.append({
+                        'record_index': i,
+                        'error_message': f"Unexpected error: {str(e)}"
+                    })
+            return validation_result
+        
+        errors = validation_result['errors']
         for i, record in enumerate(data_list):
             try:
-                jsonschema.validate(instance=record, schema=schema)
-                validation_result['valid_records'] += 1
-            except jsonschema.ValidationError as e:
+                error = self._record_error(_native_record(record), validator, fast_validate)
+                if error is None:
+                    validation_result['valid_records'] += 1
+                    continue
                 validation_result['invalid_records'] += 1
-                validation_result['errors'].append({
-                    'record_index': i,
-                    'error_message': e.message,
-                    'error_path': list(e.path),
-                    'invalid_value': e.instance
-                })
+                errors.append({'record_index': i, **error})
             except Exception as e:
                 validation_result['invalid_records'] += 1
-                validation_result['errors'].append({
+                errors.append({
                     'record_index': i,
                     'error_message': f"Unexpected error: {str(e)}"
                 })
         
         return validation_result
     
-    def _validate_single_record(self, data: Dict, schema: Dict, 
-                               validation_result: Dict[str, Any]) -> Dict[str, Any]:
+    def _validate_single_record(self, data: Dict, validator: Any, 
+                               validation_result: Dict[str, Any],
+                               fast_validate: Optional[Callable] = None) -> Dict[str, Any]:
         """Valide un seul record"""
         
         validation_result['records_validated'] = 1
         
         try:
-            jsonschema.validate(instance=data, schema=schema)
-            validation_result['valid_records'] = 1
-        except jsonschema.ValidationError as e:
-            validation_result['invalid_records'] = 1
-            validation_result['errors'].append({
-                'error_message': e.message,
-                'error_path': list(e.path),
-                'invalid_value': e.instance
-            })
+            error = self._record_error(_native_record(data), validator, fast_validate)
+            if error is None:
+                validation_result['valid_records'] = 1
+            else:
+                validation_result['invalid_records'] = 1
+                validation_result['errors'].append(error)
         except Exception as e:
             validation_result['invalid_records'] = 1
             validation_result['errors'].append({
@@ -156,6 +326,31 @@ class GamingSchemaValidator:
         
         return validation_result
     
+    def _record_error(self, record: Any, validator: Any,
+                      fast_validate: Optional[Callable] = None) -> Optional[Dict[str, Any]]:
+        """Erreur rapportée pour un record (None s'il est valide)
+        
+        fast_validate (fastjsonschema) rapporte la première règle en échec; un type qu'il ne
+        sait pas traiter renvoie vers le validateur jsonschema (best_match, comme jsonschema.validate).
+        """
+        if fast_validate is not None:
+            try:
+                fast_validate(record)
+                return None
+            except fastjsonschema.JsonSchemaValueException as e:
+                return _fast_error_entry(e)
+            except Exception as e:
+                logger.debug(f"fastjsonschema failed on record ({e}), using jsonschema")
+        
+        error = jsonschema.exceptions.best_match(validator.iter_errors(record))
+        if error is None:
+            return None
+        return {
+            'error_message': error.message,
+            'error_path': list(error.path),
+            'invalid_value': error.instance
+        }
+    
     def validate_dataframe(self, df: pd.DataFrame, schema_name: str) -> Dict[str, Any]:
         """Valide un DataFrame contre un schéma"""
         
@@ -235,7 +430,7 @@ class GamingSchemaValidator:
                 },
                 "neurodivergent_condition": {
                     "type": ["string", "null"],
-                    "enum": ["ADHD", "Autism Spectrum", "Dyslexia", "Dyspraxia", "Other", null]
+                    "enum": ["ADHD", "Autism Spectrum", "Dyslexia", "Dyspraxia", "Other", None]
                 },
                 "weekly_hours": {
                     "type": "number",
@@ -247,7 +442,7 @@ class GamingSchemaValidator:
                     "enum": ["pre_production", "production", "alpha", "beta", "gold_master", "post_launch"]
                 }
             },
-            "additionalProperties": false
+            "additionalProperties": False
         }
     
     def _get_studio_schema(self) -> Dict:
@@ -326,7 +521,7 @@ class GamingSchemaValidator:
                     "type": "boolean"
                 }
             },
-            "additionalProperties": false
+            "additionalProperties": False
         }
     
     def _get_salary_schema(self) -> Dict:
@@ -416,7 +611,7 @@ class GamingSchemaValidator:
                     "format": "date"
                 }
             },
-            "additionalProperties": false
+            "additionalProperties": False
         }
     
     def _get_performance_schema(self) -> Dict:
@@ -483,7 +678,7 @@ class GamingSchemaValidator:
                     "type": "boolean"
                 }
             },
-            "additionalProperties": false
+            "additionalProperties": False
         }
     
     def _get_neurodiversity_schema(self) -> Dict:
@@ -540,7 +735,7 @@ class GamingSchemaValidator:
                     "maximum": 10000
                 }
             },
-            "additionalProperties": false
+            "additionalProperties": False
         }
     
     def generate_schema_from_data(self, data: Union[Dict, pd.DataFrame], 
@@ -641,8 +836,11 @@ class GamingSchemaValidator:
             else:
                 raise ValueError(f"Unsupported format: {format}")
             
-            # Mettre en cache
+            # Mettre en cache (le validateur compilé sera reconstruit pour le nouveau schéma)
             self.loaded_schemas[schema_name] = schema
+            self._compiled_validators.pop(schema_name, None)
+            self._fast_validators.pop(schema_name, None)
+            self._rs_validators.pop(schema_name, None)
             
             logger.info(f"Schema '{schema_name}' saved to {schema_file}")
             return True
@@ -279,3 +279,62 @@ class TestGamingDataLoader:
     def test_gaming_data_export(self, temp_gaming_data_file):
         """Test de l'export des données gaming"""
         data = pd.read_csv(temp_gaming_data_file)
+
+    def test_gaming_aggregation_ignores_zero_metrics(self, temp_gaming_data_file):
+        """Les métriques spécifiques ignorent les zéros (0 si aucune valeur positive)"""
+        data = pd.read_csv(temp_gaming_data_file)
+        
+        from src.data.loader import DataLoader
+        loader = DataLoader()
+        
+        dept_summary = loader.aggregate_gaming_metrics(data, group_by='department')
+        
+        # Programming: vélocités 35 et 38 -> moyenne 36.5
+        assert dept_summary.loc['Programming', 'avg_sprint_velocity'] == pytest.approx(36.5)
+        # QA: bug fix rates 88 et 92 -> moyenne 90
+        assert dept_summary.loc['QA', 'avg_bug_fix_rate'] == pytest.approx(90)
+        # Art: aucune valeur positive
+        assert dept_summary.loc['Art', 'avg_sprint_velocity'] == 0
+        assert dept_summary.loc['Art', 'avg_bug_fix_rate'] == 0
+
+    def test_gaming_aggregation_polars_matches_pandas(self, temp_gaming_data_file, monkeypatch):
+        """Le chemin Polars produit la même agrégation que le chemin pandas"""
+        pytest.importorskip('polars')
+        data = pd.read_csv(temp_gaming_data_file)
+        
+        import src.data.loader as loader_module
+        loader = loader_module.DataLoader()
+        
+        expected = loader.aggregate_gaming_metrics(data, group_by='department')
+        monkeypatch.setattr(loader_module, 'POLARS_MIN_ROWS', 0)
+        result = loader.aggregate_gaming_metrics(data, group_by='department')
+        
+        pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+    def test_gaming_aggregation_skips_unobserved_departments(self, temp_gaming_data_file):
+        """Département catégoriel: seules les catégories présentes forment un groupe"""
+        data = pd.read_csv(temp_gaming_data_file)
+        data['department'] = pd.Categorical(
+            data['department'], categories=['Programming', 'Art', 'Game Design', 'QA',
+                                            'Marketing', 'Audio']
+        )
+        
+        from src.data.loader import DataLoader
+        loader = DataLoader()
+        
+        dept_summary = loader.aggregate_gaming_metrics(data, group_by='department')
+        
+        assert 'Audio' not in dept_summary.index
+        assert len(dept_summary) == 5
+        assert dept_summary.loc['QA', 'avg_bug_fix_rate'] == pytest.approx(90)
+
+    def test_sample_data_cache_returns_independent_copies(self):
+        """Le cache fichier renvoie des copies: modifier un résultat n'altère pas le suivant"""
+        from src.data.loader import DataLoader
+        loader = DataLoader()
+        
+        first = loader.load_sample_data()
+        first.loc[:, 'salary'] = -1
+        second = loader.load_sample_data()
+        
+        assert (second['salary'] > 0).all()
@@ -0,0 +1,141 @@
+"""
+Gaming Workforce Observatory - Database Connector Tests
+Tests du chargement COPY des offres d'emploi gaming (sans serveur PostgreSQL)
+"""
+
+import pytest
+import json
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date, datetime
+from unittest.mock import MagicMock
+import sys
+from pathlib import Path
+
+# Ajouter le répertoire racine au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pytest.importorskip('psycopg2')
+
+import src.data.connectors.database as database_module
+from src.data.connectors.database import DatabaseConnector
+
+
+class TestGamingJobsCopy:
+    """Tests pour l'insertion COPY des offres d'emploi"""
+
+    @pytest.fixture
+    def job(self):
+        """Offre d'emploi avec une chaîne vide, une valeur manquante et des compétences"""
+        return {
+            'job_id': 'J-1', 'title': 'Gameplay Programmer', 'company_name': 'Pixel "Forge"',
+            'department': 'Programming', 'experience_level': 'Senior', 'location': '',
+            'salary_min': 90000, 'salary_max': None, 'currency': 'USD',
+            'skills': ['C++', 'Unreal'], 'description': 'Line 1, line 2',
+            'posted_date': date(2024, 5, 1), 'source': 'api'
+        }
+
+    def test_csv_buffer_distinguishes_empty_string_and_null(self, job):
+        """'' est quoté (chaîne vide) et None reste un champ vide non quoté (NULL)"""
+        row = tuple(job[col] for col in database_module._JOB_COLS)
+
+        line = DatabaseConnector._rows_to_csv_buffer([row]).getvalue()
+
+        assert line == (
+            '"J-1","Gameplay Programmer","Pixel ""Forge""","Programming","Senior","",'
+            '"90000",,"USD","{""C++"",""Unreal""}","Line 1, line 2","2024-05-01","api"\n'
+        )
+
+    def test_insert_copy_uses_text_fallback_without_pgcopy(self, job, monkeypatch):
+        """Sans pgcopy, les lignes passent par COPY csv dans la table de staging"""
+        monkeypatch.setattr(database_module, 'CopyManager', None)
+        connector = DatabaseConnector.__new__(DatabaseConnector)
+        conn = MagicMock()
+        cursor = conn.cursor.return_value
+        cursor.rowcount = 1
+
+        @contextmanager
+        def fake_connection():
+            yield conn
+        connector.get_connection = fake_connection
+
+        assert connector.insert_gaming_jobs_copy([job]) == 1
+
+        copy_sql, buffer = cursor.copy_expert.call_args[0]
+        assert copy_sql.startswith('COPY gaming_jobs_staging (job_id, title')
+        assert buffer.getvalue().startswith('"J-1",')
+        conn.commit.assert_called_once()
+
+    def test_insert_copy_empty_input(self):
+        """Aucune connexion n'est ouverte pour une liste vide"""
+        connector = DatabaseConnector.__new__(DatabaseConnector)
+        connector.get_connection = MagicMock()
+
+        assert connector.insert_gaming_jobs_copy([]) == 0
+        connector.get_connection.assert_not_called()
+
+
+class TestAnalyticsEventQueue:
+    """Tests de la file d'événements analytics et de son thread consommateur"""
+
+    @pytest.fixture
+    def connector(self, monkeypatch):
+        """Connecteur avec pool simulé, flusher rapide et INSERT enregistrés"""
+        written = []
+        write_lock = threading.Lock()
+
+        def fake_execute_values(cursor, sql, rows, page_size=None):
+            with write_lock:
+                written.extend(rows)
+
+        def fake_pool(self):
+            self.connection_pool = MagicMock()
+
+        monkeypatch.setattr(database_module, 'ANALYTICS_FLUSH_INTERVAL_S', 0.02)
+        monkeypatch.setattr(database_module, 'execute_values', fake_execute_values)
+        monkeypatch.setattr(DatabaseConnector, 'init_connection_pool', fake_pool)
+
+        connector = DatabaseConnector()
+        connector.written = written
+        yield connector
+        connector.close_pool()
+
+    @staticmethod
+    def _wait_for(condition, timeout=5.0):
+        """Attend qu'une condition soit vraie (thread consommateur asynchrone)"""
+        deadline = time.monotonic() + timeout
+        while not condition() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return condition()
+
+    def test_non_json_event_is_skipped_and_flusher_keeps_writing(self, connector):
+        """Un événement non sérialisable est refusé à l'appel; les suivants sont écrits"""
+        assert connector.log_analytics_event('s1', 'u1', 'page_view', {'tab': 'salary'}, '/salary')
+        assert not connector.log_analytics_event('s1', 'u1', 'export', {'at': datetime.now()}, '/export')
+        assert connector.log_analytics_event('s2', 'u2', 'filter', {'department': 'Art'}, '/studios')
+
+        assert self._wait_for(lambda: len(connector.written) == 2)
+        assert connector._event_flusher.is_alive()
+        assert [row[2] for row in connector.written] == ['page_view', 'filter']
+        assert json.loads(connector.written[1][3]) == {'department': 'Art'}
+
+    def test_flusher_survives_failing_batch(self, connector, monkeypatch):
+        """Une exception pendant l'écriture d'un lot n'arrête pas le thread consommateur"""
+        original_write = connector._write_analytics_events
+        calls = []
+
+        def failing_once(events):
+            calls.append(len(events))
+            if len(calls) == 1:
+                raise RuntimeError('boom')
+            return original_write(events)
+
+        monkeypatch.setattr(connector, '_write_analytics_events', failing_once)
+
+        connector.log_analytics_event('s1', 'u1', 'page_view', {}, '/')
+        assert self._wait_for(lambda: len(calls) == 1)
+        connector.log_analytics_event('s1', 'u1', 'page_view', {'n': 2}, '/')
+
+        assert self._wait_for(lambda: len(connector.written) == 1)
+        assert connector._event_flusher.is_alive()
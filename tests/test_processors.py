@@ -0,0 +1,242 @@
+"""
+Gaming Workforce Observatory - Processors Tests
+Tests des processeurs studios, salaires et neurodiversité
+"""
+
+import pytest
+import io
+import json
+import pandas as pd
+import numpy as np
+import sys
+from pathlib import Path
+
+# Ajouter le répertoire racine au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+class TestGamingStudioProcessor:
+    """Tests pour le processeur de studios gaming"""
+
+    @pytest.fixture
+    def sample_studios_data(self):
+        """Studios gaming d'exemple sur plusieurs régions"""
+        return pd.DataFrame({
+            'name': ['Pixel Forge', 'Nordic Quest', 'Tokyo Arcade', 'Indie Loop'],
+            'country': ['USA', 'France', 'Japan', 'USA'],
+            'region': ['North America', 'Europe', 'Asia-Pacific', 'North America'],
+            'employees': [50, 300, 1200, 20],
+            'avg_salary': [80000, 70000, 65000, 90000],
+            'retention_rate': [85, 90, 80, 75],
+            'founded_year': [2000, 1995, 1985, 2015],
+            'revenue_usd': [5e6, 4e7, 3e8, 1e6],
+            'neurodiversity_programs': [1, 0, 2, 3]
+        })
+
+    def test_repeated_analysis_hits_cache_and_returns_copy(self, sample_studios_data):
+        """Une frame identique réutilise l'analyse, renvoyée en copie profonde"""
+        from src.data.processors.studio_processor import GamingStudioProcessor
+        processor = GamingStudioProcessor()
+
+        first = processor.analyze_global_studios(sample_studios_data)
+        first['geographic_analysis'].clear()
+        second = processor.analyze_global_studios(sample_studios_data.copy())
+
+        assert second['geographic_analysis']
+        assert second is not first
+        info = processor.analysis_cache_info()
+        assert info['hits'] == 1
+        assert info['misses'] == 1
+        assert info['size'] == 1
+
+    def test_shared_fingerprint_tracks_content(self, sample_studios_data):
+        """L'empreinte partagée dépend des valeurs, de l'ordre des lignes et des dtypes"""
+        from src.data.processors._hashing import df_fingerprint
+
+        reordered = sample_studios_data.iloc[::-1].reset_index(drop=True)
+
+        assert df_fingerprint(sample_studios_data) == df_fingerprint(sample_studios_data.copy())
+        assert df_fingerprint(sample_studios_data) != df_fingerprint(reordered)
+        assert df_fingerprint(sample_studios_data) != df_fingerprint(
+            sample_studios_data.astype({'region': 'category'})
+        )
+
+
+class TestSalaryProcessor:
+    """Tests pour le processeur de salaires gaming"""
+
+    @pytest.fixture
+    def sample_salary_data(self):
+        """Salaires gaming d'exemple (20 lignes, une valeur très au-dessus du reste)"""
+        salaries = [60000 + 1000 * i for i in range(19)] + [450000]
+        return pd.DataFrame({
+            'company_name': ['Ubisoft', 'Riot', 'Valve', 'Epic'] * 5,
+            'role': ['Software Engineer', '3D Artist', 'Producer', 'QA Tester', 'Level Designer'] * 4,
+            'experience_level': ['Junior', 'Mid', 'Senior', 'Lead'] * 5,
+            'location': ['SF', 'Paris', 'Seattle', 'Montreal'] * 5,
+            'salary_usd': salaries,
+            'bonus_usd': [5000.0] * 20,
+            'equity_value_usd': [10000.0] * 20
+        })
+
+    def test_default_steps_skip_anomaly_detection(self, sample_salary_data):
+        """Par défaut, les colonnes d'anomalies ne sont calculées que sur demande"""
+        from src.data.processors.salary_processor import SalaryProcessor, DEFAULT_SALARY_STEPS
+        processor = SalaryProcessor()
+
+        default = processor.process_salary_data(sample_salary_data)
+        with_anomaly = processor.process_salary_data(
+            sample_salary_data, steps=DEFAULT_SALARY_STEPS | {'anomaly'}
+        )
+
+        assert 'anomaly' not in DEFAULT_SALARY_STEPS
+        assert 'salary_anomaly' not in default.columns
+        assert 'anomaly_score' not in default.columns
+        assert {'total_compensation_usd', 'estimated_years_experience'} <= set(default.columns)
+        assert {'salary_anomaly', 'anomaly_score'} <= set(with_anomaly.columns)
+
+    def test_unknown_step_raises(self, sample_salary_data):
+        """Une étape inconnue est refusée plutôt qu'ignorée"""
+        from src.data.processors.salary_processor import SalaryProcessor
+
+        with pytest.raises(ValueError, match='Unknown salary processing steps'):
+            SalaryProcessor().process_salary_data(sample_salary_data, steps={'clean', 'outliers'})
+
+    def test_insights_anomaly_cache_is_fifo(self, sample_salary_data, monkeypatch):
+        """generate_salary_insights met en cache les anomalies calculées et évince la plus ancienne"""
+        import src.data.processors.salary_processor as salary_module
+        monkeypatch.setattr(salary_module, 'ANOMALY_CACHE_SIZE', 2)
+        processor = salary_module.SalaryProcessor()
+        frames = [sample_salary_data.assign(bonus_usd=float(bonus)) for bonus in range(3)]
+
+        first = processor.generate_salary_insights(frames[0])
+        processor.generate_salary_insights(frames[0])
+        assert len(processor._anomaly_cache) == 1
+
+        processor.generate_salary_insights(frames[1])
+        processor.generate_salary_insights(frames[2])
+        keys = list(processor._anomaly_cache)
+
+        assert len(keys) == 2
+        assert keys == [salary_module.df_fingerprint(frame) for frame in frames[1:]]
+        assert first['anomalies']['count'] == 1
+
+    def test_iqr_fence_flags_known_outlier(self, sample_salary_data):
+        """La barrière 3 × IQR isole le salaire extrême; le score est la distance à la médiane en IQR"""
+        from src.data.processors.salary_processor import SalaryProcessor
+
+        result = SalaryProcessor()._detect_salary_anomalies(sample_salary_data)
+
+        salaries = sample_salary_data['salary_usd'].astype(float)
+        q1, median, q3 = np.percentile(salaries, [25, 50, 75])
+        expected_score = (salaries - median) / (q3 - q1)
+
+        assert result['salary_anomaly'].tolist() == [False] * 19 + [True]
+        np.testing.assert_allclose(result['anomaly_score'], expected_score)
+        assert result['anomaly_score'].iloc[-1] > 3
+        assert result['anomaly_score'].iloc[0] < 0
+
+    def test_iforest_score_lower_for_outlier(self, sample_salary_data):
+        """Avec Isolation Forest, anomaly_score est score_samples (plus bas = plus anormal)"""
+        from src.data.processors.salary_processor import SalaryProcessor
+
+        result = SalaryProcessor(use_iforest=True)._detect_salary_anomalies(sample_salary_data)
+
+        assert result['anomaly_score'].idxmin() == len(sample_salary_data) - 1
+        assert bool(result['salary_anomaly'].iloc[-1])
+
+    def test_cached_pipeline_keyed_by_detector_mode(self, sample_salary_data):
+        """Le cache de process_salary_data ne partage pas les scores IQR et Isolation Forest"""
+        from src.data.processors.salary_processor import SalaryProcessor, DEFAULT_SALARY_STEPS
+        steps = DEFAULT_SALARY_STEPS | {'anomaly'}
+
+        iqr = SalaryProcessor().process_salary_data(sample_salary_data, steps=steps)
+        iforest = SalaryProcessor(use_iforest=True).process_salary_data(sample_salary_data, steps=steps)
+        iqr_again = SalaryProcessor().process_salary_data(sample_salary_data, steps=steps)
+
+        # score_samples d'Isolation Forest est toujours négatif; la distance IQR ne l'est pas
+        assert (iforest['anomaly_score'] < 0).all()
+        assert (iqr['anomaly_score'] > 0).any()
+        pd.testing.assert_series_equal(iqr_again['anomaly_score'], iqr['anomaly_score'])
+
+    def test_json_export_is_indented_array(self, sample_salary_data):
+        """'json' reste un tableau indenté; 'ndjson' donne un enregistrement par ligne"""
+        from src.data.processors.salary_processor import SalaryProcessor
+        processor = SalaryProcessor()
+
+        exported = processor.export_processed_data(sample_salary_data, format='json')
+        lines = processor.export_processed_data(sample_salary_data, format='ndjson').splitlines()
+
+        assert exported == sample_salary_data.to_json(orient='records', indent=2)
+        assert json.loads(exported) == [json.loads(line) for line in lines]
+        assert len(lines) == len(sample_salary_data)
+
+    @pytest.mark.parametrize('format', ['csv', 'ndjson', 'json'])
+    def test_export_streams_into_caller_buffer(self, sample_salary_data, monkeypatch, format):
+        """Avec un buffer fourni, l'export y est écrit (par blocs) et rien n'est renvoyé"""
+        import src.data.processors.salary_processor as salary_module
+        monkeypatch.setattr(salary_module, 'EXPORT_CHUNK_ROWS', 6)
+        processor = salary_module.SalaryProcessor()
+        buffer = io.StringIO()
+        writes = []
+        original_write = buffer.write
+        buffer.write = lambda text: writes.append(text) or original_write(text)
+
+        returned = processor.export_processed_data(sample_salary_data, format=format, buffer=buffer)
+
+        assert returned is None
+        assert buffer.getvalue() == processor.export_processed_data(sample_salary_data, format=format)
+        if format != 'json':
+            assert len(writes) > 1
+
+
+class TestNeurodiversityProcessor:
+    """Tests pour le processeur neurodiversité"""
+
+    def test_condition_mapping_and_codes(self):
+        """Conditions normalisées sur six catégories fixes, codes dans l'ordre de CONDITION_CATEGORIES"""
+        from src.data.processors.neurodiversity_processor import (
+            NeurodiversityProcessor, CONDITION_CATEGORIES
+        )
+        raw = pd.DataFrame({
+            'employee_id': range(8),
+            'department': ['Programming'] * 8,
+            'condition_type': ['adhd', ' Autism ', 'asperger', 'DYSLEXIC', 'dyspraxia',
+                               'unknown', None, 'Tourette'],
+            'accommodations_provided': [['flexible_hours']] * 8,
+            'performance_impact': [1.1] * 8,
+            'satisfaction_with_support': [7.5] * 8,
+            'support_cost_annual': [1000.0] * 8
+        })
+
+        processor = NeurodiversityProcessor()
+        result = processor._enrich_with_metrics(processor._clean_neurodiversity_data(raw.copy()))
+
+        assert CONDITION_CATEGORIES == ['Unknown', 'ADHD', 'Autism Spectrum', 'Dyslexia',
+                                        'Dyspraxia', 'Other']
+        assert list(result['condition_type'].cat.categories) == CONDITION_CATEGORIES
+        assert result['condition_type'].tolist() == [
+            'ADHD', 'Autism Spectrum', 'Autism Spectrum', 'Dyslexia', 'Dyspraxia',
+            'Unknown', 'Unknown', 'Other'
+        ]
+        assert result['condition_encoded'].tolist() == [1, 2, 2, 3, 4, 0, 0, 5]
+
+    def test_accommodation_score_counts_list_items_only(self):
+        """Seules les listes comptent leurs éléments; chaînes, None et autres valeurs -> 0"""
+        from src.data.processors.neurodiversity_processor import NeurodiversityProcessor
+        raw = pd.DataFrame({
+            'employee_id': range(5),
+            'department': ['Art'] * 5,
+            'condition_type': ['adhd'] * 5,
+            'accommodations_provided': [['flexible_hours', 'quiet_space'], 'flexible hours',
+                                        None, [], 3],
+            'performance_impact': [1.1] * 5,
+            'satisfaction_with_support': [8.0] * 5,
+            'support_cost_annual': [1000.0] * 5
+        })
+
+        processor = NeurodiversityProcessor()
+        result = processor._enrich_with_metrics(processor._clean_neurodiversity_data(raw.copy()))
+
+        assert result['accommodation_score'].tolist() == [2, 0, 0, 0, 0]
+        assert result['support_quality_score'].tolist() == pytest.approx([1.6, 0, 0, 0, 0])
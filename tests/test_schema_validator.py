@@ -0,0 +1,151 @@
+"""
+Gaming Workforce Observatory - Schema Validator Tests
+Tests du validateur de schémas gaming et de ses moteurs de validation
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import jsonschema
+import sys
+from pathlib import Path
+
+# Ajouter le répertoire racine au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import src.data.validators.schema_validator as schema_module
+from src.data.validators.schema_validator import GamingSchemaValidator
+
+# Moteurs de validation, du plus rapide au fallback jsonschema
+BACKENDS = ['jsonschema_rs', 'fastjsonschema', 'jsonschema']
+
+
+@pytest.fixture(params=BACKENDS)
+def backend_validator(request, monkeypatch):
+    """Validateur limité à un moteur (les moteurs plus rapides sont désactivés)"""
+    backend = request.param
+    if backend != 'jsonschema':
+        pytest.importorskip(backend)
+
+    disabled = BACKENDS[:BACKENDS.index(backend)]
+    for module_name in disabled:
+        monkeypatch.setattr(schema_module, module_name, None)
+    return GamingSchemaValidator()
+
+
+class TestGamingSchemaValidator:
+    """Tests pour le validateur de schémas gaming"""
+
+    @pytest.fixture
+    def numpy_employee_records(self):
+        """Records employés avec scalaires NumPy, comme après une extraction de DataFrame"""
+        return [
+            {'employee_id': np.int64(1), 'department': 'Programming',
+             'experience_level': 'Senior', 'salary_usd': np.int64(70000),
+             'is_remote': np.bool_(True)},
+            {'employee_id': np.int64(2), 'department': 'Audio',
+             'experience_level': 'Junior', 'salary_usd': np.float64(600000.0),
+             'is_remote': np.bool_(False)},
+        ]
+
+    def test_numpy_scalars_same_result_on_every_backend(self, backend_validator,
+                                                        numpy_employee_records):
+        """Les scalaires NumPy sont validés comme leurs équivalents Python, quel que soit le moteur"""
+        result = backend_validator.validate_data(numpy_employee_records, 'employee')
+
+        assert result['valid_records'] == 1
+        assert result['invalid_records'] == 1
+        assert len(result['errors']) == 1
+        error = result['errors'][0]
+        assert error['record_index'] == 1
+        assert error['error_path'] == ['salary_usd']
+        assert error['invalid_value'] == 600000.0
+
+    def test_dataframe_with_missing_values_same_result_on_every_backend(self, backend_validator):
+        """Un NaN dans une colonne optionnelle n'invalide pas le record, quel que soit le moteur"""
+        df = pd.DataFrame({
+            'employee_id': [1, 2],
+            'department': ['Programming', 'Art & Animation'],
+            'experience_level': ['Senior', 'Mid'],
+            'salary_usd': [85000.0, np.nan],
+        })
+
+        result = backend_validator.validate_dataframe(df, 'employee')
+
+        assert result['valid_records'] == 2
+        assert result['invalid_records'] == 0
+        assert result['errors'] == []
+
+    def test_numpy_single_record(self, backend_validator, numpy_employee_records):
+        """Un record unique avec scalaires NumPy valides est accepté"""
+        result = backend_validator.validate_data(numpy_employee_records[0], 'employee')
+
+        assert result['is_valid']
+        assert result['valid_records'] == 1
+
+    def test_compiled_validator_reused_across_calls(self):
+        """Le validateur jsonschema est construit une fois par schéma puis réutilisé"""
+        validator = GamingSchemaValidator()
+        record = {'employee_id': 1, 'department': 'Audio', 'experience_level': 'Mid'}
+
+        validator.validate_data(record, 'employee')
+        compiled = validator._compiled_validators['employee']
+        validator.validate_data([record, record], 'employee')
+
+        assert validator._compiled_validators['employee'] is compiled
+        assert isinstance(compiled, jsonschema.Draft7Validator)
+
+    def test_save_schema_evicts_compiled_validators(self, tmp_path):
+        """Sauvegarder un schéma invalide les validateurs compilés pour l'ancien schéma"""
+        validator = GamingSchemaValidator()
+        validator.schemas_directory = tmp_path
+        schema = {'type': 'object', 'properties': {'level': {'type': 'integer', 'maximum': 5}}}
+
+        assert validator.save_schema(schema, 'custom')
+        assert validator.validate_data({'level': 8}, 'custom')['invalid_records'] == 1
+
+        relaxed = {'type': 'object', 'properties': {'level': {'type': 'integer', 'maximum': 10}}}
+        assert validator.save_schema(relaxed, 'custom')
+
+        assert 'custom' not in validator._compiled_validators
+        assert validator.validate_data({'level': 8}, 'custom')['is_valid']
+
+    @pytest.mark.parametrize('schema_name, record, field', [
+        ('employee', {'employee_id': 1, 'department': 'Audio',
+                      'experience_level': 'Mid', 'hire_date': '2020-13-45'}, 'hire_date'),
+        ('studio', {'studio_name': 'Pixel Forge', 'country': 'France',
+                    'employees': 40, 'website': 'not a uri'}, 'website'),
+    ])
+    def test_invalid_format_rejected(self, backend_validator, schema_name, record, field):
+        """Les formats "date" et "uri" sont vérifiés de la même façon sur chaque moteur"""
+        result = backend_validator.validate_data([record], schema_name)
+
+        assert result['invalid_records'] == 1
+        assert result['errors'][0]['error_path'] == [field]
+
+    def test_valid_uri_accepted(self, backend_validator):
+        """Une URI absolue valide passe sur chaque moteur"""
+        records = [
+            {'studio_name': 'Pixel Forge', 'country': 'France', 'employees': 40,
+             'website': website}
+            for website in ('https://pixelforge.example/careers', 'mailto:jobs@pixelforge.example')
+        ]
+
+        result = backend_validator.validate_data(records, 'studio')
+
+        assert result['valid_records'] == 2
+
+    def test_jsonschema_reports_best_match(self, monkeypatch):
+        """Sans moteur optionnel, l'erreur rapportée est celle de jsonschema.validate (best_match)"""
+        monkeypatch.setattr(schema_module, 'jsonschema_rs', None)
+        monkeypatch.setattr(schema_module, 'fastjsonschema', None)
+        validator = GamingSchemaValidator()
+        record = {'employee_id': 1, 'department': 'Cooking',
+                  'experience_level': 'Guru', 'salary_usd': 10}
+
+        result = validator.validate_data([record], 'employee')
+
+        with pytest.raises(jsonschema.ValidationError) as expected:
+            jsonschema.validate(record, validator.gaming_schemas['employee'])
+        assert result['errors'][0]['error_message'] == expected.value.message
+        assert result['errors'][0]['error_path'] == list(expected.value.path)